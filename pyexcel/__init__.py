@@ -18,14 +18,21 @@ from .cookbook import (
 from .core import (
     get_array,
     iget_array,
+    iget_sheet,
+    iaggregate,
+    ijoin,
     get_dict,
     get_records,
     iget_records,
     get_book_dict,
     get_sheet,
     get_book,
+    get_book_from_files,
     save_as,
     isave_as,
+    isort_as,
+    isave_partitioned,
+    isave_many,
     save_book_as,
     isave_book_as)
 from .book import Book
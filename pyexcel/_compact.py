@@ -41,6 +41,7 @@ if PY2:
             """Iterator interface get next value"""
             return type(self).__next__(self)
     irange = xrange
+    integer_types = (int, long)
 else:
     from io import StringIO, BytesIO
     import urllib.request as request
@@ -48,6 +49,7 @@ else:
     Iterator = object
     irange = range
     czip = zip
+    integer_types = (int,)
 
 
 def is_tuple_consists_of_strings(an_array):
@@ -0,0 +1,184 @@
+"""
+    pyexcel.aio
+    ~~~~~~~~~~~
+
+    asyncio variants of the signature functions
+
+    The parsing and the rendering stay blocking and run in a thread
+    pool, so that the event loop keeps serving while a file is read or
+    written::
+
+        import pyexcel.aio as aio
+
+        async def upload(request):
+            sheet = await aio.get_sheet(file_type='csv',
+                                        file_content=await request.read())
+            async for record in aio.aiget_records(file_name='big.csv'):
+                await store(record)
+
+    It needs python 3.5 or above.
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pyexcel.core as core
+import pyexcel.constants as constants
+import pyexcel.internal.garbagecollector as gc
+from pyexcel.internal.generators import batched
+
+
+_EXECUTORS = []
+
+
+def get_executor():
+    """The thread pool shared by this module, of DEFAULT_AIO_WORKERS
+    threads, which bounds the blocking work in flight"""
+    if not _EXECUTORS:
+        _EXECUTORS.append(
+            ThreadPoolExecutor(max_workers=constants.DEFAULT_AIO_WORKERS))
+    return _EXECUTORS[0]
+
+
+def get_sheet(executor=None, **keywords):
+    """Awaitable :meth:`pyexcel.get_sheet`"""
+    return _run_in_executor(executor, core.get_sheet, **keywords)
+
+
+def get_book(executor=None, **keywords):
+    """Awaitable :meth:`pyexcel.get_book`"""
+    return _run_in_executor(executor, core.get_book, **keywords)
+
+
+def get_array(executor=None, **keywords):
+    """Awaitable :meth:`pyexcel.get_array`"""
+    return _run_in_executor(executor, core.get_array, **keywords)
+
+
+def get_records(executor=None, **keywords):
+    """Awaitable :meth:`pyexcel.get_records`"""
+    return _run_in_executor(executor, core.get_records, **keywords)
+
+
+def asave_as(executor=None, **keywords):
+    """Awaitable :meth:`pyexcel.save_as`"""
+    return _run_in_executor(executor, core.save_as, **keywords)
+
+
+def asave_book_as(executor=None, **keywords):
+    """Awaitable :meth:`pyexcel.save_book_as`"""
+    return _run_in_executor(executor, core.save_book_as, **keywords)
+
+
+def aiget_array(executor=None, batch_size=constants.DEFAULT_AIO_BATCH_SIZE,
+                **keywords):
+    """Asynchronous iterator of the rows of :meth:`pyexcel.iget_array`
+
+    The file is closed when the rows run out. Await its aclose() to
+    stop early.
+    """
+    return AsyncIterator(partial(core.iget_array, **keywords),
+                         executor=executor, batch_size=batch_size)
+
+
+def aiget_records(executor=None, batch_size=constants.DEFAULT_AIO_BATCH_SIZE,
+                  **keywords):
+    """Asynchronous iterator of the records of :meth:`pyexcel.iget_records`
+
+    The file is closed when the records run out. Await its aclose() to
+    stop early.
+    """
+    return AsyncIterator(partial(core.iget_records, **keywords),
+                         executor=executor, batch_size=batch_size)
+
+
+class AsyncIterator(object):
+    """Iterate a blocking iterable from a coroutine
+
+    The iterable is made and read in the executor, batch_size items at a
+    time. The next batch is read only when the last one has been used
+    up, so a slow consumer holds the reader back and no more than one
+    batch is kept in memory.
+
+    The file handles opened by the iterable are closed when it runs out,
+    fails or is closed by aclose(), leaving those of other iterators
+    open.
+    """
+    def __init__(self, make_iterable, executor=None,
+                 batch_size=constants.DEFAULT_AIO_BATCH_SIZE):
+        self._make_iterable = make_iterable
+        self._executor = executor
+        self._batch_size = batch_size
+        self._batches = None
+        self._buffer = deque()
+        self._exhausted = False
+        self._garbage = []
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        loop = asyncio.get_event_loop()
+        result = loop.create_future()
+        if self._buffer:
+            result.set_result(self._buffer.popleft())
+        elif self._exhausted:
+            result.set_exception(StopAsyncIteration())
+        else:
+            fetch = loop.run_in_executor(
+                self._executor or get_executor(), self._next_batch)
+            fetch.add_done_callback(partial(self._deliver, result))
+        return result
+
+    def aclose(self):
+        """Awaitable, which stops the iteration and closes its files"""
+        self._exhausted = True
+        self._buffer.clear()
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor or get_executor(),
+                                    self._release)
+
+    def _next_batch(self):
+        try:
+            if self._batches is None:
+                iterable, self._garbage = gc.call_and_own(
+                    self._make_iterable)
+                self._batches = batched(iterable, self._batch_size)
+            batch = next(self._batches, None)
+        except Exception:
+            self._release()
+            raise
+        if batch is None:
+            self._release()
+        return batch
+
+    def _release(self):
+        garbage, self._garbage = self._garbage, []
+        gc.free(garbage)
+
+    def _deliver(self, result, fetch):
+        if fetch.cancelled():
+            result.cancel()
+            return
+        error = fetch.exception()
+        if error is None and fetch.result() is None:
+            self._exhausted = True
+            error = StopAsyncIteration()
+        if error is None:
+            self._buffer.extend(fetch.result())
+        if result.cancelled():
+            return
+        if error is not None:
+            result.set_exception(error)
+        else:
+            result.set_result(self._buffer.popleft())
+
+
+def _run_in_executor(executor, function, **keywords):
+    loop = asyncio.get_event_loop()
+    return loop.run_in_executor(executor or get_executor(),
+                                partial(function, **keywords))
@@ -11,6 +11,7 @@ from pyexcel.sheet import Sheet
 import pyexcel._compact as compact
 from pyexcel.internal.meta import BookMeta
 from pyexcel.internal.common import SheetIterator
+from pyexcel.internal.generators import SheetStream
 
 LOCAL_UUID = 0
 
@@ -51,7 +52,9 @@ class Book(BookMeta):
         Load content from existing sheets
 
         :param dict sheets: a dictionary of sheets. Each sheet is
-                            a list of lists
+                            a list of lists, or a
+                            :class:`~pyexcel.internal.generators.SheetStream`
+                            which is read on first access
         """
         if sheets is None:
             return
@@ -65,6 +68,10 @@ class Book(BookMeta):
             if isinstance(value, Sheet):
                 sheet = value
                 sheet.name = name
+            elif isinstance(value, SheetStream):
+                # read when it is first asked for
+                self.__sheets.update({name: value})
+                continue
             else:
                 # array
                 sheet = Sheet(value, name)
@@ -93,7 +100,28 @@ class Book(BookMeta):
         """
         Get the sheet with the specified name
         """
-        return self.__sheets[name]
+        sheet = self.__sheets[name]
+        if isinstance(sheet, SheetStream):
+            sheet = Sheet(sheet.payload, name)
+            self.__sheets[name] = sheet
+            self.__dict__[name.replace(' ', '_')] = sheet
+        return sheet
+
+    def is_loaded(self, name):
+        """
+        Tell if the sheet has been read, which a lazy book does on
+        first access
+        """
+        return not isinstance(self.__sheets[name], SheetStream)
+
+    def __getattr__(self, attribute):
+        # the sheets of a lazy book become attributes once loaded
+        sheets = self.__dict__.get('_Book__sheets')
+        if sheets:
+            for name in sheets:
+                if name.replace(' ', '_') == attribute:
+                    return self.sheet_by_name(name)
+        raise AttributeError(attribute)
 
     def sheet_by_index(self, index):
         """
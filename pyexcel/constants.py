@@ -11,6 +11,7 @@
 DEFAULT_NA = ''
 DEFAULT_NAME = 'pyexcel sheet'
 DEFAULT_SHEET_NAME = 'pyexcel_sheet1'
+DEFAULT_MAP_CHUNK_SIZE = 10000
 
 MESSAGE_WARNING = "We do not overwrite files"
 MESSAGE_WRITE_ERROR = "Cannot write sheet"
@@ -33,6 +34,23 @@ MESSAGE_NOT_IMPLEMENTED_02 = "Confused! What do you want to put as column names"
 MESSAGE_READONLY = "This attribute is readonly"
 MESSAGE_ERROR_NO_HANDLER = "No suitable plugins imported or installed"
 MESSAGE_UNKNOWN_IO_OPERATION = "Internal error: an illegal source action"
+MESSAGE_UNKNOWN_LAYOUT = "Unknown layout '%s'. Please use 'row', 'columnar' or 'numpy'"
+MESSAGE_NUMPY_IS_REQUIRED = "Please install numpy to use layout 'numpy'"
+MESSAGE_DUPLICATE_INDEX_VALUE = "Value %r is not unique in column %r"
+MESSAGE_SORT_REVERSE_MISMATCH = "Please give one reverse flag per sort column"
+MESSAGE_UNKNOWN_REDUCER = "Unknown reducer %r. Please use sum, count, min, max, mean, first, last or a function"
+MESSAGE_UNKNOWN_JOIN = "Unknown join '%s'. Please use 'inner', 'left' or 'outer'"
+MESSAGE_UNKNOWN_RECORD_TYPE = "Unknown record type '%s'. Please use 'ordereddict', 'dict', 'namedtuple' or 'tuple'"
+MESSAGE_INVALID_BATCH_SIZE = "batch_size should be a positive integer, not %r"
+MESSAGE_INVALID_PROGRESS_INTERVAL = "progress_interval should be a positive integer, not %r"
+MESSAGE_NO_PARTITION = "Please give partition_by, max_rows or both"
+MESSAGE_NO_DESTINATION = "Please give one destination or more"
+MESSAGE_STREAM_HAS_NO_COLUMN_NAMES = "Columns are named by the first row only. Please use name_columns_by_row=0"
+MESSAGE_CHECKPOINT_FILE_TYPE = "A checkpoint needs a csv or tsv dest_file_name"
+MESSAGE_CHECKPOINT_MISMATCH = "The checkpoint %s does not match the file %s"
+MESSAGE_BOOK_HAS_NO_SHEET = "%s has no sheet"
+MESSAGE_UNKNOWN_EXECUTOR = "Unknown executor '%s'. Please use 'thread' or 'process'"
+MESSAGE_CHECKPOINT_SKIPS_ROWS = "A checkpoint cannot count the rows dropped by skip_empty_rows"
 MESSAGE_UPGRADE = "Please upgrade the plugin '%s' according to \
 plugin compactibility table."
 
@@ -81,7 +99,48 @@ VALID_SHEET_PARAMETERS = ['name_columns_by_row',
                           'colnames',
                           'rownames',
                           'transpose_before',
-                          'transpose_after']
+                          'transpose_after',
+                          'layout']
+
+# storage layouts of a sheet
+LAYOUT_ROW = 'row'
+LAYOUT_COLUMNAR = 'columnar'
+LAYOUT_NUMPY = 'numpy'
+
+JOIN_INNER = 'inner'
+JOIN_LEFT = 'left'
+JOIN_OUTER = 'outer'
+
+EXECUTOR_THREAD = 'thread'
+EXECUTOR_PROCESS = 'process'
+
+# rows sorted in memory at a time by SheetStream.sort and isort_as
+DEFAULT_SORT_RUN_SIZE = 100000
+
+# groups kept in memory by SheetStream.aggregate and iaggregate
+DEFAULT_AGGREGATE_MAX_GROUPS = 100000
+
+# files kept open at a time by isave_partitioned
+DEFAULT_MAX_OPEN_FILES = 64
+
+# rows a destination of isave_many may run ahead of the slowest one
+DEFAULT_TEE_BUFFER = 1000
+
+# rows between two progress reports of the streaming functions
+DEFAULT_PROGRESS_INTERVAL = 10000
+
+# rows between two checkpoints of isave_as
+DEFAULT_CHECKPOINT_INTERVAL = 100000
+
+# pyexcel.aio
+DEFAULT_AIO_WORKERS = 4
+DEFAULT_AIO_BATCH_SIZE = 500
+
+# record types of iget_records
+RECORD_ORDERED_DICT = 'ordereddict'
+RECORD_DICT = 'dict'
+RECORD_NAMEDTUPLE = 'namedtuple'
+RECORD_TUPLE = 'tuple'
 
 # for sources
 # targets
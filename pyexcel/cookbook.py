@@ -8,10 +8,14 @@
     :license: New BSD License, see LICENSE for more details
 """
 import os
-from pyexcel.book import Book
-from pyexcel.core import get_book, get_sheet, save_as
-from pyexcel._compact import OrderedDict
-from pyexcel.constants import MESSAGE_WARNING
+from pyexcel.book import local_uuid
+from pyexcel.core import get_book, get_sheet, save_as, iget_array
+import pyexcel.internal.core as sources
+import pyexcel.internal.garbagecollector as gc
+from pyexcel.internal.generators import BookStream, SheetStream
+from pyexcel.internal.parallel import read_files, BookQueue
+from pyexcel._compact import OrderedDict, irange
+from pyexcel.constants import MESSAGE_WARNING, DEFAULT_NA, EXECUTOR_THREAD
 
 
 DEFAULT_OUT_FILE = 'pyexcel_merged.csv'
@@ -68,17 +72,25 @@ def update_rows(infilename, row_dicts, outfilename=None):
 
 def merge_files(file_array, outfilename=DEFAULT_OUT_FILE):
     """merge many files horizontally column after column
+
+    The files are read twice, once to find the widest row of each and
+    once to write the merged rows, but never loaded into memory.
+
     :param str outfilename: save the sheet as
     """
     if os.path.exists(outfilename):
         raise NotImplementedError(MESSAGE_WARNING)
-    content = []
-    for file_name in file_array:
-        sheet = get_sheet(file_name=file_name)
-        content.extend(list(sheet.columns()))
-    merged_sheet = get_sheet(array=content)
-    merged_sheet.transpose()
-    merged_sheet.save_as(outfilename)
+    position = gc.mark()
+    try:
+        widths = [_widest_row(iget_array(file_name=file_name))
+                  for file_name in file_array]
+        gc.free_resources_since(position)
+        rows = _zip_rows([iget_array(file_name=file_name)
+                          for file_name in file_array], widths)
+        sources.save_sheet(SheetStream(outfilename, rows),
+                           file_name=outfilename)
+    finally:
+        gc.free_resources_since(position)
     return outfilename
 
 
@@ -121,31 +133,67 @@ def merge_two_readers(reader1, reader2, outfilename=DEFAULT_OUT_FILE):
     merge_readers(reader_array, outfilename)
 
 
-def merge_csv_to_a_book(filelist, outfilename=DEFAULT_OUT_XLS_FILE):
+def merge_csv_to_a_book(filelist, outfilename=DEFAULT_OUT_XLS_FILE,
+                        workers=None, executor=EXECUTOR_THREAD):
     """merge a list of csv files into a excel book
 
+    The files are read in a pool of workers, as
+    :meth:`pyexcel.get_book_from_files` does, a few files ahead of the
+    one being written.
+
     :param list filelist: a list of accessible file path
     :param str outfilename: save the sheet as
+    :param workers: the size of the pool, the cpu count if None
+    :param executor: 'thread' or 'process'
     """
-    merged = Book()
-    for file_name in filelist:
-        sheet = get_sheet(file_name=file_name)
-        _, tail = os.path.split(file_name)
-        sheet.name = tail
-        merged += sheet
-    merged.save_as(outfilename)
-
-
-def merge_all_to_a_book(filelist, outfilename=DEFAULT_OUT_XLS_FILE):
+    books = BookQueue(read_files(filelist, workers=workers,
+                                 executor=executor))
+    try:
+        sheets = OrderedDict()
+        for position, file_name in enumerate(filelist):
+            _, tail = os.path.split(file_name)
+            sheets[_new_sheet_name(tail, sheets)] = _taken_rows(
+                books, position)
+        sources.save_book(BookStream(sheets), file_name=outfilename)
+    finally:
+        books.close()
+
+
+def merge_all_to_a_book(filelist, outfilename=DEFAULT_OUT_XLS_FILE,
+                        workers=None, executor=EXECUTOR_THREAD):
     """merge a list of excel files into a excel book
 
+    The sheet names are looked up first, without reading the rows. The
+    rows are then read in a pool of workers, as
+    :meth:`pyexcel.get_book_from_files` does, a few files ahead of the
+    one being written. A file without sheets adds none.
+
     :param list filelist: a list of accessible file path
     :param str outfilename: save the sheet as
+    :param workers: the size of the pool, the cpu count if None
+    :param executor: 'thread' or 'process'
     """
-    merged = Book()
-    for file_name in filelist:
-        merged += get_book(file_name=file_name)
-    merged.save_as(outfilename)
+    sheets = OrderedDict()
+    books = BookQueue(read_files(filelist, workers=workers,
+                                 executor=executor))
+    try:
+        gc_position = gc.mark()
+        try:
+            for position, file_name in enumerate(filelist):
+                book = sources.get_book_stream(file_name=file_name,
+                                               on_demand=True)
+                names = list(book.sheets.keys())
+                for name in names:
+                    new_name = name
+                    if len(names) == 1:
+                        new_name = book.filename
+                    sheets[_new_sheet_name(new_name, sheets)] = (
+                        _taken_rows(books, position, name))
+        finally:
+            gc.free_resources_since(gc_position)
+        sources.save_book(BookStream(sheets), file_name=outfilename)
+    finally:
+        books.close()
 
 
 def split_a_book(file_name, outfilename=None):
@@ -179,3 +227,44 @@ def extract_a_sheet_from_a_book(file_name, sheetname, outfilename=None):
     sheet = book[sheetname]
     file_name = "%s_%s" % (sheetname, saveas)
     sheet.save_as(file_name)
+
+
+def _new_sheet_name(name, sheets):
+    if name in sheets:
+        name = "%s_%s" % (name, local_uuid())
+    return name
+
+
+def _taken_rows(books, position, name=None):
+    """The rows of a sheet of the book at a position, which are taken
+    only when the writer gets to them"""
+    for row in books.take(position, name):
+        yield row
+
+
+def _widest_row(rows):
+    width = 0
+    for row in rows:
+        width = max(width, len(row))
+    return width
+
+
+def _zip_rows(streams, widths):
+    """Join the rows of the streams side by side, each padded to its
+    width, until the longest stream ends"""
+    iterators = [iter(stream) for stream in streams]
+    while True:
+        merged = []
+        finished = 0
+        for index in irange(len(iterators)):
+            row = None
+            for row in iterators[index]:
+                break
+            if row is None:
+                finished += 1
+                row = []
+            merged.extend(row)
+            merged.extend([DEFAULT_NA] * (widths[index] - len(row)))
+        if finished == len(iterators):
+            return
+        yield merged
@@ -8,14 +8,22 @@
     :license: New BSD License
 """
 import re
+import glob
 
 import pyexcel_io.manager as manager
 
 from pyexcel.sheet import Sheet
 from pyexcel.book import Book, to_book
 import pyexcel.internal.core as sources
+from pyexcel.internal.records import make_record_builder
+from pyexcel.internal.generators import batched
+from pyexcel.internal.partition import save_partitioned
+from pyexcel.internal.tee import save_to_many
+from pyexcel.internal.progress import ProgressTracker
+from pyexcel.internal.checkpoint import ResumableFile
+from pyexcel.internal.parallel import read_files, name_sheets
 import pyexcel.constants as constants
-from pyexcel._compact import zip_longest, append_doc, OrderedDict
+from pyexcel._compact import append_doc, is_string, OrderedDict
 import pyexcel.docstrings as docs
 
 
@@ -39,17 +47,48 @@ def get_sheet(**keywords):
 
 
 @append_doc(docs.GET_BOOK)
-def get_book(**keywords):
+def get_book(lazy=False, **keywords):
     """
     Get an instance of :class:`Book` from an excel source
+
+    With lazy=True, each sheet is read when it is first used, e.g. by
+    book["Sheet3"], iteration or save_as, and the others are never read.
+    Like the functions that start with 'i', it leaves the file open until
+    :meth:`pyexcel.free_resources` is called, after which the sheets not
+    read yet cannot be.
     """
-    book_stream = sources.get_book_stream(**keywords)
-    book = Book(book_stream.to_dict(),
+    if lazy:
+        book_stream = sources.get_book_stream(on_demand=True, **keywords)
+        sheets = book_stream.sheets
+    else:
+        book_stream = sources.get_book_stream(**keywords)
+        sheets = book_stream.to_dict()
+    book = Book(sheets,
                 filename=book_stream.filename,
                 path=book_stream.path)
     return book
 
 
+@append_doc(docs.GET_BOOK_FROM_FILES)
+def get_book_from_files(file_names, workers=None,
+                        executor=constants.EXECUTOR_THREAD, **keywords):
+    """
+    Get an instance of :class:`Book` from many excel files read in parallel
+
+    file_names is a list of files, or a glob pattern whose matches are
+    taken in sorted order. The files are read in a pool of workers,
+    threads or, with executor='process', processes, by the cpu count if
+    workers is None. The other keywords are given to each read. The
+    sheets come in the order of the files. As with ``book += other``, a
+    file of one sheet gives a sheet named after the file.
+    """
+    if is_string(type(file_names)):
+        file_names = sorted(glob.glob(file_names))
+    books = read_files(file_names, workers=workers, executor=executor,
+                       **keywords)
+    return Book(OrderedDict(name_sheets(books)))
+
+
 @append_doc(docs.SAVE_AS)
 def save_as(**keywords):
     """
@@ -67,22 +106,155 @@ def save_as(**keywords):
 
 
 @append_doc(docs.ISAVE_AS)
-def isave_as(**keywords):
+def isave_as(progress=None,
+             progress_interval=constants.DEFAULT_PROGRESS_INTERVAL,
+             checkpoint=None,
+             checkpoint_interval=constants.DEFAULT_CHECKPOINT_INTERVAL,
+             **keywords):
     """
     Save a sheet from a data source to another one with less memory
 
     It is simliar to :meth:`pyexcel.save_as` except that it does
     not accept parameters for :class:`pyexcel.Sheet`. And it read
     when it writes.
+
+    progress, a function, is called with a
+    :class:`~pyexcel.internal.progress.Progress` every progress_interval
+    rows and once at the end.
+
+    checkpoint, a file path, makes a csv or tsv dest_file_name
+    resumable. The rows written and the size of the file are saved in
+    it every checkpoint_interval rows. If the job is run again, the file
+    is cut back to the last checkpoint and the source is read on from
+    the row after it, by start_row. The checkpoint is removed when the
+    file is complete.
     """
     dest_keywords, source_keywords = _split_keywords(**keywords)
     for field in constants.VALID_SHEET_PARAMETERS:
         if field in source_keywords:
             raise Exception(SAVE_AS_EXCEPTION)
+    resumable = None
+    if checkpoint is not None:
+        if source_keywords.get('skip_empty_rows'):
+            raise ValueError(constants.MESSAGE_CHECKPOINT_SKIPS_ROWS)
+        resumable = ResumableFile(
+            checkpoint, file_name=dest_keywords.pop('file_name', None),
+            file_type=dest_keywords.pop('file_type', None),
+            encoding=dest_keywords.pop('encoding', 'utf-8'),
+            interval=checkpoint_interval)
+        if resumable.rows > 0:
+            source_keywords['start_row'] = (
+                source_keywords.get('start_row', 0) + resumable.rows)
+            if source_keywords.get('row_limit', -1) > 0:
+                source_keywords['row_limit'] -= resumable.rows
     sheet = sources.get_sheet_stream(on_demand=True, **source_keywords)
+    if progress is not None:
+        tracker = ProgressTracker(progress, progress_interval,
+                                  **source_keywords)
+        sheet.payload = tracker.track(sheet.payload, sheet.name)
+    if resumable is None:
+        return sources.save_sheet(sheet, **dest_keywords)
+    with resumable.open() as handle:
+        sheet.payload = resumable.track(sheet.payload, handle)
+        result = sources.save_sheet(sheet, file_type=resumable.file_type,
+                                    file_stream=handle, **dest_keywords)
+    resumable.finish()
+    if result is handle:
+        # the handle stands in for dest_file_name, which gives nothing back
+        result = None
+    return result
+
+
+@append_doc(docs.ISORT_AS)
+def isort_as(by=None, reverse=False, key=None, name_columns_by_row=-1,
+             run_size=constants.DEFAULT_SORT_RUN_SIZE, temp_dir=None,
+             **keywords):
+    """
+    Sort a sheet from a data source into another one with bounded memory
+
+    It reads the rows as :meth:`pyexcel.iget_sheet` does and sorts them
+    as :meth:`~pyexcel.internal.generators.SheetStream.sort` does: runs
+    of run_size rows are sorted, spilled to temporary files in temp_dir
+    and merged while the result is written. The header row stays on top
+    if name_columns_by_row=0, which also allows `by` to name columns.
+    """
+    dest_keywords, source_keywords = _split_keywords(**keywords)
+    sheet = iget_sheet(name_columns_by_row=name_columns_by_row,
+                       **source_keywords)
+    sheet = sheet.sort(by=by, reverse=reverse, key=key,
+                       run_size=run_size, temp_dir=temp_dir)
     return sources.save_sheet(sheet, **dest_keywords)
 
 
+@append_doc(docs.IJOIN)
+def ijoin(lookup, on, how=constants.JOIN_INNER, name_columns_by_row=-1,
+          **keywords):
+    """
+    Join the rows of an excel source with the rows of a sheet
+
+    It returns a :class:`~pyexcel.internal.generators.SheetStream`, which
+    joins each row as it is read, so only the lookup sheet is held in
+    memory. Pass name_columns_by_row=0 to join on column names. The
+    result can be written out with :meth:`pyexcel.isave_as`.
+    """
+    sheet_stream = iget_sheet(name_columns_by_row=name_columns_by_row,
+                              **keywords)
+    return sheet_stream.join(lookup, on, how=how)
+
+
+@append_doc(docs.ISAVE_PARTITIONED)
+def isave_partitioned(partition_by=None, max_rows=None, dest_dir='.',
+                      dest_file_type='csv', name_columns_by_row=-1,
+                      max_open_files=constants.DEFAULT_MAX_OPEN_FILES,
+                      **keywords):
+    """
+    Split a sheet from a data source into many files in one pass
+
+    With partition_by, the rows go into hive style directories,
+    dest_dir/column=value/part-00000.csv, by the values of the given
+    column, or columns. With max_rows, each file takes at most max_rows
+    rows. Both can be given. The header row, when name_columns_by_row=0,
+    heads every file.
+
+    Up to max_open_files files are open at a time. When a partition
+    comes back after its file was closed, a csv or tsv file is appended
+    to, while a file of another type, which cannot be, is followed by the
+    next part file.
+
+    :returns: the names of the files written
+    """
+    dest_keywords, source_keywords = _split_keywords(**keywords)
+    sheet_stream = iget_sheet(name_columns_by_row=name_columns_by_row,
+                              **source_keywords)
+    return save_partitioned(sheet_stream, partition_by=partition_by,
+                            max_rows=max_rows, dest_dir=dest_dir,
+                            file_type=dest_file_type,
+                            max_open_files=max_open_files, **dest_keywords)
+
+
+@append_doc(docs.ISAVE_MANY)
+def isave_many(destinations=None, buffer_size=constants.DEFAULT_TEE_BUFFER,
+               **keywords):
+    """
+    Save a sheet from a data source to many destinations in one read
+
+    Each destination is a dictionary of the dest keywords of
+    :meth:`pyexcel.isave_as` without the 'dest_' prefix, e.g.
+    {"file_name": "a.xlsx"}, {"file_type": "csv"} or {"session": session,
+    "table": Table}. The rows are read once and written to all of them
+    together. No destination gets more than buffer_size rows ahead of
+    the slowest. The first destination is written in the calling thread
+    and the others in threads of their own, so a database session bound
+    to the calling thread should come first.
+
+    :returns: a list of what each destination gave back, e.g. the io of
+              {"file_type": "csv"}
+    """
+    sheet_stream = sources.get_sheet_stream(on_demand=True, **keywords)
+    return save_to_many(sheet_stream, destinations or [],
+                        buffer_size=buffer_size)
+
+
 @append_doc(docs.SAVE_BOOK_AS)
 def save_book_as(**keywords):
     """
@@ -95,16 +267,29 @@ def save_book_as(**keywords):
 
 
 @append_doc(docs.ISAVE_BOOK_AS)
-def isave_book_as(**keywords):
+def isave_book_as(progress=None,
+                  progress_interval=constants.DEFAULT_PROGRESS_INTERVAL,
+                  **keywords):
     """
     Save a book from a data source to another one
 
     It is simliar to :meth:`pyexcel.save_book_as` but it read
     when it writes. This function provide some speedup but
     the output data is not made uniform.
+
+    progress, a function, is called with a
+    :class:`~pyexcel.internal.progress.Progress` every progress_interval
+    rows, counted across the sheets, and once after the last sheet.
     """
     dest_keywords, source_keywords = _split_keywords(**keywords)
     book = sources.get_book_stream(on_demand=True, **source_keywords)
+    if progress is not None:
+        tracker = ProgressTracker(progress, progress_interval,
+                                  **source_keywords)
+        sheets = list(book.sheets.values())
+        for index, sheet in enumerate(sheets):
+            sheet.payload = tracker.track(
+                sheet.payload, sheet.name, last=index == len(sheets) - 1)
     return sources.save_book(book, **dest_keywords)
 
 
@@ -165,19 +350,73 @@ def get_records(name_columns_by_row=0, **keywords):
 
 
 @append_doc(docs.IGET_ARRAY)
-def iget_array(**keywords):
+def iget_array(batch_size=None, progress=None,
+               progress_interval=constants.DEFAULT_PROGRESS_INTERVAL,
+               **keywords):
     """
     Obtain a generator of an two dimensional array from an excel source
 
     It is similiar to :meth:`pyexcel.get_array` but it has less memory
     footprint.
+
+    With batch_size, it gives lists of batch_size rows instead of one
+    row at a time. row_renderer is still applied to each row.
+
+    progress, a function, is called with a
+    :class:`~pyexcel.internal.progress.Progress` every progress_interval
+    rows and once at the end.
     """
     sheet_stream = sources.get_sheet_stream(on_demand=True, **keywords)
-    return sheet_stream.payload
+    rows = sheet_stream.payload
+    if progress is not None:
+        tracker = ProgressTracker(progress, progress_interval, **keywords)
+        rows = tracker.track(rows, sheet_stream.name)
+    if batch_size is not None:
+        return batched(rows, batch_size)
+    return rows
+
+
+@append_doc(docs.IGET_SHEET)
+def iget_sheet(name_columns_by_row=-1, **keywords):
+    """
+    Obtain a :class:`~pyexcel.internal.generators.SheetStream` from an
+    excel source
+
+    Its select, filter, map and rename transform the rows lazily, one
+    at a time. Pass name_columns_by_row=0 to address the columns by the
+    names in the first row.
+    """
+    if name_columns_by_row not in (-1, 0):
+        raise ValueError(constants.MESSAGE_STREAM_HAS_NO_COLUMN_NAMES)
+    sheet_stream = sources.get_sheet_stream(on_demand=True, **keywords)
+    sheet_stream.named_columns = name_columns_by_row == 0
+    return sheet_stream
+
+
+@append_doc(docs.IAGGREGATE)
+def iaggregate(keys, aggregations,
+               max_groups=constants.DEFAULT_AGGREGATE_MAX_GROUPS,
+               temp_dir=None, **keywords):
+    """
+    Group the rows of an excel source and reduce each group
+
+    The first row should name the columns. It returns a
+    :class:`~pyexcel.internal.generators.SheetStream` of a header row and
+    one row per group, as :meth:`~pyexcel.Sheet.group_by` would. Only
+    max_groups groups are kept in memory. The rest are spilled to
+    temporary files in temp_dir and merged at the end.
+    """
+    sheet_stream = iget_sheet(name_columns_by_row=0, **keywords)
+    return sheet_stream.aggregate(keys, aggregations, max_groups=max_groups,
+                                  temp_dir=temp_dir)
 
 
 @append_doc(docs.IGET_RECORDS)
-def iget_records(custom_headers=None, **keywords):
+def iget_records(custom_headers=None,
+                 record_type=constants.RECORD_ORDERED_DICT,
+                 batch_size=None, progress=None,
+                 progress_interval=constants.DEFAULT_PROGRESS_INTERVAL,
+                 **keywords):
     """
     Obtain a generator of a list of records from an excel source
 
@@ -185,25 +424,36 @@ def iget_records(custom_headers=None, **keywords):
     footprint but requires the headers to be in the first row. And the
     data matrix should be of equal length. It should consume less memory
     and should work well with large files.
+
+    The mapping from the headers to the columns is worked out once from
+    the first row. record_type chooses what each record is: 'ordereddict',
+    the default, 'dict', 'namedtuple' or 'tuple' of the values in header
+    order. The last two are the cheapest to make.
+
+    With batch_size, it gives lists of batch_size records instead of one
+    record at a time. progress works as it does in
+    :meth:`~pyexcel.iget_array`, counting the header row as well.
     """
+    records = _iget_records(custom_headers, record_type, progress,
+                            progress_interval, **keywords)
+    if batch_size is not None:
+        return batched(records, batch_size)
+    return records
+
+
+def _iget_records(custom_headers, record_type, progress,
+                  progress_interval, **keywords):
     sheet_stream = sources.get_sheet_stream(on_demand=True, **keywords)
-    headers = None
-    for row_index, row in enumerate(sheet_stream.payload):
-        if row_index == 0:
-            headers = row
+    rows = sheet_stream.payload
+    if progress is not None:
+        tracker = ProgressTracker(progress, progress_interval, **keywords)
+        rows = tracker.track(rows, sheet_stream.name)
+    build = None
+    for row in rows:
+        if build is None:
+            build = make_record_builder(row, custom_headers, record_type)
         else:
-            if custom_headers:
-                # custom order
-                tmp_dict = dict(zip_longest(
-                    headers, row, fillvalue=constants.DEFAULT_NA))
-                ordered_dict = OrderedDict()
-                for name in custom_headers:
-                    ordered_dict[name] = tmp_dict[name]
-                yield ordered_dict
-            else:
-                # default order
-                yield OrderedDict(zip_longest(
-                    headers, row, fillvalue=constants.DEFAULT_NA))
+            yield build(row)
 
 
 @append_doc(docs.GET_BOOK_DICT)
@@ -12,14 +12,21 @@ from .core import (
     GET_BOOK,
     SAVE_AS,
     ISAVE_AS,
+    ISORT_AS,
+    ISAVE_PARTITIONED,
+    ISAVE_MANY,
     SAVE_BOOK_AS,
     ISAVE_BOOK_AS,
     GET_ARRAY,
     IGET_ARRAY,
+    IGET_SHEET,
+    IAGGREGATE,
+    IJOIN,
     GET_DICT,
     GET_RECORDS,
     IGET_RECORDS,
-    GET_BOOK_DICT
+    GET_BOOK_DICT,
+    GET_BOOK_FROM_FILES
 )  # flake8: noqa
 
 from .meta import SAVE_AS_OPTIONS
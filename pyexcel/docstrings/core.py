@@ -74,6 +74,12 @@ GET_ARRAY = __GET_SHEET__
 
 IGET_ARRAY = __GET_SHEET__ + I_NOTE
 
+IGET_SHEET = __GET_SHEET__ + I_NOTE
+
+IAGGREGATE = __GET_SHEET__ + I_NOTE
+
+IJOIN = __GET_SHEET__ + I_NOTE
+
 GET_DICT = __GET_SHEET__
 
 GET_RECORDS = __GET_SHEET__
@@ -84,10 +90,18 @@ SAVE_AS = __SAVE_AS__
 
 ISAVE_AS = __SAVE_AS__ + I_NOTE
 
+ISORT_AS = __SAVE_AS__ + I_NOTE
+
+ISAVE_PARTITIONED = __SAVE_AS__ + I_NOTE
+
+ISAVE_MANY = __GET_SHEET__ + I_NOTE
+
 GET_BOOK = __GET_BOOK__
 
 GET_BOOK_DICT = __GET_BOOK__
 
+GET_BOOK_FROM_FILES = __GET_BOOK__
+
 SAVE_BOOK_AS = __SAVE_BOOK_AS__
 
 ISAVE_BOOK_AS = __SAVE_BOOK_AS__ + I_NOTE
@@ -0,0 +1,142 @@
+"""
+    pyexcel.internal.checkpoint
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Save a stream of rows to a csv file which can resume after a crash
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import json
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+
+
+# the file types whose files can be cut and appended to
+APPENDABLE_FILE_TYPES = ('csv', 'tsv')
+
+
+class Checkpoint(object):
+    """The rows written to a file and the size of the file after them
+
+    It is kept in a small json file, which is replaced as a whole on
+    every save, so a crash leaves either the old or the new one.
+    """
+    def __init__(self, path, file_name):
+        self.path = path
+        self.file_name = file_name
+        self.rows = 0
+        self.bytes = 0
+
+    def load(self):
+        """Read the last save, if there is one"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as checkpoint_file:
+            saved = json.load(checkpoint_file)
+        if saved.get('file_name') != os.path.abspath(self.file_name):
+            raise ValueError(constants.MESSAGE_CHECKPOINT_MISMATCH % (
+                self.path, self.file_name))
+        self.rows = saved['rows']
+        self.bytes = saved['bytes']
+
+    def save(self, rows, size):
+        """Record that rows rows make up the first size bytes"""
+        self.rows = rows
+        self.bytes = size
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as checkpoint_file:
+            json.dump(dict(file_name=os.path.abspath(self.file_name),
+                           rows=rows, bytes=size), checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        _replace(temp_path, self.path)
+
+    def remove(self):
+        """Forget the checkpoint once the file is complete"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ResumableFile(object):
+    """A csv or tsv destination that picks up where its checkpoint says
+
+    The file is cut back to the size of the last checkpoint, which drops
+    any rows written after it, and is appended to from there on. Pass
+    :attr:`rows` as start_row to the source to skip what is on disk.
+    """
+    def __init__(self, checkpoint, file_name=None, file_type=None,
+                 encoding='utf-8',
+                 interval=constants.DEFAULT_CHECKPOINT_INTERVAL):
+        if file_name is None or not compact.is_string(type(file_name)):
+            raise ValueError(constants.MESSAGE_CHECKPOINT_FILE_TYPE)
+        if file_type is None:
+            file_type = file_name.split('.')[-1].lower()
+        if file_type not in APPENDABLE_FILE_TYPES:
+            raise ValueError(constants.MESSAGE_CHECKPOINT_FILE_TYPE)
+        self.file_name = file_name
+        self.file_type = file_type
+        self.interval = interval
+        self._encoding = encoding
+        self._checkpoint = Checkpoint(checkpoint, file_name)
+        self._checkpoint.load()
+        if self._checkpoint.rows > 0 and (
+                not os.path.exists(file_name) or
+                os.path.getsize(file_name) < self._checkpoint.bytes):
+            raise ValueError(constants.MESSAGE_CHECKPOINT_MISMATCH % (
+                checkpoint, file_name))
+
+    @property
+    def rows(self):
+        """The source rows already in the file"""
+        return self._checkpoint.rows
+
+    def open(self):
+        """Cut the file back to the checkpoint and open it to append"""
+        if self._checkpoint.rows > 0:
+            with open(self.file_name, 'r+b') as existing:
+                existing.truncate(self._checkpoint.bytes)
+            mode = 'a'
+        else:
+            mode = 'w'
+        return open_text_file(self.file_name, mode, self._encoding)
+
+    def track(self, rows, handle):
+        """Pass the rows through and save a checkpoint every interval
+
+        A checkpoint is saved when the row after the interval is asked
+        for, by which time the writer has put the rows before it into
+        the handle.
+        """
+        count = self._checkpoint.rows
+        next_save = count + self.interval
+        for row in rows:
+            if count == next_save:
+                handle.flush()
+                self._checkpoint.save(count, os.fstat(handle.fileno()).st_size)
+                next_save += self.interval
+            count += 1
+            yield row
+
+    def finish(self):
+        """The file is complete, so no resume is needed"""
+        self._checkpoint.remove()
+
+
+def open_text_file(file_name, mode, encoding='utf-8'):
+    """Open a file for a csv writer to write, or append, to"""
+    if compact.PY2:
+        return open(file_name, mode + 'b')
+    return open(file_name, mode, newline='', encoding=encoding)
+
+
+def _replace(source, destination):
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+    else:
+        # python 2 has no os.replace, which rename is on posix
+        if os.name == 'nt' and os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
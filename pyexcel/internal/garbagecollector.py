@@ -7,11 +7,15 @@
     :copyright: (c) 2015-2017 by Onni Software Ltd.
     :license: New BSD License
 """
+import threading
+
 from pyexcel._compact import append_doc
 import pyexcel.docstrings as docs
 
 
 GARBAGE = []
+_LOCK = threading.Lock()
+_OWNED = threading.local()
 
 
 def append(item):
@@ -19,7 +23,37 @@ def append(item):
     add garbage to the global list of garbages
     """
     global GARBAGE
-    GARBAGE.append(item)
+    with _LOCK:
+        GARBAGE.append(item)
+    owned = getattr(_OWNED, 'items', None)
+    if owned is not None:
+        owned.append(item)
+
+
+def call_and_own(function):
+    """
+    Call function and tell which garbages it added in this thread
+
+    :returns: the result of function and the list of its garbages, for
+              :meth:`free` to close them without touching the others
+    """
+    _OWNED.items = []
+    try:
+        return function(), _OWNED.items
+    finally:
+        _OWNED.items = None
+
+
+def free(items):
+    """
+    Close the given garbages only and forget them
+    """
+    global GARBAGE
+    with _LOCK:
+        GARBAGE = [garbage for garbage in GARBAGE
+                   if not any(garbage is item for item in items)]
+    for item in items:
+        item.close()
 
 
 @append_doc(docs.FREE_RESOURCES)
@@ -33,6 +67,23 @@ def free_resources():
     reset()
 
 
+def mark():
+    """
+    Tell how many garbages there are, for :meth:`free_resources_since`
+    """
+    return len(GARBAGE)
+
+
+def free_resources_since(position):
+    """
+    Close the file handles added after mark() gave the position
+    """
+    global GARBAGE
+    for item in GARBAGE[position:]:
+        item.close()
+    GARBAGE = GARBAGE[:position]
+
+
 def reset():
     """
     After everything has been closed, reset the array
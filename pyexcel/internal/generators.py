@@ -7,6 +7,11 @@
     :copyright: (c) 2015-2017 by Onni Software Ltd.
     :license: New BSD License
 """
+from functools import partial
+from itertools import chain, islice
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
 from pyexcel._compact import OrderedDict
 from pyexcel.internal.common import SheetIterator
 
@@ -25,11 +30,134 @@ class SheetStream(object):
     pass a row formatting/rendering function to the parameter
     "renderer" of pyexcel's signature functions.
 
+    select, filter, map and rename chain into one generator, which
+    reads a row, transforms it and hands it over before reading the
+    next one::
+
+        >>> import pyexcel as pe
+        >>> stream = pe.iget_sheet(
+        ...     array=[["id", "price"], [1, "2.5"], [2, ""], [3, "4"]],
+        ...     name_columns_by_row=0)
+        >>> cleaned = (stream.select(["price", "id"])
+        ...            .filter(lambda row: row[0] != "")
+        ...            .map({"price": float})
+        ...            .rename({"price": "cost"}))
+        >>> list(cleaned)
+        [['cost', 'id'], [2.5, 1], [4.0, 3]]
+
+    A stream is read only once. Pass it to :meth:`pyexcel.isave_as` as
+    `array`, or to :meth:`pyexcel.isave_book_as` inside `bookdict`, to
+    write it out.
     """
-    def __init__(self, name, payload):
+    def __init__(self, name, payload, named_columns=False):
         self.name = name
         self.payload = payload
         self.colnames = []
+        self.named_columns = named_columns
+
+    def __iter__(self):
+        return iter(self.payload)
+
+    def __aiter__(self):
+        from pyexcel.aio import AsyncIterator
+        return AsyncIterator(partial(iter, self.payload))
+
+    def batches(self, batch_size):
+        """Iterate the rows in lists of batch_size rows
+
+        The last list may be shorter
+        """
+        return batched(self.payload, batch_size)
+
+    def select(self, columns):
+        """Keep the given columns only, in the given order
+
+        :param list columns: column names, when the first row names the
+                             columns, or column indices
+        """
+        return self._chain(partial(_select_rows, columns))
+
+    def filter(self, predicate):
+        """Keep the data rows for which predicate(row) is true
+
+        The header row, if any, always stays
+        """
+        return self._chain(partial(_filter_rows, predicate))
+
+    def map(self, custom_function):
+        """Apply a function to every data cell
+
+        :param custom_function: a function, or a dictionary of column
+                                name, or index, to function
+        """
+        return self._chain(partial(_map_rows, custom_function))
+
+    def rename(self, names):
+        """Rename columns
+
+        :param dict names: old column name to new column name
+        """
+        if not self.named_columns:
+            raise ValueError(constants.MESSAGE_STREAM_HAS_NO_COLUMN_NAMES)
+        return self._chain(partial(_rename_rows, names))
+
+    def sort(self, by=None, reverse=False, key=None,
+             run_size=constants.DEFAULT_SORT_RUN_SIZE, temp_dir=None):
+        """Sort the data rows by one or more columns
+
+        The rows are ordered as :meth:`pyexcel.Sheet.sort` orders them.
+        No more than run_size rows are held in memory. Longer streams are
+        sorted in runs, which are spilled to temporary files in temp_dir
+        and merged.
+
+        :param by: column names, or indices, or one of them. All columns
+                   of the first row are used by default
+        :param reverse: True to sort in descending order. A list gives
+                        the direction of each column in `by`
+        :param key: a function applied to each cell of the `by` columns
+                    before comparison
+        """
+        return self._chain(partial(_sort_rows, by, reverse, key,
+                                   run_size, temp_dir))
+
+    def aggregate(self, keys, aggregations,
+                  max_groups=constants.DEFAULT_AGGREGATE_MAX_GROUPS,
+                  temp_dir=None):
+        """Group the data rows by the key columns and reduce each group
+
+        It gives the same rows, in the same order, as
+        sheet.group_by(keys).aggregate(aggregations) but keeps no more
+        than max_groups groups in memory. Beyond that, the partial
+        results are spilled to temporary files in temp_dir and merged at
+        the end.
+
+        :param keys: column names, or indices, or one of them
+        :param dict aggregations: column name, or index, to a reducer,
+                                  or a list of them, as for
+                                  :meth:`pyexcel.Sheet.group_by`
+        """
+        return self._chain(partial(_aggregate_rows, keys, aggregations,
+                                   max_groups, temp_dir))
+
+    def join(self, lookup, on, how=constants.JOIN_INNER):
+        """Join the data rows with the rows of a sheet on key columns
+
+        The sheet is hashed once and each row is joined as it passes,
+        as :meth:`pyexcel.Sheet.join` would join them. Only the sheet is
+        kept in memory.
+
+        :param lookup: a :class:`pyexcel.Sheet`, named by columns if the
+                       key columns are named
+        :param on: a column name, or index, found in both, or a list of
+                   them
+        :param how: 'inner', 'left' or 'outer'
+        """
+        return self._chain(partial(_join_rows, lookup, on, how))
+
+    def _chain(self, transform):
+        payload = transform(iter(self.payload), self.named_columns)
+        return SheetStream(self.name, payload,
+                           named_columns=self.named_columns)
 
     def to_array(self):
         """
@@ -114,3 +242,152 @@ class BookStream(object):
         if index < len(self.name_array):
             sheet_name = self.name_array[index]
             return self.sheets[sheet_name]
+
+
+def batched(iterable, batch_size):
+    """Group the items of an iterable into lists of batch_size items"""
+    if not isinstance(batch_size, compact.integer_types) or batch_size < 1:
+        raise ValueError(constants.MESSAGE_INVALID_BATCH_SIZE % batch_size)
+    return _batches(iter(iterable), batch_size)
+
+
+def _batches(iterator, batch_size):
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _select_rows(columns, rows, named_columns):
+    indices = None
+    for row in rows:
+        if indices is None:
+            header = row if named_columns else None
+            indices = [_column_position(column, header)
+                       for column in columns]
+        length = len(row)
+        yield [row[index] if index < length else constants.DEFAULT_NA
+               for index in indices]
+
+
+def _filter_rows(predicate, rows, named_columns):
+    for index, row in enumerate(rows):
+        if (index == 0 and named_columns) or predicate(row):
+            yield row
+
+
+def _map_rows(custom_function, rows, named_columns):
+    header = None
+    functions = None
+    for index, row in enumerate(rows):
+        if index == 0 and named_columns:
+            header = row
+            yield row
+            continue
+        if not isinstance(custom_function, dict):
+            yield [custom_function(value) for value in row]
+            continue
+        if functions is None:
+            functions = [(_column_position(column, header), function)
+                         for column, function in custom_function.items()]
+        row = list(row)
+        length = len(row)
+        for position, function in functions:
+            if position < length:
+                row[position] = function(row[position])
+        yield row
+
+
+def _sort_rows(by, reverse, key, run_size, temp_dir, rows, named_columns):
+    from pyexcel.internal.sorting import external_sort
+    header = None
+    first_row = None
+    for row in rows:
+        first_row = row
+        break
+    if first_row is None:
+        return
+    if named_columns:
+        header = first_row
+        yield header
+    else:
+        rows = chain([first_row], rows)
+    if by is None:
+        by = list(range(len(first_row)))
+    elif not isinstance(by, (list, tuple)):
+        by = [by]
+    indices = [_column_position(column, header) for column in by]
+    for row in external_sort(rows, indices, reverse=reverse, key=key,
+                             run_size=run_size, temp_dir=temp_dir):
+        yield row
+
+
+def _aggregate_rows(keys, aggregations, max_groups, temp_dir,
+                    rows, named_columns):
+    from pyexcel.internal.sheets.aggregation import (
+        aggregate_rows, make_aggregations)
+    if not isinstance(keys, (list, tuple)):
+        keys = [keys]
+    header = None
+    if named_columns:
+        for header in rows:
+            break
+        if header is None:
+            return
+
+    def column_name(column):
+        if header is not None and isinstance(column, compact.integer_types):
+            return header[column]
+        return column
+
+    specs = [(_column_position(column, header), name, reducer)
+             for column, name, reducer
+             in make_aggregations(aggregations, column_name)]
+    if header is not None:
+        yield ([column_name(key) for key in keys] +
+               [name for _, name, _ in specs])
+    key_indices = [_column_position(key, header) for key in keys]
+    for row in aggregate_rows(rows, key_indices, specs,
+                              max_groups=max_groups, temp_dir=temp_dir):
+        yield row
+
+
+def _join_rows(lookup, on, how, rows, named_columns):
+    from pyexcel.internal.sheets.join import join_stream
+    from pyexcel.sheet import make_names_unique
+    if not isinstance(on, (list, tuple)):
+        on = [on]
+    header = None
+    if named_columns:
+        for header in rows:
+            break
+        if header is None:
+            return
+        if len(lookup.colnames) > 0:
+            excluded = set(lookup._column_index(column) for column in on)
+            yield make_names_unique(list(header) + [
+                name for index, name in enumerate(lookup.colnames)
+                if index not in excluded])
+        else:
+            yield header
+    key_indices = [_column_position(column, header) for column in on]
+    width = len(header) if header is not None else 0
+    for row in join_stream(rows, key_indices, lookup, on, how=how,
+                           width=width):
+        yield row
+
+
+def _rename_rows(names, rows, named_columns):
+    for index, row in enumerate(rows):
+        if index == 0:
+            row = [names.get(name, name) for name in row]
+        yield row
+
+
+def _column_position(column, header):
+    if compact.is_string(type(column)):
+        if header is None:
+            raise ValueError(constants.MESSAGE_STREAM_HAS_NO_COLUMN_NAMES)
+        return header.index(column)
+    return column
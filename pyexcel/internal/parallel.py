@@ -0,0 +1,121 @@
+"""
+    pyexcel.internal.parallel
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Read many files in a pool of workers
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import multiprocessing
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+import pyexcel.constants as constants
+import pyexcel.internal.core as sources
+from pyexcel.book import local_uuid
+
+
+POOLS = {
+    constants.EXECUTOR_THREAD: ThreadPool,
+    constants.EXECUTOR_PROCESS: multiprocessing.Pool
+}
+
+
+def read_files(file_names, workers=None,
+               executor=constants.EXECUTOR_THREAD, **keywords):
+    """Read the books of the files in a pool of workers
+
+    The files are given out in their order whichever worker finishes
+    first. No more than two files per worker are read ahead of the one
+    being used, so a slow consumer does not fill the memory.
+
+    :param workers: the size of the pool, the cpu count if None. With
+                    one worker, the files are read in the calling thread
+    :param executor: 'thread' or 'process'
+    :returns: a generator of (file name, {sheet name: array})
+    """
+    if executor not in POOLS:
+        raise ValueError(constants.MESSAGE_UNKNOWN_EXECUTOR % executor)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if workers <= 1:
+        for file_name in file_names:
+            yield read_file(file_name, keywords)
+        return
+    pool = POOLS[executor](workers)
+    try:
+        pending = deque()
+        for file_name in file_names:
+            pending.append(pool.apply_async(read_file,
+                                            (file_name, keywords)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def read_file(file_name, keywords):
+    """Read all sheets of a file, in a worker"""
+    book = sources.get_book_stream(file_name=file_name, **keywords)
+    return book.filename, book.to_dict()
+
+
+class BookQueue(object):
+    """The books of :func:`read_files` by their place in the file list
+
+    A book is kept from when it is read until all of its sheets have
+    been taken, so a writer which takes them in order holds only the
+    books that the workers have read ahead.
+    """
+    def __init__(self, books):
+        self._books = books
+        self._read = 0
+        self._waiting = {}
+
+    def take(self, position, name=None):
+        """Take the rows of a sheet of the book at a position
+
+        :param name: the sheet name, or None for the first sheet
+        :raises ValueError: if the book has no sheet
+        """
+        while position >= self._read:
+            self._waiting[self._read] = next(self._books)
+            self._read += 1
+        file_name, sheets = self._waiting[position]
+        if not sheets:
+            raise ValueError(constants.MESSAGE_BOOK_HAS_NO_SHEET % file_name)
+        if name is None:
+            name = next(iter(sheets))
+        rows = sheets.pop(name)
+        if not sheets:
+            del self._waiting[position]
+        return rows
+
+    def close(self):
+        """Stop the workers"""
+        self._books.close()
+
+
+def name_sheets(books):
+    """Name the sheets of many books for one book
+
+    As :meth:`pyexcel.Book.__iadd__` does, the sheet of a book of one
+    sheet takes the name of its file, and a name in use gets a suffix.
+
+    :param books: an iterable of (file name, {sheet name: array})
+    :returns: a generator of (new sheet name, array)
+    """
+    names = set()
+    for file_name, sheets in books:
+        for name, array in sheets.items():
+            new_name = name
+            if len(sheets) == 1:
+                new_name = file_name
+            if new_name in names:
+                new_name = "%s_%s" % (new_name, local_uuid())
+            names.add(new_name)
+            yield new_name, array
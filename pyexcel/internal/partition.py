@@ -0,0 +1,173 @@
+"""
+    pyexcel.internal.partition
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Write the rows of a stream into many files
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+
+from pyexcel_io.io import get_writer
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+from pyexcel.internal.checkpoint import APPENDABLE_FILE_TYPES, open_text_file
+
+
+# the directory name hive gives to empty partition values
+HIVE_DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+# characters escaped in the directory names, as hive does
+UNSAFE_CHARACTERS = '"#%\'*/:=?\\\x7f{[]^<>|'
+PART_FILE_NAME = 'part-%05d.%s'
+
+
+def save_partitioned(sheet_stream, partition_by=None, max_rows=None,
+                     dest_dir='.', file_type='csv',
+                     max_open_files=constants.DEFAULT_MAX_OPEN_FILES,
+                     **keywords):
+    """Write the rows of a sheet stream into many files in one pass
+
+    :param partition_by: a column name, or index, or a list of them
+    :param max_rows: the most rows in one file
+    :returns: the names of the files written
+    """
+    if partition_by is None and max_rows is None:
+        raise ValueError(constants.MESSAGE_NO_PARTITION)
+    if partition_by is None:
+        partition_by = []
+    elif not isinstance(partition_by, (list, tuple)):
+        partition_by = [partition_by]
+    rows = iter(sheet_stream)
+    header = None
+    if sheet_stream.named_columns:
+        for header in rows:
+            break
+    indices = []
+    for column in partition_by:
+        if isinstance(column, compact.integer_types):
+            indices.append(column)
+        elif header is None:
+            raise ValueError(constants.MESSAGE_STREAM_HAS_NO_COLUMN_NAMES)
+        else:
+            indices.append(header.index(column))
+    names = [header[index] if header is not None else index
+             for index in indices]
+    writer = PartitionedWriter(dest_dir, file_type, header=header,
+                               max_rows=max_rows,
+                               max_open_files=max_open_files, **keywords)
+    try:
+        for row in rows:
+            partition = tuple([
+                (name, row[index] if index < len(row)
+                 else constants.DEFAULT_NA)
+                for name, index in compact.czip(names, indices)])
+            writer.write_row(partition, row)
+    finally:
+        writer.close()
+    return writer.file_names
+
+
+class PartitionedWriter(object):
+    """Route rows to one file per partition
+
+    No more than max_open_files files are open at a time. The least
+    recently written one is closed to make room. A partition that comes
+    back after its file was closed appends to it if it is a csv or tsv
+    file, or goes on in a new part file otherwise. A partition whose
+    file has max_rows rows goes on in a new part file.
+    """
+    def __init__(self, dest_dir, file_type, header=None, max_rows=None,
+                 max_open_files=constants.DEFAULT_MAX_OPEN_FILES,
+                 **keywords):
+        self.dest_dir = dest_dir
+        self.file_type = file_type
+        self.header = header
+        self.max_rows = max_rows
+        self.max_open_files = max_open_files
+        self.file_names = []
+        self._keywords = keywords
+        self._open = compact.OrderedDict()
+        self._part_numbers = {}
+        # the last part file of each partition, open or closed, and the
+        # rows in it
+        self._parts = {}
+        self._rows = {}
+
+    def write_row(self, partition, row):
+        """Write a row into the file of a partition
+
+        :param partition: a tuple of (column name, value) pairs, which
+                          may be empty
+        """
+        entry = self._open.pop(partition, None)
+        if entry is not None and self._rows[partition] == self.max_rows:
+            self._close(entry)
+            entry = None
+        if entry is None:
+            while len(self._open) >= self.max_open_files:
+                self._close(self._open.popitem(last=False)[1])
+            entry = self._open_part(partition)
+        # the last one written is the last to close
+        self._open[partition] = entry
+        entry[1].write_row(row)
+        self._rows[partition] += 1
+
+    def close(self):
+        """Close every open file"""
+        while self._open:
+            self._close(self._open.popitem(last=False)[1])
+
+    def _open_part(self, partition):
+        file_name = self._parts.get(partition)
+        if (file_name is not None and
+                self._rows[partition] != self.max_rows and
+                self.file_type in APPENDABLE_FILE_TYPES):
+            return self._open_writer(file_name, 'a')
+        directory = os.path.join(self.dest_dir, *[
+            "%s=%s" % (_escape(name), _escape(value))
+            for name, value in partition])
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        part_number = self._part_numbers.get(partition, 0)
+        self._part_numbers[partition] = part_number + 1
+        file_name = os.path.join(
+            directory, PART_FILE_NAME % (part_number, self.file_type))
+        self.file_names.append(file_name)
+        self._parts[partition] = file_name
+        self._rows[partition] = 0
+        entry = self._open_writer(file_name, 'w')
+        if self.header is not None:
+            entry[1].write_row(self.header)
+        return entry
+
+    def _open_writer(self, file_name, mode):
+        handle = None
+        if self.file_type in APPENDABLE_FILE_TYPES:
+            handle = open_text_file(file_name, mode,
+                                    self._keywords.get('encoding', 'utf-8'))
+            book = get_writer(file_stream=handle, file_type=self.file_type,
+                              single_sheet_in_book=True, **self._keywords)
+        else:
+            book = get_writer(file_name=file_name, **self._keywords)
+        sheet = book.create_sheet(constants.DEFAULT_SHEET_NAME)
+        return [book, sheet, handle]
+
+    def _close(self, entry):
+        book, sheet, handle = entry
+        sheet.close()
+        book.close()
+        if handle is not None:
+            handle.close()
+
+
+def _escape(value):
+    if value is None or value == constants.DEFAULT_NA:
+        return HIVE_DEFAULT_PARTITION
+    if not compact.is_string(type(value)):
+        value = str(value)
+    return ''.join(['%%%02X' % ord(character)
+                    if character in UNSAFE_CHARACTERS or
+                    ord(character) < 32 else character
+                    for character in value])
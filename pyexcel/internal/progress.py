@@ -0,0 +1,120 @@
+"""
+    pyexcel.internal.progress
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Report the progress of the streaming signature functions
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import os
+import time
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+
+
+class Progress(object):
+    """What a progress callback is given
+
+    :ivar rows: the rows read so far, headers included
+    :ivar elapsed: the seconds since the first row was asked for
+    :ivar bytes_read: the position in the source stream, if the source
+                      is a file_stream which can tell, otherwise None
+    :ivar total_bytes: the size of the source file or content if known,
+                       otherwise None
+    :ivar sheet_name: the sheet being read
+    :ivar finished: True in the last report, when all rows are read
+    """
+    def __init__(self, rows, elapsed, bytes_read=None, total_bytes=None,
+                 sheet_name=None, finished=False):
+        self.rows = rows
+        self.elapsed = elapsed
+        self.bytes_read = bytes_read
+        self.total_bytes = total_bytes
+        self.sheet_name = sheet_name
+        self.finished = finished
+
+    @property
+    def rows_per_second(self):
+        """The average throughput so far"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.rows / self.elapsed
+
+    def __repr__(self):
+        return "<Progress %d rows in %.1fs, %.0f rows/s>" % (
+            self.rows, self.elapsed, self.rows_per_second)
+
+
+class ProgressTracker(object):
+    """Count the rows that pass and report every interval rows
+
+    One tracker can follow the sheets of a book one after another, in
+    which case the count goes on across them. A report which would fall
+    on the last row is left to the finished one.
+    """
+    def __init__(self, callback,
+                 interval=constants.DEFAULT_PROGRESS_INTERVAL, **source):
+        if not isinstance(interval, compact.integer_types) or interval < 1:
+            raise ValueError(
+                constants.MESSAGE_INVALID_PROGRESS_INTERVAL % interval)
+        self.callback = callback
+        self.interval = interval
+        self.rows = 0
+        self._next_report = interval
+        self._started = None
+        self._stream, self._total_bytes = _byte_sources(source)
+
+    def track(self, rows, sheet_name=None, last=True):
+        """Wrap an iterable of rows
+
+        :param last: whether to make the finished report at the end
+        """
+        if self._started is None:
+            self._started = time.time()
+        count = self.rows
+        next_report = self._next_report
+        for row in rows:
+            # held back until another row comes, so that the last row
+            # is not reported twice
+            if count == next_report:
+                self.rows = count
+                self._report(sheet_name, False)
+                next_report += self.interval
+            count += 1
+            yield row
+        self.rows = count
+        if last:
+            self._report(sheet_name, True)
+        elif count == next_report:
+            self._report(sheet_name, False)
+            next_report += self.interval
+        self._next_report = next_report
+
+    def _report(self, sheet_name, finished):
+        bytes_read = None
+        if self._stream is not None:
+            try:
+                bytes_read = self._stream.tell()
+            except (IOError, OSError, ValueError):
+                self._stream = None
+        self.callback(Progress(self.rows, time.time() - self._started,
+                               bytes_read=bytes_read,
+                               total_bytes=self._total_bytes,
+                               sheet_name=sheet_name,
+                               finished=finished))
+
+
+def _byte_sources(source):
+    stream = source.get('file_stream')
+    if stream is not None and not hasattr(stream, 'tell'):
+        stream = None
+    total_bytes = None
+    file_name = source.get('file_name')
+    file_content = source.get('file_content')
+    if compact.is_string(type(file_name)) and os.path.isfile(file_name):
+        total_bytes = os.path.getsize(file_name)
+    elif file_content is not None and hasattr(file_content, '__len__'):
+        total_bytes = len(file_content)
+    return stream, total_bytes
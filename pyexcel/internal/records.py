@@ -0,0 +1,91 @@
+"""
+    pyexcel.internal.records
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Turn the rows of a sheet into records
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+from collections import namedtuple
+from operator import itemgetter
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+
+
+RECORD_TYPES = (constants.RECORD_ORDERED_DICT, constants.RECORD_DICT,
+                constants.RECORD_NAMEDTUPLE, constants.RECORD_TUPLE)
+
+
+def make_record_builder(headers, custom_headers=None,
+                        record_type=constants.RECORD_ORDERED_DICT):
+    """Work out, once, how to turn a row into a record
+
+    :param headers: the header row
+    :param custom_headers: the headers to keep, in their order
+    :param record_type: 'ordereddict', 'dict', 'namedtuple' or 'tuple'
+    :returns: a function of a row which returns a record
+    """
+    if record_type not in RECORD_TYPES:
+        raise ValueError(constants.MESSAGE_UNKNOWN_RECORD_TYPE % record_type)
+    headers = list(headers)
+    if custom_headers:
+        # a later column of the same name wins, as in dict(zip(...))
+        header_positions = dict(
+            (name, position) for position, name in enumerate(headers))
+        names = list(custom_headers)
+        positions = [header_positions[name] for name in names]
+    else:
+        names = headers
+        positions = list(range(len(headers)))
+    values_of = _make_values_getter(positions)
+
+    if record_type == constants.RECORD_TUPLE:
+        return values_of
+    elif record_type == constants.RECORD_NAMEDTUPLE:
+        record_class = namedtuple('Record', [_field_name(name)
+                                             for name in names],
+                                  rename=True)
+        make = record_class._make
+        return lambda row: make(values_of(row))
+
+    if record_type == constants.RECORD_DICT:
+        mapping = dict
+    else:
+        mapping = compact.OrderedDict
+    if custom_headers:
+        return lambda row: mapping(compact.czip(names, values_of(row)))
+    width = len(names)
+
+    def build(row):
+        if len(row) == width:
+            return mapping(compact.czip(names, row))
+        # cells beyond the headers are kept under None, as they were
+        return mapping(compact.zip_longest(
+            names, row, fillvalue=constants.DEFAULT_NA))
+    return build
+
+
+def _make_values_getter(positions):
+    needed = max(positions) + 1 if positions else 0
+    if len(positions) > 1:
+        getter = itemgetter(*positions)
+    else:
+        # itemgetter of one position does not give a tuple
+        sliced = itemgetter(slice(needed - len(positions), needed))
+
+        def getter(row):
+            return tuple(sliced(row))
+
+    def values_of(row):
+        if len(row) < needed:
+            row = list(row) + [constants.DEFAULT_NA] * (needed - len(row))
+        return getter(row)
+    return values_of
+
+
+def _field_name(name):
+    if compact.is_string(type(name)):
+        return name
+    return str(name)
@@ -9,3 +9,4 @@
 """
 # flake8: noqa
 from .matrix import Matrix, transpose, Row, Column
+from .views import RowView, RegionView
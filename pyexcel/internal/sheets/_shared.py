@@ -123,3 +123,27 @@ def names_to_indices(names, series):
     else:
         return names
     return indices
+
+
+def valid_indices(indices, upper_bound):
+    """return the set of indices within the upper bound
+
+    Negative indices count from the end. The others are ignored.
+    """
+    valid = set()
+    for index in indices:
+        if index < 0:
+            index += upper_bound
+        if 0 <= index < upper_bound:
+            valid.add(index)
+    return valid
+
+
+def map_values(custom_function, values):
+    """apply the function to a list of values"""
+    return [custom_function(value) for value in values]
+
+
+def map_rows(custom_function, rows):
+    """apply the function to every cell of a list of rows"""
+    return [[custom_function(value) for value in row] for row in rows]
@@ -0,0 +1,402 @@
+"""
+    pyexcel.internal.sheets.aggregation
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Group rows by key columns and reduce the other columns
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import pickle
+import tempfile
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+
+
+# files the spilled groups are hashed into
+SPILL_PARTITIONS = 16
+
+
+class Reducer(object):
+    """Fold the values of a group into a single value
+
+    A reducer keeps a state per group, which is updated value by value
+    and could be merged with the state of another part of the group.
+    Empty cells are skipped by the built-in reducers.
+    """
+    name = None
+
+    def start(self):
+        """The state of an empty group"""
+        return None
+
+    def add(self, state, value):
+        """Update the state with a value and return the new state"""
+        raise NotImplementedError("add is not implemented")
+
+    def merge(self, state, other):
+        """Combine two states of the same group"""
+        raise NotImplementedError("merge is not implemented")
+
+    def result(self, state):
+        """Turn the state into the reduced value"""
+        if state is None:
+            return constants.DEFAULT_NA
+        return state
+
+
+class Sum(Reducer):
+    name = 'sum'
+
+    def start(self):
+        return 0
+
+    def add(self, state, value):
+        if _is_na(value):
+            return state
+        return state + value
+
+    def merge(self, state, other):
+        return state + other
+
+
+class Count(Sum):
+    name = 'count'
+
+    def add(self, state, value):
+        if _is_na(value):
+            return state
+        return state + 1
+
+
+class Min(Reducer):
+    name = 'min'
+
+    def add(self, state, value):
+        if _is_na(value):
+            return state
+        if state is None or value < state:
+            return value
+        return state
+
+    def merge(self, state, other):
+        if other is None:
+            return state
+        return self.add(state, other)
+
+
+class Max(Min):
+    name = 'max'
+
+    def add(self, state, value):
+        if _is_na(value):
+            return state
+        if state is None or value > state:
+            return value
+        return state
+
+
+class Mean(Reducer):
+    name = 'mean'
+
+    def start(self):
+        return (0, 0)
+
+    def add(self, state, value):
+        if _is_na(value):
+            return state
+        return (state[0] + value, state[1] + 1)
+
+    def merge(self, state, other):
+        return (state[0] + other[0], state[1] + other[1])
+
+    def result(self, state):
+        if state[1] == 0:
+            return constants.DEFAULT_NA
+        return state[0] / float(state[1])
+
+
+class First(Reducer):
+    name = 'first'
+
+    def add(self, state, value):
+        if state is None and not _is_na(value):
+            return value
+        return state
+
+    def merge(self, state, other):
+        if state is None:
+            return other
+        return state
+
+
+class Last(Reducer):
+    name = 'last'
+
+    def add(self, state, value):
+        if _is_na(value):
+            return state
+        return value
+
+    def merge(self, state, other):
+        if other is None:
+            return state
+        return other
+
+
+class CustomReducer(Reducer):
+    """Collect the values of a group, empty cells included, and call
+    the function with the list of them at the end"""
+    def __init__(self, function):
+        self.function = function
+        self.name = getattr(function, '__name__', 'custom')
+
+    def start(self):
+        return []
+
+    def add(self, state, value):
+        state.append(value)
+        return state
+
+    def merge(self, state, other):
+        return state + other
+
+    def result(self, state):
+        return self.function(state)
+
+
+REDUCERS = dict((reducer.name, reducer) for reducer in
+                [Sum, Count, Min, Max, Mean, First, Last])
+
+
+def get_reducer(function):
+    """Get a reducer by its name, or wrap a function of a list"""
+    if isinstance(function, Reducer):
+        return function
+    elif compact.is_string(type(function)):
+        if function not in REDUCERS:
+            raise ValueError(constants.MESSAGE_UNKNOWN_REDUCER % function)
+        return REDUCERS[function]()
+    elif callable(function):
+        return CustomReducer(function)
+    raise ValueError(constants.MESSAGE_UNKNOWN_REDUCER % function)
+
+
+def make_aggregations(aggregations, column_name=None):
+    """Turn {column: reducer or a list of reducers} into a list of
+    (column, output name, reducer)
+
+    Several reducers on one column are named column_reducer.
+    """
+    specs = []
+    for column, functions in aggregations.items():
+        name = column
+        if column_name is not None:
+            name = column_name(column)
+        if isinstance(functions, (list, tuple)):
+            for function in functions:
+                reducer = get_reducer(function)
+                specs.append(
+                    (column, "%s_%s" % (name, reducer.name), reducer))
+        else:
+            specs.append((column, name, get_reducer(functions)))
+    return specs
+
+
+class GroupBy(object):
+    """The rows of a sheet grouped by the values of the key columns
+
+    It is made by :meth:`pyexcel.Sheet.group_by`
+    """
+    def __init__(self, sheet, keys):
+        if not isinstance(keys, (list, tuple)):
+            keys = [keys]
+        self._sheet = sheet
+        self._keys = list(keys)
+
+    def aggregate(self, aggregations):
+        """Reduce each group into one row of a new sheet
+
+        :param dict aggregations: column name, or index, to the name of
+                                  a reducer: sum, count, min, max, mean,
+                                  first or last, or a function which
+                                  takes the list of values of a group.
+                                  A list of them gives one column each.
+                                  Use an OrderedDict to fix the order of
+                                  the columns on python 2
+        :returns: a sheet with the key columns and one column per
+                  reducer, in the order of first appearance of the keys
+        """
+        from pyexcel.sheet import Sheet
+        sheet = self._sheet
+        key_indices = [sheet._column_index(key) for key in self._keys]
+        specs = [(sheet._column_index(column), name, reducer)
+                 for column, name, reducer
+                 in make_aggregations(aggregations, self._column_name)]
+        adders = [(position, index, reducer.add)
+                  for position, (index, _, reducer) in enumerate(specs)]
+        groups = compact.OrderedDict()
+        for row in sheet.rows():
+            key = tuple([row[index] for index in key_indices])
+            states = groups.get(key)
+            if states is None:
+                states = [reducer.start() for _, _, reducer in specs]
+                groups[key] = states
+            for position, index, add in adders:
+                states[position] = add(states[position], row[index])
+        rows = []
+        for key, states in groups.items():
+            rows.append(list(key) + [
+                reducer.result(state)
+                for (_, _, reducer), state in compact.czip(specs, states)])
+        result = Sheet(rows, name=sheet.name)
+        result.colnames = ([self._column_name(key) for key in self._keys] +
+                           [name for _, name, _ in specs])
+        return result
+
+    def _column_name(self, key):
+        colnames = self._sheet.colnames
+        if isinstance(key, compact.integer_types) and len(colnames) > 0:
+            return colnames[key]
+        return key
+
+
+def aggregate_rows(rows, key_indices, specs,
+                   max_groups=constants.DEFAULT_AGGREGATE_MAX_GROUPS,
+                   temp_dir=None):
+    """Group and reduce a stream of rows with a bounded hash table
+
+    Up to max_groups groups are folded in memory. When one more group
+    comes, the states of the groups in memory are spilled into
+    partition files by the hash of their keys, and the table starts
+    again empty. At the end each partition, which holds every state of
+    its keys, is read back and the states are merged. A partition that
+    still has too many groups is partitioned again.
+
+    :param rows: an iterable of rows
+    :param key_indices: the indices of the key columns
+    :param specs: a list of (column index, name, reducer)
+    :returns: a generator of the key cells followed by the reduced values,
+              in the order the keys first appear
+    """
+    reducers = [reducer for _, _, reducer in specs]
+    adders = [(position, index, reducer.add)
+              for position, (index, _, reducer) in enumerate(specs)]
+    width = max(key_indices + [index for index, _, _ in specs] + [-1]) + 1
+
+    def keyed_rows():
+        for number, row in enumerate(rows):
+            if len(row) < width:
+                row = list(row) + [constants.DEFAULT_NA] * (width - len(row))
+            yield tuple([row[index] for index in key_indices]), number, row
+
+    def add_row(states, row):
+        if states is None:
+            states = [reducer.start() for reducer in reducers]
+        for position, index, add in adders:
+            states[position] = add(states[position], row[index])
+        return states
+
+    groups, partitions = _fold_groups(keyed_rows(), add_row, max_groups,
+                                      temp_dir, 0)
+    if partitions is None:
+        for key, (_, states) in groups.items():
+            yield _result_row(key, states, reducers)
+        return
+    del groups
+    # put the groups back in order of first appearance
+    from pyexcel.internal.sorting import external_sort
+    numbered = ([first_seen] + _result_row(key, states, reducers)
+                for first_seen, key, states in _merge_partitions(
+                    partitions, reducers, max_groups, temp_dir, 1))
+    for row in external_sort(numbered, [0], run_size=max_groups,
+                             temp_dir=temp_dir):
+        yield row[1:]
+
+
+def _fold_groups(entries, fold, max_groups, temp_dir, depth):
+    """Fold (key, first seen, item) entries into groups in memory
+
+    :returns: the groups and None, or, once over max_groups, no group
+              and the partition files all of them were spilled to
+    """
+    groups = compact.OrderedDict()
+    partitions = None
+    for key, first_seen, item in entries:
+        group = groups.get(key)
+        if group is None:
+            if len(groups) >= max_groups:
+                if partitions is None:
+                    partitions = [tempfile.TemporaryFile(dir=temp_dir)
+                                  for _ in range(SPILL_PARTITIONS)]
+                _spill_groups(groups, partitions, depth)
+                groups = compact.OrderedDict()
+            group = [first_seen, None]
+            groups[key] = group
+        elif first_seen < group[0]:
+            group[0] = first_seen
+        group[1] = fold(group[1], item)
+    if partitions is not None:
+        _spill_groups(groups, partitions, depth)
+        groups = compact.OrderedDict()
+    return groups, partitions
+
+
+def _merge_partitions(partitions, reducers, max_groups, temp_dir, depth):
+    """Merge the spilled states, one partition at a time"""
+    def merge_states(states, other):
+        if states is None:
+            return other
+        return [reducer.merge(state, other_state) for reducer, state,
+                other_state in compact.czip(reducers, states, other)]
+
+    try:
+        for partition in partitions:
+            partition.seek(0)
+            groups, sub_partitions = _fold_groups(
+                _read_groups(partition), merge_states, max_groups,
+                temp_dir, depth)
+            partition.close()
+            if sub_partitions is None:
+                for key, (first_seen, states) in groups.items():
+                    yield first_seen, key, states
+            else:
+                for group in _merge_partitions(sub_partitions, reducers,
+                                               max_groups, temp_dir,
+                                               depth + 1):
+                    yield group
+    finally:
+        for partition in partitions:
+            partition.close()
+
+
+def _spill_groups(groups, partitions, depth):
+    buckets = [[] for _ in partitions]
+    count = len(partitions)
+    for key, (first_seen, states) in groups.items():
+        # a different hash on each level splits a crowded partition
+        buckets[hash((depth, key)) % count].append(
+            (key, first_seen, states))
+    for bucket, partition in compact.czip(buckets, partitions):
+        if bucket:
+            pickle.dump(bucket, partition, pickle.HIGHEST_PROTOCOL)
+
+
+def _read_groups(partition):
+    while True:
+        try:
+            bucket = pickle.load(partition)
+        except EOFError:
+            return
+        for group in bucket:
+            yield group
+
+
+def _result_row(key, states, reducers):
+    return list(key) + [reducer.result(state) for reducer, state
+                        in compact.czip(reducers, states)]
+
+
+def _is_na(value):
+    return value is None or value == constants.DEFAULT_NA
@@ -105,10 +105,9 @@ class Column(utils.CommonPropertyAmongRowNColumn):
                                                  self._ref.colnames)
         else:
             new_indices = indices
-        to_remove = []
-        for index in self._ref.column_range():
-            if index not in new_indices:
-                to_remove.append(index)
+        kept = set(new_indices)
+        to_remove = [index for index in self._ref.column_range()
+                     if index not in kept]
         self._ref.filter(column_indices=to_remove)
 
     def __delitem__(self, aslice):
@@ -186,14 +185,28 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         else:
             raise IndexError
 
-    def _delete_columns_by_content(self, locator):
-        to_remove = []
-        for index, column in enumerate(self._ref.columns()):
-            if locator(index, column):
-                to_remove.append(index)
+    def remove_where(self, predicate):
+        """Delete the columns for which the predicate is true
+
+        The predicate is called with the column index and the column, the
+        same way as `del sheet.column[predicate]`. Example::
+
+            >>> import pyexcel as pe
+            >>> sheet = pe.Sheet([[1, '', 3], [4, '', 6]])
+            >>> sheet.column.remove_where(
+            ...     lambda index, column: column == ['', ''])
+            >>> sheet.to_array()
+            [[1, 3], [4, 6]]
+
+        """
+        to_remove = [index for index, column in enumerate(self._ref.columns())
+                     if predicate(index, column)]
         if len(to_remove) > 0:
             self._ref.delete_columns(to_remove)
 
+    def _delete_columns_by_content(self, locator):
+        self.remove_where(locator)
+
     def __setitem__(self, aslice, a_column):
         """Override the operator to set items"""
         is_sheet = (compact.is_string(type(aslice)) and
@@ -279,12 +292,8 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         if isinstance(new_indices, list):
             for rcolumn in self._ref.column_range():
                 if rcolumn in new_indices:
-                    for row in self._ref.row_range():
-                        value = self._ref.cell_value(row, rcolumn)
-                        value = converter(value)
-                        self._ref.cell_value(row, rcolumn, value)
+                    self._ref._format_column(rcolumn, converter)
         else:
-            for row in self._ref.row_range():
-                value = self._ref.cell_value(row, new_indices)
-                value = converter(value)
-                self._ref.cell_value(row, new_indices, value)
+            if new_indices not in self._ref.column_range():
+                raise IndexError
+            self._ref._format_column(new_indices, converter)
@@ -0,0 +1,506 @@
+"""
+    pyexcel.internal.sheets.columnar
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Column major storage for the matrix
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import copy
+from functools import partial
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+from .formatters import to_format
+from ._shared import map_values
+
+
+class ColumnarArray(object):
+    """A list of rows look-alike which keeps one list per column
+
+    Iteration and slicing give out rows as fresh lists. Integer
+    indexing gives out a :class:`ColumnarRow`, through which the
+    cells could be read and written in place.
+    """
+    def __init__(self, rows=None):
+        self.columns = []
+        self._number_of_rows = 0
+        if rows is not None:
+            self.extend(rows)
+
+    def width(self):
+        """The number of columns"""
+        return len(self.columns)
+
+    def column_values(self, index):
+        """Get a copy of the column"""
+        return list(self.columns[index])
+
+    def set_column_values(self, index, starting, values):
+        """Overwrite the column from the starting row onwards"""
+        self.columns[index][starting:starting+len(values)] = _fill(values)
+
+    def map_column(self, index, custom_function):
+        """Apply the function to every cell of a column"""
+        column = self.columns[index]
+        column[:] = [custom_function(value) for value in column]
+
+    def map_row(self, index, custom_function):
+        """Apply the function to every cell of a row"""
+        for column_index in compact.irange(len(self.columns)):
+            self.set_cell(index, column_index,
+                          custom_function(self.cell(index, column_index)))
+
+    def map(self, custom_function, executor=None):
+        """Apply the function to every cell
+
+        The columns are sent one by one to the executor if given
+        """
+        self._map_columns(compact.irange(len(self.columns)),
+                          custom_function, executor)
+
+    def _map_columns(self, indices, custom_function, executor):
+        if executor is None:
+            for index in indices:
+                self.map_column(index, custom_function)
+        else:
+            indices = list(indices)
+            results = executor.map(partial(map_values, custom_function),
+                                   [self.column_values(index)
+                                    for index in indices])
+            for index, values in compact.czip(indices, results):
+                self.columns[index] = self._new_column(values)
+
+    def _new_column(self, values):
+        return values
+
+    def region(self, top, left, bottom, right):
+        """Get a rectangle of rows out"""
+        columns = [self.column_values(index)[top:bottom]
+                   for index in compact.irange(left, right)]
+        if not columns:
+            return [[] for _ in compact.irange(top, bottom)]
+        return [list(row) for row in compact.czip(*columns)]
+
+    def cell(self, row, column):
+        """Get a cell value"""
+        return self.columns[column][row]
+
+    def set_cell(self, row, column, value):
+        """Set a cell value"""
+        self.columns[column][row] = value
+
+    def row(self, index):
+        """Get a copy of the row"""
+        return [self.cell(index, column_index)
+                for column_index in compact.irange(len(self.columns))]
+
+    def set_row(self, index, row):
+        """Replace the row, new columns are added if it is wider"""
+        row = _fill(row)
+        self._widen(len(row))
+        row_length = len(row)
+        for column_index, column in enumerate(self.columns):
+            if column_index < row_length:
+                column[index] = row[column_index]
+            else:
+                column[index] = constants.DEFAULT_NA
+
+    def append(self, row):
+        """Append a row at the bottom"""
+        self.extend([row])
+
+    def extend(self, rows):
+        """Append rows at the bottom in one pass"""
+        rows = [_fill(row) for row in rows]
+        if not rows:
+            return
+        width = max(len(self.columns), max(map(len, rows)))
+        self._widen(width)
+        padded_rows = [
+            row + [constants.DEFAULT_NA] * (width - len(row))
+            if len(row) < width else row
+            for row in rows]
+        for column, values in compact.czip(self.columns,
+                                           compact.czip(*padded_rows)):
+            column.extend(values)
+        self._number_of_rows += len(rows)
+
+    def extend_columns(self, columns):
+        """Append columns at the right most side
+
+        Shorter columns are padded and the existing columns are
+        lengthened if the incoming ones are longer.
+        """
+        new_columns = [_fill(column) for column in columns]
+        length = max([len(column) for column in new_columns] +
+                     [self._number_of_rows])
+        for column in self.columns:
+            column.extend([constants.DEFAULT_NA] * (length - len(column)))
+        for column in new_columns:
+            column.extend([constants.DEFAULT_NA] * (length - len(column)))
+            self.columns.append(column)
+        self._number_of_rows = length
+
+    def delete_rows(self, row_indices):
+        """Delete rows by a set of indices in one pass"""
+        for index, column in enumerate(self.columns):
+            self.columns[index] = [
+                value for row_index, value in enumerate(column)
+                if row_index not in row_indices]
+        self._number_of_rows -= len(row_indices)
+        self._forget_empty_columns()
+
+    def reorder(self, positions):
+        """Put the rows in the order of the given positions"""
+        for index, column in enumerate(self.columns):
+            self.columns[index] = [column[position] for position in positions]
+
+    def delete_columns(self, column_indices):
+        """Delete columns by a list of indices"""
+        to_remove = set(column_indices)
+        self.columns = [column for index, column in enumerate(self.columns)
+                        if index not in to_remove]
+
+    def transpose(self):
+        """Rows become columns and vice versa"""
+        self.columns, self._number_of_rows = (
+            [list(row) for row in self], len(self.columns))
+
+    def uniform(self):
+        """Replace None with empty string and return the width"""
+        for column in self.columns:
+            if None in column:
+                column[:] = [constants.DEFAULT_NA if value is None else value
+                             for value in column]
+        return len(self.columns)
+
+    def _widen(self, width):
+        while len(self.columns) < width:
+            self.columns.append(
+                [constants.DEFAULT_NA] * self._number_of_rows)
+
+    def _forget_empty_columns(self):
+        # a list of rows has no width once its rows are gone
+        if self._number_of_rows == 0:
+            self.columns = []
+
+    def _row_index(self, index):
+        if index < 0:
+            index += self._number_of_rows
+        if index < 0 or index >= self._number_of_rows:
+            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+        return index
+
+    def _plain_columns(self):
+        return self.columns
+
+    def __len__(self):
+        return self._number_of_rows
+
+    def __iter__(self):
+        if self.columns:
+            for row in compact.czip(*self._plain_columns()):
+                yield list(row)
+        else:
+            for _ in compact.irange(self._number_of_rows):
+                yield []
+
+    def __reversed__(self):
+        for index in compact.irange(self._number_of_rows - 1, -1, -1):
+            yield self.row(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i)
+                    for i in compact.irange(
+                        *index.indices(self._number_of_rows))]
+        return ColumnarRow(self, self._row_index(index))
+
+    def __setitem__(self, index, row):
+        self.set_row(self._row_index(index), row)
+
+    def __delitem__(self, index):
+        index = self._row_index(index)
+        for column in self.columns:
+            del column[index]
+        self._number_of_rows -= 1
+        self._forget_empty_columns()
+
+    def __iadd__(self, rows):
+        self.extend(rows)
+        return self
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+
+class NumpyColumnarArray(ColumnarArray):
+    """Column store which keeps homogeneous numeric columns in numpy arrays
+
+    Integer only and float only columns become int64 and float64 arrays.
+    Any other column stays as a list. Values always come out as python
+    objects, so the content round-trips unchanged. Row wise changes turn
+    the arrays back into lists, which are typed again before the next
+    vectorized operation.
+    """
+    def __init__(self, rows=None):
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(constants.MESSAGE_NUMPY_IS_REQUIRED)
+        self._numpy = numpy
+        ColumnarArray.__init__(self, rows)
+
+    def column_values(self, index):
+        column = self.columns[index]
+        if isinstance(column, self._numpy.ndarray):
+            return column.tolist()
+        return list(column)
+
+    def set_column_values(self, index, starting, values):
+        self._thaw(index)
+        ColumnarArray.set_column_values(self, index, starting, values)
+
+    def map_column(self, index, custom_function):
+        column = self.columns[index] = self._freeze(self.columns[index])
+        if isinstance(column, self._numpy.ndarray):
+            result = self._vectorized(column, custom_function)
+            if result is not None:
+                self.columns[index] = result
+                return
+        values = self.column_values(index)
+        self.columns[index] = self._freeze(
+            [custom_function(value) for value in values])
+
+    def map(self, custom_function, executor=None):
+        rest = []
+        for index, column in enumerate(self.columns):
+            column = self.columns[index] = self._freeze(column)
+            result = None
+            if isinstance(column, self._numpy.ndarray):
+                result = self._vectorized(column, custom_function)
+            if result is None:
+                rest.append(index)
+            else:
+                self.columns[index] = result
+        self._map_columns(rest, custom_function, executor)
+
+    def _new_column(self, values):
+        return self._freeze(values)
+
+    def region(self, top, left, bottom, right):
+        columns = [self.columns[index][top:bottom]
+                   for index in compact.irange(left, right)]
+        columns = [_to_list(column) for column in columns]
+        if not columns:
+            return [[] for _ in compact.irange(top, bottom)]
+        return [list(row) for row in compact.czip(*columns)]
+
+    def cell(self, row, column):
+        value = self.columns[column][row]
+        if isinstance(value, self._numpy.generic):
+            return value.item()
+        return value
+
+    def set_cell(self, row, column, value):
+        array = self.columns[column]
+        if (isinstance(array, self._numpy.ndarray) and
+                _numeric_kind(value) != array.dtype.kind):
+            self._thaw(column)
+        try:
+            self.columns[column][row] = value
+        except OverflowError:
+            # an integer beyond int64 goes in as a python object
+            self._thaw(column)
+            self.columns[column][row] = value
+
+    def set_row(self, index, row):
+        self._thaw_all()
+        ColumnarArray.set_row(self, index, row)
+
+    def extend(self, rows):
+        self._thaw_all()
+        ColumnarArray.extend(self, rows)
+
+    def extend_columns(self, columns):
+        self._thaw_all()
+        ColumnarArray.extend_columns(self, columns)
+
+    def delete_rows(self, row_indices):
+        kept = None
+        for index, column in enumerate(self.columns):
+            if isinstance(column, self._numpy.ndarray):
+                if kept is None:
+                    kept = self._numpy.ones(self._number_of_rows, dtype=bool)
+                    kept[list(row_indices)] = False
+                self.columns[index] = column[kept]
+            else:
+                self.columns[index] = [
+                    value for row_index, value in enumerate(column)
+                    if row_index not in row_indices]
+        self._number_of_rows -= len(row_indices)
+        self._forget_empty_columns()
+
+    def reorder(self, positions):
+        for index, column in enumerate(self.columns):
+            if isinstance(column, self._numpy.ndarray):
+                self.columns[index] = column[positions]
+            else:
+                self.columns[index] = [column[position]
+                                       for position in positions]
+
+    def __delitem__(self, index):
+        index = self._row_index(index)
+        for column_index, column in enumerate(self.columns):
+            if isinstance(column, self._numpy.ndarray):
+                self.columns[column_index] = self._numpy.delete(column, index)
+            else:
+                del column[index]
+        self._number_of_rows -= 1
+        self._forget_empty_columns()
+
+    def transpose(self):
+        numpy = self._numpy
+        kinds = set(column.dtype.kind
+                    if isinstance(column, numpy.ndarray) else None
+                    for column in self.columns)
+        if self.columns and len(kinds) == 1 and None not in kinds:
+            table = numpy.column_stack(self.columns)
+            self.columns, self._number_of_rows = (
+                list(table), len(self.columns))
+        else:
+            ColumnarArray.transpose(self)
+            self.uniform()
+
+    def uniform(self):
+        for index, column in enumerate(self.columns):
+            if isinstance(column, list) and None in column:
+                column = [constants.DEFAULT_NA if value is None else value
+                          for value in column]
+            self.columns[index] = self._freeze(column)
+        return len(self.columns)
+
+    def _vectorized(self, column, custom_function):
+        numpy = self._numpy
+        if isinstance(custom_function, numpy.ufunc):
+            return custom_function(column)
+        is_formatter = (isinstance(custom_function, partial) and
+                        custom_function.func is to_format)
+        if not is_formatter:
+            return None
+        target = custom_function.args[0]
+        if target == float:
+            return column.astype(numpy.float64)
+        elif target == int:
+            if column.dtype.kind == 'f' and not numpy.isfinite(column).all():
+                return None
+            return column.astype(numpy.int64)
+        return None
+
+    def _freeze(self, column):
+        if isinstance(column, self._numpy.ndarray) or len(column) == 0:
+            return column
+        kinds = set(_numeric_kind(value) for value in column)
+        if len(kinds) == 1:
+            kind = kinds.pop()
+            try:
+                if kind == 'i':
+                    return self._numpy.array(column, dtype=self._numpy.int64)
+                elif kind == 'f':
+                    return self._numpy.array(column,
+                                             dtype=self._numpy.float64)
+            except OverflowError:
+                pass
+        return column
+
+    def _thaw(self, index):
+        column = self.columns[index]
+        if isinstance(column, self._numpy.ndarray):
+            self.columns[index] = column.tolist()
+
+    def _thaw_all(self):
+        for index in compact.irange(len(self.columns)):
+            self._thaw(index)
+
+    def _plain_columns(self):
+        return [_to_list(column) for column in self.columns]
+
+
+class ColumnarRow(object):
+    """A live view of one row of :class:`ColumnarArray`"""
+    def __init__(self, array, index):
+        self._array = array
+        self._index = index
+
+    def __len__(self):
+        return self._array.width()
+
+    def __iter__(self):
+        return iter(self._array.row(self._index))
+
+    def __reversed__(self):
+        return reversed(self._array.row(self._index))
+
+    def __getitem__(self, column):
+        if isinstance(column, slice):
+            return self._array.row(self._index)[column]
+        return self._array.cell(self._index, column)
+
+    def __setitem__(self, column, value):
+        self._array.set_cell(self._index, column, value)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(list(self), memo)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _numeric_kind(value):
+    """'i' for integers, 'f' for floats and None for anything else"""
+    if isinstance(value, bool):
+        return None
+    elif isinstance(value, float):
+        return 'f'
+    elif isinstance(value, compact.integer_types):
+        return 'i'
+    try:
+        # numpy scalars
+        return value.dtype.kind
+    except AttributeError:
+        return None
+
+
+def _fill(values):
+    """A list copy of the values in which None became empty string"""
+    if None in values:
+        return [constants.DEFAULT_NA if value is None else value
+                for value in values]
+    return list(values)
+
+
+def _to_list(column):
+    if isinstance(column, list):
+        return column
+    return column.tolist()
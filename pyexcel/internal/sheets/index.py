@@ -0,0 +1,67 @@
+"""
+    pyexcel.internal.sheets.index
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Hash index from the cell values of a column to row positions
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import pyexcel.constants as constants
+
+
+class ColumnIndex(object):
+    """Map each value of a column to the rows that hold it
+
+    The owner keeps the index up to date row by row where it can and
+    marks it stale otherwise. A stale index is rebuilt on next use.
+    """
+    def __init__(self, column, unique=False):
+        self.column = column
+        self.unique = unique
+        self.stale = True
+        self._positions = {}
+
+    def build(self, values):
+        """Index a whole column"""
+        self._positions = {}
+        self.stale = False
+        for position, value in enumerate(values):
+            self.add(value, position)
+
+    def check(self, values):
+        """Raise ValueError if the values would break uniqueness"""
+        if not self.unique or self.stale:
+            return
+        seen = set()
+        for value in values:
+            if value in seen or value in self._positions:
+                raise ValueError(
+                    constants.MESSAGE_DUPLICATE_INDEX_VALUE % (
+                        value, self.column))
+            seen.add(value)
+
+    def add(self, value, position):
+        """Record the value at a row position"""
+        positions = self._positions.setdefault(value, [])
+        if self.unique and positions:
+            self.stale = True
+            raise ValueError(
+                constants.MESSAGE_DUPLICATE_INDEX_VALUE % (value, self.column))
+        positions.append(position)
+
+    def remove(self, value, position):
+        """Forget the value at a row position"""
+        positions = self._positions.get(value)
+        if positions is None:
+            return
+        try:
+            positions.remove(position)
+        except ValueError:
+            return
+        if not positions:
+            del self._positions[value]
+
+    def get(self, value):
+        """Row positions of the value in ascending order"""
+        return sorted(self._positions.get(value, []))
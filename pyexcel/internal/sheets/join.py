@@ -0,0 +1,164 @@
+"""
+    pyexcel.internal.sheets.join
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Hash join of two sheets on key columns
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+
+
+JOINS = (constants.JOIN_INNER, constants.JOIN_LEFT, constants.JOIN_OUTER)
+
+
+def join_sheets(left, right, on, how=constants.JOIN_INNER):
+    """Join the rows of two sheets whose key cells are equal
+
+    The hash table is built on the shorter sheet and the other one is
+    probed against it. The rows come out in the order of the left sheet,
+    each followed by its matches in the order of the right sheet. For an
+    outer join, the unmatched rows of the right sheet come last. Empty
+    key cells match nothing.
+
+    :param left: the left sheet
+    :param right: the right sheet
+    :param on: a column name, or index, found in both sheets, or a
+               list of them
+    :param how: 'inner', 'left' or 'outer'
+    :returns: the left columns followed by the right columns other than
+              the keys, as a list of rows
+    """
+    if how not in JOINS:
+        raise ValueError(constants.MESSAGE_UNKNOWN_JOIN % how)
+    if not isinstance(on, (list, tuple)):
+        on = [on]
+    left_keys = [left._column_index(column) for column in on]
+    right_keys = [right._column_index(column) for column in on]
+    excluded = set(right_keys)
+    right_kept = [index for index in right.column_range()
+                  if index not in excluded]
+    left_rows = list(left.rows())
+    right_rows = list(right.rows())
+
+    # positions of the matching right rows, per left row
+    matches = [()] * len(left_rows)
+    if len(right_rows) <= len(left_rows):
+        table = _hash_rows(right_rows, right_keys)
+        for position, row in enumerate(left_rows):
+            key = _key_of(row, left_keys)
+            if key is not None:
+                matches[position] = table.get(key, ())
+    else:
+        table = _hash_rows(left_rows, left_keys)
+        matches = [[] for _ in left_rows]
+        for right_position, row in enumerate(right_rows):
+            key = _key_of(row, right_keys)
+            if key is not None:
+                for position in table.get(key, ()):
+                    matches[position].append(right_position)
+
+    padding = [constants.DEFAULT_NA] * len(right_kept)
+    joined = []
+    for row, found in compact.czip(left_rows, matches):
+        if found:
+            for right_position in found:
+                right_row = right_rows[right_position]
+                joined.append(
+                    list(row) + [right_row[index] for index in right_kept])
+        elif how != constants.JOIN_INNER:
+            joined.append(list(row) + padding)
+    if how == constants.JOIN_OUTER:
+        matched = set()
+        for found in matches:
+            matched.update(found)
+        left_width = left.number_of_columns()
+        for right_position, right_row in enumerate(right_rows):
+            if right_position in matched:
+                continue
+            new_row = [constants.DEFAULT_NA] * left_width
+            for left_index, right_index in compact.czip(left_keys,
+                                                        right_keys):
+                new_row[left_index] = right_row[right_index]
+            joined.append(
+                new_row + [right_row[index] for index in right_kept])
+    colnames = []
+    if len(left.colnames) > 0 and len(right.colnames) > 0:
+        colnames = (list(left.colnames) +
+                    [right.colnames[index] for index in right_kept])
+    return joined, colnames
+
+
+def join_stream(rows, key_indices, lookup, on, how=constants.JOIN_INNER,
+                width=0):
+    """Join a stream of rows against a sheet on key columns
+
+    The hash table is built on the sheet once and each row of the stream
+    is probed against it and joined as it passes, in the manner of
+    :func:`join_sheets` with the stream on the left. For an outer join,
+    the rows of the sheet which matched no row come last.
+
+    :param rows: an iterable of rows, which is read once
+    :param key_indices: the key column indices in the rows
+    :param lookup: the sheet to look up
+    :param on: the key column names, or indices, in the sheet
+    :param how: 'inner', 'left' or 'outer'
+    :param width: the least width of a row, e.g. of the header. A short
+                  row is padded to it, or to the widest row seen so far,
+                  so that the looked up cells stay in their columns
+    """
+    if how not in JOINS:
+        raise ValueError(constants.MESSAGE_UNKNOWN_JOIN % how)
+    right_keys = [lookup._column_index(column) for column in on]
+    excluded = set(right_keys)
+    right_kept = [index for index in lookup.column_range()
+                  if index not in excluded]
+    right_rows = list(lookup.rows())
+    table = _hash_rows(right_rows, right_keys)
+    extras = [[right_row[index] for index in right_kept]
+              for right_row in right_rows]
+    padding = [constants.DEFAULT_NA] * len(right_kept)
+    matched = set()
+    left_width = max([width] + [index + 1 for index in key_indices])
+    for row in rows:
+        row = list(row)
+        if len(row) > left_width:
+            left_width = len(row)
+        elif len(row) < left_width:
+            row.extend([constants.DEFAULT_NA] * (left_width - len(row)))
+        key = _key_of(row, key_indices)
+        found = table.get(key, ()) if key is not None else ()
+        if found:
+            for right_position in found:
+                yield row + extras[right_position]
+            if how == constants.JOIN_OUTER:
+                matched.update(found)
+        elif how != constants.JOIN_INNER:
+            yield row + padding
+    if how == constants.JOIN_OUTER:
+        for right_position, right_row in enumerate(right_rows):
+            if right_position in matched:
+                continue
+            new_row = [constants.DEFAULT_NA] * left_width
+            for left_index, right_index in compact.czip(key_indices,
+                                                        right_keys):
+                new_row[left_index] = right_row[right_index]
+            yield new_row + extras[right_position]
+
+
+def _hash_rows(rows, key_indices):
+    table = {}
+    for position, row in enumerate(rows):
+        key = _key_of(row, key_indices)
+        if key is not None:
+            table.setdefault(key, []).append(position)
+    return table
+
+
+def _key_of(row, key_indices):
+    key = tuple([row[index] for index in key_indices])
+    if constants.DEFAULT_NA in key or None in key:
+        return None
+    return key
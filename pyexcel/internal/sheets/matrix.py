@@ -19,37 +19,69 @@ from pyexcel.internal.meta import SheetMeta
 from .formatters import to_format
 from .row import Row
 from .column import Column
+from .columnar import ColumnarArray, NumpyColumnarArray
+from .views import RowView, RegionView
 from . import _shared as utils
 
 
+NUMBER_TYPES = compact.integer_types + (float,)
+PLAIN_NUMBER_TYPES = set(NUMBER_TYPES)
+
+STORAGES = {
+    constants.LAYOUT_COLUMNAR: ColumnarArray,
+    constants.LAYOUT_NUMPY: NumpyColumnarArray
+}
+
+
 class Matrix(SheetMeta):
     """The internal representation of a sheet data. Each element
     can be of any python types
     """
 
-    def __init__(self, array):
+    def __init__(self, array, layout=constants.LAYOUT_ROW):
         """Constructor
 
         The reason a deep copy was not made here is because
         the data sheet could be huge. It could be costly to
         copy every cell to a new memory area
         :param list array: a list of arrays
+        :param str layout: 'row', the default, keeps a list per row.
+                           'columnar' keeps a list per column, which
+                           favours column access. 'numpy' keeps
+                           numeric columns in numpy arrays
         """
-        if isinstance(array, types.GeneratorType):
-            self.__width, self.__array = uniform(list(array))
+        if layout in STORAGES:
+            if type(array) is not STORAGES[layout]:
+                try:
+                    array = STORAGES[layout](array)
+                except TypeError:
+                    raise TypeError("Invalid two dimensional array")
+        elif layout == constants.LAYOUT_ROW:
+            if isinstance(array, (types.GeneratorType, ColumnarArray)):
+                array = list(array)
         else:
-            try:
-                self.__width, self.__array = uniform(array)
-            except TypeError:
-                raise TypeError("Invalid two dimensional array")
+            raise ValueError(constants.MESSAGE_UNKNOWN_LAYOUT % layout)
+        self.__layout = layout
+        try:
+            self.__width, self.__array = uniform(array)
+        except TypeError:
+            raise TypeError("Invalid two dimensional array")
         self.row = Row(self)
         self.column = Column(self)
         self.name = 'matrix'
 
+    @property
+    def layout(self):
+        """The storage layout: 'row', 'columnar' or 'numpy'"""
+        return self.__layout
+
     def get_internal_array(self):
         """present internal array"""
         return self.__array
 
+    def _is_columnar(self):
+        return self.__layout in STORAGES
+
     def number_of_rows(self):
         """The number of rows"""
         return len(self.__array)
@@ -98,7 +130,28 @@ class Matrix(SheetMeta):
         Gets the data at the specified row
         """
         if index in self.row_range():
-            return copy.deepcopy(self.__array[index])
+            return list(self.__array[index])
+        else:
+            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+
+    def row_view(self, index):
+        """
+        Gets a read only view of the specified row
+
+        No cell is copied until the view is written to, and the writes
+        never reach the matrix. Example::
+
+            >>> import pyexcel as pe
+            >>> m = pe.internal.sheets.Matrix([[1, 2], [3, 4]])
+            >>> view = m.row_view(1)
+            >>> view
+            [3, 4]
+            >>> view[0] = 5
+            >>> m.row[1]
+            [3, 4]
+        """
+        if index in self.row_range():
+            return RowView(self.__array, index, 0, self.number_of_columns())
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -108,8 +161,7 @@ class Matrix(SheetMeta):
         nrows = self.number_of_rows()
         if row_index < nrows:
             self.__array[row_index] = data_array
-            if len(data_array) != self.number_of_columns():
-                self.__width, self.__array = uniform(self.__array)
+            self._fit_rows(row_index, row_index + 1)
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -142,10 +194,29 @@ class Matrix(SheetMeta):
                 left = ncolumns - starting
                 self.__array[row_index] = (self.__array[row_index] +
                                            data_array[left:])
-            self.__width, self.__array = uniform(self.__array)
+            self._fit_rows(row_index, row_index + 1)
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
+    def _fit_rows(self, start, stop=None):
+        """Pad the rows in the range and swap None for empty string
+
+        Rows outside the range are left alone unless the rows in
+        the range are wider than the rest of the matrix
+        """
+        if self._is_columnar():
+            self.__width = self.__array.width()
+            return
+        rows = self.__array[start:stop]
+        if len(rows) == len(self.__array):
+            self.__width, self.__array = uniform(self.__array)
+            return
+        width = longest_row_number(rows)
+        if width > self.__width:
+            self.__width, self.__array = uniform(self.__array)
+        else:
+            fill_rows(rows, self.__width)
+
     def _extend_row(self, row):
         array = copy.deepcopy(row)
         if compact.is_array_type(array, list):
@@ -155,9 +226,12 @@ class Matrix(SheetMeta):
 
     def extend_rows(self, rows):
         """Inserts two dimensional data after the bottom row"""
+        if isinstance(rows, ColumnarArray):
+            rows = list(rows)
         if isinstance(rows, list):
+            first_new_row = self.number_of_rows()
             self._extend_row(rows)
-            self.__width, self.__array = uniform(self.__array)
+            self._fit_rows(first_new_row)
         else:
             raise TypeError("Cannot use %s" % type(rows))
 
@@ -165,22 +239,23 @@ class Matrix(SheetMeta):
         """Deletes specified row indices"""
         if isinstance(row_indices, list) is False:
             raise IndexError
-        if len(row_indices) > 0:
-            unique_list = _unique(row_indices)
-            sorted_list = sorted(unique_list, reverse=True)
-            for i in sorted_list:
-                if i < self.number_of_rows():
-                    del self.__array[i]
+        to_remove = utils.valid_indices(row_indices, self.number_of_rows())
+        if not to_remove:
+            return
+        if self._is_columnar():
+            self.__array.delete_rows(to_remove)
+        else:
+            self.__array[:] = [row for index, row in enumerate(self.__array)
+                               if index not in to_remove]
 
     def column_at(self, index):
         """
         Gets the data at the specified column
         """
         if index in self.column_range():
-            cell_array = []
-            for i in self.row_range():
-                cell_array.append(self.cell_value(i, index))
-            return cell_array
+            if self._is_columnar():
+                return self.__array.column_values(index)
+            return [row[index] for row in self.__array]
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -209,13 +284,20 @@ class Matrix(SheetMeta):
         if column_index < ncolumns and starting < nrows:
             real_len = len(data_array)+starting
             end = min(real_len, nrows)
-            for i in range(starting, end):
-                self.cell_value(i, column_index, data_array[i-starting])
+            if self._is_columnar():
+                self.__array.set_column_values(
+                    column_index, starting, data_array[:end-starting])
+            else:
+                for i in range(starting, end):
+                    value = data_array[i-starting]
+                    if value is None:
+                        value = constants.DEFAULT_NA
+                    self.__array[i][column_index] = value
             if real_len > nrows:
                 for i in range(nrows, real_len):
                     new_row = [''] * column_index + [data_array[i-starting]]
                     self.__array.append(new_row)
-            self.__width, self.__array = uniform(self.__array)
+            self._fit_rows(nrows)
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -241,6 +323,12 @@ class Matrix(SheetMeta):
         self._extend_columns_with_rows(incoming_data)
 
     def _extend_columns_with_rows(self, rows):
+        if isinstance(rows, ColumnarArray):
+            rows = list(rows)
+        if self._is_columnar():
+            self.__array.extend_columns(transpose(rows))
+            self._fit_rows(self.number_of_rows())
+            return
         current_nrows = self.number_of_rows()
         current_ncols = self.number_of_columns()
         insert_column_nrows = len(rows)
@@ -302,15 +390,35 @@ class Matrix(SheetMeta):
         :param slice bottomright_corner: the bottom right
                                          corner of the rectangle
         """
-        region = []
         max_row = min(bottomright_corner[0], self.number_of_rows())
         max_col = min(bottomright_corner[1], self.number_of_columns())
-        for row in range(topleft_corner[0], max_row):
-            tmp_row = []
-            for column in range(topleft_corner[1], max_col):
-                tmp_row.append(self.cell_value(row, column))
-            region.append(tmp_row)
-        return region
+        if self._is_columnar():
+            return self.__array.region(topleft_corner[0], topleft_corner[1],
+                                       max_row, max_col)
+        return [row[topleft_corner[1]:max_col]
+                for row in self.__array[topleft_corner[0]:max_row]]
+
+    def region_view(self, topleft_corner, bottomright_corner):
+        """Get a read only view of a rectangle shaped data
+
+        It works like :meth:`region` but no cell is copied out::
+
+            >>> import pyexcel as pe
+            >>> m = pe.internal.sheets.Matrix([[1, 2, 3], [4, 5, 6]])
+            >>> view = m.region_view((0, 1), (2, 3))
+            >>> view
+            [[2, 3], [5, 6]]
+            >>> view[1][0]
+            5
+
+        :param slice topleft_corner: the top left corner of the rectangle
+        :param slice bottomright_corner: the bottom right
+                                         corner of the rectangle
+        """
+        max_row = min(bottomright_corner[0], self.number_of_rows())
+        max_col = min(bottomright_corner[1], self.number_of_columns())
+        return RegionView(self.__array, topleft_corner[0], topleft_corner[1],
+                          max_row, max_col)
 
     def cut(self, topleft_corner, bottomright_corner):
         """Get a rectangle shaped data out and clear them in position
@@ -399,6 +507,7 @@ class Matrix(SheetMeta):
         starting_row = topleft_corner[0]
         number_of_rows = self.number_of_rows()
         number_of_columns = self.number_of_columns()
+        first_new_row = number_of_rows
         delta = starting_row - number_of_rows
         if delta > 0:
             empty_row = [
@@ -414,7 +523,7 @@ class Matrix(SheetMeta):
             else:
                 real_row = [constants.DEFAULT_NA] * topleft_corner[1] + row
                 self._extend_row(real_row)
-        self.__width, self.__array = uniform(self.__array)
+        self._fit_rows(first_new_row)
 
     def _paste_columns(self, topleft_corner, columns):
         starting_column = topleft_corner[1]
@@ -429,21 +538,25 @@ class Matrix(SheetMeta):
                 real_column = [constants.DEFAULT_NA] * topleft_corner[0]
                 real_column += column
                 self.extend_columns([real_column])
-        self.__width, self.__array = uniform(self.__array)
 
     def delete_columns(self, column_indices):
         """Delete columns by specified list of indices
         """
         if isinstance(column_indices, list) is False:
             raise TypeError(constants.MESSAGE_DATA_ERROR_DATA_TYPE_MISMATCH)
-        if len(column_indices) > 0:
-            unique_list = _unique(column_indices)
-            sorted_list = sorted(unique_list, reverse=True)
-            for i in self.row_range():
-                for j in sorted_list:
-                    if j < self.number_of_columns():
-                        del self.__array[i][j]
-            self.__width = longest_row_number(self.__array)
+        to_remove = utils.valid_indices(column_indices,
+                                        self.number_of_columns())
+        if not to_remove:
+            return
+        if self._is_columnar():
+            self.__array.delete_columns(to_remove)
+            self.__width = self.__array.width()
+        else:
+            kept = [index for index in self.column_range()
+                    if index not in to_remove]
+            for row in self.__array:
+                row[:] = [row[index] for index in kept]
+            self.__width = len(kept)
 
     def __setitem__(self, aset, cell_value):
         """Override the operator to set items"""
@@ -481,7 +594,10 @@ class Matrix(SheetMeta):
 
         Reference :func:`transpose`
         """
-        self.__array = transpose(self.__array)
+        if self._is_columnar():
+            self.__array.transpose()
+        else:
+            self.__array = transpose(self.__array)
         self.__width, self.__array = uniform(self.__array)
 
     def to_array(self):
@@ -560,6 +676,8 @@ class Matrix(SheetMeta):
 
         More details see :class:`VTLBRIterator`
         """
+        if self._is_columnar():
+            return chain(*self.columns())
         return chain(*compact.czip(*self.__array))
 
     def rvertical(self):
@@ -656,8 +774,12 @@ class Matrix(SheetMeta):
 
         More details see :class:`ColumnIterator`
         """
-        for row in compact.czip(*self.__array):
-            yield list(row)
+        if self._is_columnar():
+            for index in self.column_range():
+                yield self.__array.column_values(index)
+        else:
+            for row in compact.czip(*self.__array):
+                yield list(row)
 
     def rcolumns(self):
         """
@@ -680,8 +802,13 @@ class Matrix(SheetMeta):
 
         More details see :class:`ColumnReverseIterator`
         """
-        for column in compact.czip(*(reversed(row) for row in self.__array)):
-            yield list(column)
+        if self._is_columnar():
+            for index in reversed(self.column_range()):
+                yield self.__array.column_values(index)
+        else:
+            for column in compact.czip(
+                    *(reversed(row) for row in self.__array)):
+                yield list(column)
 
     def filter(self, column_indices=None, row_indices=None):
         """Apply the filter with immediate effect"""
@@ -690,7 +817,7 @@ class Matrix(SheetMeta):
         if column_indices is not None:
             self.delete_columns(column_indices)
 
-    def format(self, formatter):
+    def format(self, formatter, executor=None):
         """Apply a formatting action for the whole sheet
 
         Example::
@@ -713,11 +840,20 @@ class Matrix(SheetMeta):
             >>> sheet.row[1]
             [1, 1, 2, 1]
 
+        :param formatter: a type, or a dictionary of column index
+                          (or column name for a named sheet) to type
+        :param executor: an optional concurrent.futures executor, which
+                         formats the data in chunks
         """
-        custom_function = partial(to_format, formatter)
-        self.map(custom_function)
+        if isinstance(formatter, dict):
+            custom_function = dict(
+                (key, partial(to_format, value))
+                for key, value in formatter.items())
+        else:
+            custom_function = partial(to_format, formatter)
+        self.map(custom_function, executor=executor)
 
-    def map(self, custom_function):
+    def map(self, custom_function, executor=None):
         """Execute a function across all cells of the sheet
 
         Example::
@@ -738,12 +874,141 @@ class Matrix(SheetMeta):
             >>> sheet.row[1]
             [2.0, 2.25, 3.0, 2.0]
 
+        Different functions could be given to different columns::
+
+            >>> sheet.map({0: int, 3: str})
+            >>> sheet.row[1]
+            [2, 2.25, 3.0, '2.0']
+
+        :param custom_function: a function, or a dictionary of column
+                                index (or column name for a named sheet)
+                                to function
+        :param executor: an optional concurrent.futures executor. The
+                         rows, or the columns, are sent to it in chunks,
+                         which pays off for cpu heavy functions only. The
+                         function has to be picklable for a process pool
+        """
+        if isinstance(custom_function, dict):
+            self._map_columns(custom_function, executor)
+        elif self._is_columnar():
+            self.__array.map(custom_function, executor=executor)
+        elif executor is None:
+            for row in self.__array:
+                row[:] = [custom_function(value) for value in row]
+        else:
+            size = constants.DEFAULT_MAP_CHUNK_SIZE
+            chunks = [self.__array[index:index+size]
+                      for index in compact.irange(0, len(self.__array), size)]
+            results = executor.map(partial(utils.map_rows, custom_function),
+                                   chunks)
+            for row, new_row in compact.czip(self.__array,
+                                             chain.from_iterable(results)):
+                row[:] = new_row
+
+    def _map_columns(self, function_map, executor=None):
+        """Apply the function of each column to its cells"""
+        indices = [self._column_index(key) for key in function_map]
+        functions = list(function_map.values())
+        if executor is None:
+            for index, custom_function in compact.czip(indices, functions):
+                self._format_column(index, custom_function)
+        else:
+            results = executor.map(utils.map_values, functions,
+                                   [self.column_at(index)
+                                    for index in indices])
+            for index, values in compact.czip(indices, results):
+                self.set_column_at(index, values)
+
+    def sort(self, by=None, reverse=False, key=None):
+        """Sort the rows in place by one or more columns
+
+        Example::
+
+            >>> import pyexcel as pe
+            >>> sheet = pe.Sheet([
+            ...     ["north", 3], ["south", ""], ["north", 1], ["south", 2]])
+            >>> sheet.sort(by=[0, 1], reverse=[False, True])
+            >>> sheet.to_array()
+            [['north', 3], ['north', 1], ['south', 2], ['south', '']]
+
+        Numbers come before other values, which are ordered by their
+        type names first. Empty cells and NaN come last, in either
+        direction.
+
+        :param by: a column index, or a list of them. A named sheet
+                   accepts column names too. All columns are used by
+                   default
+        :param reverse: True to sort in descending order. A list gives
+                        the direction of each column in `by`
+        :param key: a function applied to each cell of the `by` columns
+                    before comparison
         """
-        for row in self.row_range():
-            for column in self.column_range():
-                value = self.cell_value(row, column)
-                value = custom_function(value)
-                self.cell_value(row, column, value)
+        if by is None:
+            by = list(self.column_range())
+        elif not isinstance(by, (list, tuple)):
+            by = [by]
+        if isinstance(reverse, (list, tuple)):
+            if len(reverse) != len(by):
+                raise ValueError(constants.MESSAGE_SORT_REVERSE_MISMATCH)
+            directions = list(reverse)
+        else:
+            directions = [reverse] * len(by)
+        indices = [self._column_index(column) for column in by]
+        positions = list(self.row_range())
+        if len(set(directions)) == 1:
+            # one sort on the sort keys of all columns
+            passes = [(indices, directions[0])]
+        else:
+            # stable sorts from the least significant column onwards
+            passes = [([index], descending) for index, descending
+                      in reversed(list(compact.czip(indices, directions)))]
+        for pass_indices, descending in passes:
+            na_rank = -1 if descending else 1
+            columns = []
+            for index in pass_indices:
+                cells = self.column_at(index)
+                if key is not None:
+                    cells = [key(cell) for cell in cells]
+                columns.append(_sort_keys(cells, na_rank))
+            sort_keys = list(compact.czip(*columns))
+            positions.sort(key=sort_keys.__getitem__, reverse=descending)
+        self._reorder_rows(positions)
+
+    def _reorder_rows(self, positions):
+        """Put the rows in the order of the given positions"""
+        if self._is_columnar():
+            self.__array.reorder(positions)
+        else:
+            self.__array[:] = [self.__array[position]
+                               for position in positions]
+
+    def _row_positions(self, column, value):
+        """Indices of the rows whose cell in the column equals the value"""
+        cells = self.column_at(self._column_index(column))
+        return [position for position, cell in enumerate(cells)
+                if cell == value]
+
+    def _column_index(self, index):
+        """Check the column index, which a sheet could give by name"""
+        if index in self.column_range():
+            return index
+        raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+
+    def _format_column(self, index, converter):
+        """Apply the converter to every cell of a column"""
+        if self._is_columnar():
+            self.__array.map_column(index, converter)
+        else:
+            for row in self.__array:
+                row[index] = converter(row[index])
+
+    def _format_row(self, index, converter):
+        """Apply the converter to every cell of a row"""
+        if self._is_columnar():
+            self.__array.map_row(index, converter)
+        else:
+            row = self.__array[index]
+            row[:] = [converter(value) for value in row]
 
     def __add__(self, other):
         """Overload the + sign
@@ -776,16 +1041,30 @@ class Matrix(SheetMeta):
         return new_book
 
 
-def _unique(seq):
-    """Return a unique list of the incoming list
+def _sort_keys(cells, na_rank):
+    """Sort keys of a column, which are the cells if they compare safely"""
+    types = set(map(type, cells))
+    if types.issubset(PLAIN_NUMBER_TYPES):
+        if not any(cell != cell for cell in cells):
+            return cells
+    elif len(types) == 1 and compact.is_string(types.pop()):
+        if constants.DEFAULT_NA not in cells:
+            return cells
+    return [_sort_key(cell, na_rank) for cell in cells]
+
 
-    Reference:
-    http://stackoverflow.com/questions/480214/
-    how-do-you-remove-duplicates-from-a-list-in-python-whilst-preserving-order
+def _sort_key(value, na_rank):
+    """Make any cell value comparable with the others
+
+    Numbers rank 0. Other values rank 0 as well but are grouped by their
+    type names, which sort after the empty name of numbers. Empty cells
+    and NaN take na_rank.
     """
-    seen = set()
-    seen_add = seen.add
-    return [x for x in seq if not (x in seen or seen_add(x))]
+    if value is None or value == constants.DEFAULT_NA or value != value:
+        return (na_rank, '', 0)
+    if isinstance(value, NUMBER_TYPES):
+        return (0, '', value)
+    return (0, type(value).__name__, value)
 
 
 def longest_row_number(array):
@@ -805,18 +1084,26 @@ def uniform(array):
 
     :param list in_array: a list of arrays
     """
+    if isinstance(array, ColumnarArray):
+        return array.uniform(), array
     width = longest_row_number(array)
-    if width == 0:
-        return 0, array
-    else:
-        for row in array:
-            row_length = len(row)
-            for index in range(0, row_length):
-                if row[index] is None:
-                    row[index] = constants.DEFAULT_NA
-            if row_length < width:
-                row += [constants.DEFAULT_NA] * (width - row_length)
-        return width, array
+    fill_rows(array, width)
+    return width, array
+
+
+def fill_rows(rows, width):
+    """Swap None for empty string and pad the rows to the width
+
+    :param list rows: a list of arrays, which are changed in place
+    :param int width: the width to pad to
+    """
+    for row in rows:
+        if None in row:
+            row[:] = [constants.DEFAULT_NA if value is None else value
+                      for value in row]
+        row_length = len(row)
+        if row_length < width:
+            row += [constants.DEFAULT_NA] * (width - row_length)
 
 
 def transpose(in_array):
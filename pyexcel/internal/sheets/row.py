@@ -81,17 +81,27 @@ class Row(utils.CommonPropertyAmongRowNColumn):
             | 6 |
             +---+
 
+        A dictionary of column to value keeps the matching rows. The
+        index of the column, made by Sheet.create_index, is used if
+        present::
+
+            >>> sheet = pe.Sheet([["a", 1], ["b", 2], ["a", 3]])
+            >>> sheet.row.select({0: "a"})
+            >>> sheet.to_array()
+            [['a', 1], ['a', 3]]
+
         """
         new_indices = []
-        if compact.is_array_type(indices, str):
+        if isinstance(indices, dict):
+            new_indices = self._rows_matching(indices)
+        elif compact.is_array_type(indices, str):
             new_indices = utils.names_to_indices(indices,
                                                  self._ref.rownames)
         else:
             new_indices = indices
-        to_remove = []
-        for index in self._ref.row_range():
-            if index not in new_indices:
-                to_remove.append(index)
+        kept = set(new_indices)
+        to_remove = [index for index in self._ref.row_range()
+                     if index not in kept]
         self._ref.filter(row_indices=to_remove)
 
     def __delitem__(self, locator):
@@ -134,9 +144,18 @@ class Row(utils.CommonPropertyAmongRowNColumn):
             | 9 |
             +---+
 
+        A dictionary of column to value deletes the matching rows::
+
+            >>> sheet = pe.Sheet([["a", 1], ["b", 2], ["a", 3]])
+            >>> del sheet.row[{0: "a"}]
+            >>> sheet.to_array()
+            [['b', 2]]
+
         """
         if compact.is_string(type(locator)):
             self._ref.delete_named_row_at(locator)
+        elif isinstance(locator, dict):
+            self._ref.delete_rows(self._rows_matching(locator))
         elif compact.is_tuple_consists_of_strings(locator):
             indices = utils.names_to_indices(list(locator),
                                              self._ref.rownames)
@@ -156,14 +175,41 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         else:
             self._ref.delete_rows([locator])
 
-    def _delete_rows_by_content(self, locator):
-        to_remove = []
-        for index, row in enumerate(self._ref.rows()):
-            if locator(index, row):
-                to_remove.append(index)
+    def _rows_matching(self, criteria):
+        """Indices of the rows whose cells equal all the given values
+
+        A column index made by Sheet.create_index is used if present
+        """
+        found = None
+        for column, value in criteria.items():
+            positions = set(self._ref._row_positions(column, value))
+            if found is None:
+                found = positions
+            else:
+                found &= positions
+        return sorted(found or [])
+
+    def remove_where(self, predicate):
+        """Delete the rows for which the predicate is true
+
+        The predicate is called with the row index and the row, the
+        same way as `del sheet.row[predicate]`. Example::
+
+            >>> import pyexcel as pe
+            >>> sheet = pe.Sheet([[1], [2], [3], [4]])
+            >>> sheet.row.remove_where(lambda index, row: row[0] % 2 == 0)
+            >>> sheet.to_array()
+            [[1], [3]]
+
+        """
+        to_remove = [index for index, row in enumerate(self._ref.rows())
+                     if predicate(index, row)]
         if len(to_remove) > 0:
             self._ref.delete_rows(to_remove)
 
+    def _delete_rows_by_content(self, locator):
+        self.remove_where(locator)
+
     def __setitem__(self, aslice, a_row):
         """Override the operator to set items"""
         if compact.is_string(type(aslice)):
@@ -229,12 +275,8 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         if isinstance(new_indices, list):
             for rindex in self._ref.row_range():
                 if rindex in new_indices:
-                    for column in self._ref.column_range():
-                        value = self._ref.cell_value(rindex, column)
-                        value = converter(value)
-                        self._ref.cell_value(rindex, column, value)
+                    self._ref._format_row(rindex, converter)
         else:
-            for column in self._ref.column_range():
-                value = self._ref.cell_value(new_indices, column)
-                value = converter(value)
-                self._ref.cell_value(new_indices, column, value)
+            if new_indices not in self._ref.row_range():
+                raise IndexError
+            self._ref._format_row(new_indices, converter)
@@ -0,0 +1,141 @@
+"""
+    pyexcel.internal.sheets.views
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Light weight views over the rows of a matrix
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import copy
+from itertools import islice
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+
+
+class RowView(object):
+    """A read only look at a row, or a part of it, of the backing array
+
+    No cell is copied when the view is made. The first write copies
+    the visible cells out, after which the view no longer follows the
+    backing array and the backing array is never changed.
+    """
+    def __init__(self, array, index, left=0, right=None):
+        self._array = array
+        self._index = index
+        self._left = left
+        if right is None:
+            right = len(array[index])
+        self._right = max(right, left)
+        self._copy = None
+
+    def is_copied(self):
+        """Tell if the view has been written to"""
+        return self._copy is not None
+
+    def _cells(self):
+        if self._copy is not None:
+            return self._copy
+        return self._array[self._index][self._left:self._right]
+
+    def __len__(self):
+        return self._right - self._left
+
+    def __iter__(self):
+        if self._copy is not None:
+            return iter(self._copy)
+        return islice(self._array[self._index], self._left, self._right)
+
+    def __reversed__(self):
+        return reversed(self._cells())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._cells()[index]
+        if self._copy is not None:
+            return self._copy[index]
+        return self._array[self._index][self._column(index)]
+
+    def __setitem__(self, index, value):
+        if self._copy is None:
+            self._copy = list(self._cells())
+        self._copy[index] = value
+
+    def _column(self, index):
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+        return self._left + index
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(list(self), memo)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class RegionView(object):
+    """A read only look at a rectangle of the backing array
+
+    Each row comes out as a :class:`RowView`.
+    """
+    def __init__(self, array, top, left, bottom, right):
+        self._array = array
+        self._top = top
+        self._left = left
+        self._bottom = max(bottom, top)
+        self._right = max(right, left)
+
+    def to_array(self):
+        """Copy the cells out as a list of lists"""
+        return [list(row) for row in self]
+
+    def __len__(self):
+        return self._bottom - self._top
+
+    def __iter__(self):
+        for index in compact.irange(self._top, self._bottom):
+            yield RowView(self._array, index, self._left, self._right)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RowView(self._array, row_index, self._left, self._right)
+                    for row_index in range(self._top, self._bottom)[index]]
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+        return RowView(self._array, self._top + index,
+                       self._left, self._right)
+
+    def __eq__(self, other):
+        return self.to_array() == [list(row) for row in other]
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.to_array(), memo)
+
+    def __repr__(self):
+        return repr(self.to_array())
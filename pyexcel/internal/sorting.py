@@ -0,0 +1,149 @@
+"""
+    pyexcel.internal.sorting
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Sort a stream of rows larger than memory
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import heapq
+import pickle
+import tempfile
+from itertools import islice
+
+import pyexcel._compact as compact
+import pyexcel.constants as constants
+from pyexcel.internal.sheets.matrix import _sort_key
+
+
+# rows pickled together in a spilled run
+SPILL_BLOCK_SIZE = 1000
+
+
+def external_sort(rows, indices, reverse=False, key=None,
+                  run_size=constants.DEFAULT_SORT_RUN_SIZE, temp_dir=None):
+    """Sort rows with at most run_size of them in memory
+
+    The rows are cut into runs of run_size rows. Each run is sorted and,
+    unless it is the only one, pickled into a temporary file. The runs
+    are then merged with a heap, which holds one block of rows per run.
+    Rows are ordered as :meth:`pyexcel.Sheet.sort` orders them and equal
+    rows keep their order.
+
+    :param rows: an iterable of rows
+    :param indices: the column indices to sort by
+    :param reverse: True to sort in descending order. A list gives the
+                    direction of each column
+    :param key: a function applied to each sort cell before comparison
+    :param run_size: the number of rows sorted in memory at a time
+    :param temp_dir: where the runs are spilled, the system default if
+                     None
+    """
+    if isinstance(reverse, (list, tuple)):
+        if len(reverse) != len(indices):
+            raise ValueError(constants.MESSAGE_SORT_REVERSE_MISMATCH)
+        directions = list(reverse)
+    else:
+        directions = [reverse] * len(indices)
+    row_key = _make_row_key(indices, directions, key)
+    return _external_sort(iter(rows), row_key, run_size, temp_dir)
+
+
+def _external_sort(rows, row_key, run_size, temp_dir):
+    runs = []
+    try:
+        while True:
+            run = list(islice(rows, run_size))
+            if not run:
+                break
+            run.sort(key=row_key)
+            if not runs:
+                following = list(islice(rows, run_size))
+                if not following:
+                    # it all fits in memory
+                    for row in run:
+                        yield row
+                    return
+                runs.append(_spill(run, temp_dir))
+                run = following
+                run.sort(key=row_key)
+            runs.append(_spill(run, temp_dir))
+            del run
+        for row in _merge(runs, row_key):
+            yield row
+    finally:
+        for run_file in runs:
+            run_file.close()
+
+
+def _spill(rows, temp_dir):
+    run_file = tempfile.TemporaryFile(dir=temp_dir)
+    for start in compact.irange(0, len(rows), SPILL_BLOCK_SIZE):
+        pickle.dump(rows[start:start + SPILL_BLOCK_SIZE], run_file,
+                    pickle.HIGHEST_PROTOCOL)
+    run_file.seek(0)
+    return run_file
+
+
+def _read_run(run_file):
+    while True:
+        try:
+            block = pickle.load(run_file)
+        except EOFError:
+            return
+        for row in block:
+            yield row
+
+
+def _merge(runs, row_key):
+    heap = []
+    for run_number, run_file in enumerate(runs):
+        reader = _read_run(run_file)
+        for row in reader:
+            # the run number breaks ties, which keeps the sort stable
+            heap.append((row_key(row), run_number, row, reader))
+            break
+    heapq.heapify(heap)
+    while heap:
+        _, run_number, row, reader = heap[0]
+        yield row
+        for row in reader:
+            heapq.heapreplace(heap, (row_key(row), run_number, row, reader))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+def _make_row_key(indices, directions, key):
+    columns = []
+    for index, descending in compact.czip(indices, directions):
+        columns.append((index, -1 if descending else 1, descending))
+
+    def row_key(row):
+        length = len(row)
+        sort_key = []
+        for index, na_rank, descending in columns:
+            value = row[index] if index < length else constants.DEFAULT_NA
+            if key is not None:
+                value = key(value)
+            value = _sort_key(value, na_rank)
+            if descending:
+                value = _Descending(value)
+            sort_key.append(value)
+        return tuple(sort_key)
+    return row_key
+
+
+class _Descending(object):
+    """Invert the order of a sort key"""
+    __slots__ = ['value']
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
@@ -0,0 +1,140 @@
+"""
+    pyexcel.internal.tee
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    Write one stream of rows to many destinations
+
+    :copyright: (c) 2014-2017 by Onni Software Ltd.
+    :license: New BSD License, see LICENSE for more details
+"""
+import threading
+from collections import deque
+
+import pyexcel.constants as constants
+from pyexcel.internal.generators import SheetStream
+
+
+class Tee(object):
+    """Split an iterator into several, which may be read by different
+    threads
+
+    The reader that runs out of rows reads the next one from the source
+    for everybody. A reader that is buffer_size rows ahead of the
+    slowest one waits for it. A reader that is closed early is left out
+    from then on.
+    """
+    def __init__(self, source, count,
+                 buffer_size=constants.DEFAULT_TEE_BUFFER):
+        self._source = iter(source)
+        self._buffers = [deque() for _ in range(count)]
+        self._closed = [False] * count
+        self._buffer_size = buffer_size
+        self._fetch_size = max(1, buffer_size // 10)
+        self._condition = threading.Condition()
+        self._finished = False
+        self._error = None
+
+    def readers(self):
+        """One iterator per branch"""
+        return [self._read(index) for index in range(len(self._buffers))]
+
+    def _read(self, index):
+        buffer = self._buffers[index]
+        try:
+            while True:
+                with self._condition:
+                    while not buffer:
+                        if self._error is not None:
+                            raise self._error
+                        if self._finished:
+                            return
+                        if self._is_full():
+                            self._condition.wait()
+                        else:
+                            self._fetch()
+                    # take all that is there to go round the lock less
+                    rows = list(buffer)
+                    buffer.clear()
+                    self._condition.notify_all()
+                for row in rows:
+                    yield row
+        finally:
+            self.close_branch(index)
+
+    def close_branch(self, index):
+        """Leave a branch out from now on, even one never read, so the
+        other branches do not wait for it"""
+        with self._condition:
+            self._closed[index] = True
+            self._buffers[index].clear()
+            self._condition.notify_all()
+
+    def _is_full(self):
+        for buffer, closed in zip(self._buffers, self._closed):
+            if not closed and len(buffer) >= self._buffer_size:
+                return True
+        return False
+
+    def _fetch(self):
+        rows = []
+        try:
+            for row in self._source:
+                rows.append(row)
+                if len(rows) == self._fetch_size:
+                    break
+            else:
+                self._finished = True
+        except Exception as error:
+            self._error = error
+        for buffer, closed in zip(self._buffers, self._closed):
+            if not closed:
+                buffer.extend(rows)
+        self._condition.notify_all()
+
+
+def save_to_many(sheet_stream, destinations,
+                 buffer_size=constants.DEFAULT_TEE_BUFFER):
+    """Write a sheet stream to each of the destinations
+
+    The first destination is written in the calling thread and each of
+    the others in a thread of its own, so the renderers, which read the
+    rows they write, all read the one stream.
+
+    :param destinations: a list of dictionaries of the keywords of
+                         :meth:`pyexcel.isave_as` without 'dest_'
+    :returns: what was saved to each destination, e.g. the io of a
+              destination given by file_type only
+    """
+    if not destinations:
+        raise ValueError(constants.MESSAGE_NO_DESTINATION)
+    tee = Tee(sheet_stream, len(destinations), buffer_size)
+    readers = tee.readers()
+    results = [None] * len(destinations)
+    errors = []
+
+    def write(index):
+        try:
+            results[index] = _save(sheet_stream.name, readers[index],
+                                   destinations[index])
+        except Exception as error:
+            errors.append(error)
+        finally:
+            readers[index].close()
+            tee.close_branch(index)
+
+    threads = [threading.Thread(target=write, args=(index,))
+               for index in range(1, len(destinations))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    write(0)
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def _save(name, rows, destination):
+    from pyexcel.internal.core import save_sheet
+    return save_sheet(SheetStream(name, rows), **destination)
@@ -12,6 +12,10 @@ import pyexcel.constants as constants
 from pyexcel.internal.sheets.matrix import Matrix
 from pyexcel.internal.sheets.row import Row as NamedRow
 from pyexcel.internal.sheets.column import Column as NamedColumn
+from pyexcel.internal.sheets import _shared as utils
+from pyexcel.internal.sheets.index import ColumnIndex
+from pyexcel.internal.sheets.aggregation import GroupBy
+from pyexcel.internal.sheets.join import join_sheets
 
 
 class Sheet(Matrix):
@@ -63,7 +67,8 @@ class Sheet(Matrix):
                  colnames=None,
                  rownames=None,
                  transpose_before=False,
-                 transpose_after=False):
+                 transpose_after=False,
+                 layout=constants.LAYOUT_ROW):
         """Constructor
 
         :param sheet: two dimensional array
@@ -72,10 +77,14 @@ class Sheet(Matrix):
         :param name_rows_by_column: use a column to name all rows
         :param colnames: use an external list of strings to name the columns
         :param rownames: use an external list of strings to name the rows
+        :param layout: 'row' by default. 'columnar' stores the data
+                       column by column, which speeds up column access
+                       and column formatting on long sheets
         """
-        self.__column_names = []
-        self.__row_names = []
+        self.__column_names = IndexedNames()
+        self.__row_names = IndexedNames()
         self.__row_index = 0
+        self.__indexes = {}
         self.init(
             sheet=sheet,
             name=name,
@@ -84,7 +93,8 @@ class Sheet(Matrix):
             colnames=colnames,
             rownames=rownames,
             transpose_before=transpose_before,
-            transpose_after=transpose_after
+            transpose_after=transpose_after,
+            layout=layout
         )
 
     def init(self, sheet=None,
@@ -94,7 +104,8 @@ class Sheet(Matrix):
              colnames=None,
              rownames=None,
              transpose_before=False,
-             transpose_after=False):
+             transpose_after=False,
+             layout=constants.LAYOUT_ROW):
         """custom initialization functions
 
         examples::
@@ -127,10 +138,11 @@ class Sheet(Matrix):
         # this get rid of phatom data by not specifying sheet
         if sheet is None:
             sheet = []
-        Matrix.__init__(self, sheet)
+        self.__indexes = {}
+        Matrix.__init__(self, sheet, layout=layout)
         self.name = name
-        self.__column_names = []
-        self.__row_names = []
+        self.__column_names = IndexedNames()
+        self.__row_names = IndexedNames()
         if transpose_before:
             self.transpose()
         self.row = NamedRow(self)
@@ -142,7 +154,7 @@ class Sheet(Matrix):
             self.name_columns_by_row(name_columns_by_row)
         else:
             if colnames:
-                self.__column_names = colnames
+                self.__column_names = IndexedNames(colnames)
         if name_rows_by_column != -1:
             if rownames:
                 raise NotImplementedError(
@@ -150,7 +162,7 @@ class Sheet(Matrix):
             self.name_rows_by_column(name_rows_by_column)
         else:
             if rownames:
-                self.__row_names = rownames
+                self.__row_names = IndexedNames(rownames)
         if transpose_after:
             self.transpose()
 
@@ -159,6 +171,7 @@ class Sheet(Matrix):
             self.__row_names, self.__column_names
         )
         Matrix.transpose(self)
+        self._invalidate_indexes()
 
     def name_columns_by_row(self, row_index):
         """Use the elements of a specified row to represent individual columns
@@ -167,7 +180,8 @@ class Sheet(Matrix):
         :param row_index: the index of the row that has the column names
         """
         self.__row_index = row_index
-        self.__column_names = make_names_unique(self.row_at(row_index))
+        self.__column_names = IndexedNames(
+            make_names_unique(self.row_at(row_index)))
         del self.row[row_index]
 
     def name_rows_by_column(self, column_index):
@@ -176,7 +190,8 @@ class Sheet(Matrix):
         The specified column will be deleted from the data
         :param column_index: the index of the column that has the row names
         """
-        self.__row_names = make_names_unique(self.column_at(column_index))
+        self.__row_names = IndexedNames(
+            make_names_unique(self.column_at(column_index)))
         del self.column[column_index]
 
     def top(self, lines=5):
@@ -210,7 +225,8 @@ class Sheet(Matrix):
     @colnames.setter
     def colnames(self, value):
         """Set column names"""
-        self.__column_names = make_names_unique(value)
+        self.__column_names = IndexedNames(make_names_unique(value))
+        self._invalidate_indexes()
 
     @property
     def rownames(self):
@@ -220,7 +236,7 @@ class Sheet(Matrix):
     @rownames.setter
     def rownames(self, value):
         """Set row names"""
-        self.__row_names = make_names_unique(value)
+        self.__row_names = IndexedNames(make_names_unique(value))
 
     def named_column_at(self, name):
         """Get a column by its name"""
@@ -230,6 +246,11 @@ class Sheet(Matrix):
         column_array = self.column_at(index)
         return column_array
 
+    def _column_index(self, index):
+        if compact.is_string(type(index)):
+            return self.colnames.index(index)
+        return Matrix._column_index(self, index)
+
     def set_named_column_at(self, name, column_array):
         """
         Take the first row as column names
@@ -247,12 +268,16 @@ class Sheet(Matrix):
 
         :param list column_indices: a list of column indices
         """
+        removed = utils.valid_indices(column_indices,
+                                      self.number_of_columns())
         Matrix.delete_columns(self, column_indices)
+        self._shift_indexes(removed)
         if len(self.__column_names) > 0:
-            new_series = [self.__column_names[i]
-                          for i in range(0, len(self.__column_names))
-                          if i not in column_indices]
-            self.__column_names = new_series
+            to_remove = utils.valid_indices(column_indices,
+                                            len(self.__column_names))
+            self.__column_names = IndexedNames(
+                name for index, name in enumerate(self.__column_names)
+                if index not in to_remove)
 
     def delete_rows(self, row_indices):
         """Delete one or more rows
@@ -260,11 +285,13 @@ class Sheet(Matrix):
         :param list row_indices: a list of row indices
         """
         Matrix.delete_rows(self, row_indices)
+        self._invalidate_indexes()
         if len(self.__row_names) > 0:
-            new_series = [self.__row_names[i]
-                          for i in range(0, len(self.__row_names))
-                          if i not in row_indices]
-            self.__row_names = new_series
+            to_remove = utils.valid_indices(row_indices,
+                                            len(self.__row_names))
+            self.__row_names = IndexedNames(
+                name for index, name in enumerate(self.__row_names)
+                if index not in to_remove)
 
     def delete_named_column_at(self, name):
         """Works only after you named columns by a row
@@ -281,6 +308,7 @@ class Sheet(Matrix):
             index = self.colnames.index(name)
             self.colnames.pop(index)
             Matrix.delete_columns(self, [index])
+            self._shift_indexes(set([index]))
 
     def named_row_at(self, name):
         """Get a row by its name """
@@ -315,6 +343,7 @@ class Sheet(Matrix):
             index = self.rownames.index(name)
             self.rownames.pop(index)
             Matrix.delete_rows(self, [index])
+            self._invalidate_indexes()
 
     def extend_rows(self, rows):
         """Take ordereddict to extend named rows
@@ -322,7 +351,9 @@ class Sheet(Matrix):
         :param ordereddist/list rows: a list of rows.
         """
         incoming_data = []
+        first_new_row = self.number_of_rows()
         if isinstance(rows, compact.OrderedDict):
+            self._check_unique_indexes(list(rows.values()))
             keys = rows.keys()
             for k in keys:
                 self.rownames.append(k)
@@ -332,7 +363,12 @@ class Sheet(Matrix):
             raise TypeError(
                 constants.MESSAGE_DATA_ERROR_ORDEREDDICT_IS_EXPECTED)
         else:
+            if compact.is_array_type(rows, list):
+                self._check_unique_indexes(rows)
+            elif isinstance(rows, list):
+                self._check_unique_indexes([rows])
             Matrix.extend_rows(self, rows)
+        self._index_rows(first_new_row)
 
     def extend_columns_with_rows(self, rows):
         """Put rows on the right most side of the data"""
@@ -340,6 +376,7 @@ class Sheet(Matrix):
             headers = rows.pop(self.__row_index)
             self.__column_names += headers
         Matrix.extend_columns_with_rows(self, rows)
+        self._invalidate_indexes()
 
     def extend_columns(self, columns):
         """Take ordereddict to extend named columns
@@ -358,6 +395,245 @@ class Sheet(Matrix):
                 constants.MESSAGE_DATA_ERROR_ORDEREDDICT_IS_EXPECTED)
         else:
             Matrix.extend_columns(self, columns)
+        self._invalidate_indexes()
+
+    def group_by(self, keys):
+        """Group the rows by the values of one or more columns
+
+        Example::
+
+            >>> import pyexcel as pe
+            >>> sheet = pe.Sheet([
+            ...     ["region", "amount"],
+            ...     ["north", 10], ["south", 5], ["north", 20]],
+            ...     name_columns_by_row=0)
+            >>> summary = sheet.group_by("region").aggregate(
+            ...     {"amount": ["sum", "count"]})
+            >>> summary.colnames
+            ['region', 'amount_sum', 'amount_count']
+            >>> summary.to_array()[1:]
+            [['north', 30, 2], ['south', 5, 1]]
+
+        :param keys: a column name or index, or a list of them
+        :returns: a :class:`~pyexcel.internal.sheets.aggregation.GroupBy`
+                  whose aggregate() gives a new sheet
+        """
+        return GroupBy(self, keys)
+
+    def join(self, other, on, how=constants.JOIN_INNER):
+        """Join with another sheet on the equal values of key columns
+
+        Example::
+
+            >>> import pyexcel as pe
+            >>> orders = pe.Sheet([["id", "qty"], [1, 5], [2, 6], [1, 7]],
+            ...                   name_columns_by_row=0)
+            >>> items = pe.Sheet([["id", "item"], [1, "pen"], [3, "ink"]],
+            ...                  name_columns_by_row=0)
+            >>> orders.join(items, on="id", how="left").to_array()
+            [['id', 'qty', 'item'], [1, 5, 'pen'], [2, 6, ''], [1, 7, 'pen']]
+
+        The hash table is built on the shorter of the two sheets. The
+        result has the columns of this sheet followed by the columns of
+        the other sheet except the keys. Duplicated column names are
+        made unique. Empty key cells match nothing.
+
+        :param other: the sheet to join with
+        :param on: a column name, or index, in both sheets, or a list
+        :param how: 'inner' keeps the matched rows only. 'left' keeps
+                    every row of this sheet. 'outer' keeps every row of
+                    both sheets
+        :returns: a new sheet
+        """
+        rows, colnames = join_sheets(self, other, on, how=how)
+        result = Sheet(rows, name=self.name, layout=self.layout)
+        if colnames:
+            result.colnames = colnames
+        return result
+
+    def create_index(self, column, unique=False):
+        """Index a column by its cell values for :meth:`lookup`
+
+        The index is updated row by row on extend_rows, set_row_at and
+        cell writes, and rebuilt on first use after any other change.
+        Example::
+
+            >>> import pyexcel as pe
+            >>> sheet = pe.Sheet([["sku", "qty"], ["A1", 1], ["B2", 2]],
+            ...                  name_columns_by_row=0)
+            >>> sheet.create_index("sku", unique=True)
+            >>> sheet.lookup("sku", "B2")
+            [['B2', 2]]
+            >>> sheet.row += [["C3", 3]]
+            >>> sheet.lookup("sku", "C3")
+            [['C3', 3]]
+
+        :param column: a column name or a column index. The index is
+                       kept by the position of the column, so it serves
+                       the column by either
+        :param bool unique: if True, ValueError is raised when a value
+                            appears a second time in the column
+        """
+        position = self._column_index(column)
+        index = ColumnIndex(column, unique=unique)
+        index.build(self.column_at(position))
+        self.__indexes[position] = index
+
+    def drop_index(self, column):
+        """Remove the index made by :meth:`create_index`"""
+        del self.__indexes[self._column_index(column)]
+
+    def lookup(self, column, value):
+        """Get the rows whose cell in the column equals the value
+
+        The index of the column is used if there is one. Otherwise
+        the column is scanned.
+
+        :param column: a column name or a column index
+        :param value: the cell value to look for
+        """
+        return [self.row_at(position)
+                for position in self._row_positions(column, value)]
+
+    def cell_value(self, row, column, new_value=None):
+        """Random access to table cells
+
+        A new value is checked against, and put into, the index of its
+        column, if there is one.
+
+        :param int row: row index which starts from 0
+        :param int column: column index which starts from 0
+        :param any new_value: new value if this is to set the value
+        """
+        if new_value is None or not self.__indexes:
+            return Matrix.cell_value(self, row, column, new_value)
+        if row not in self.row_range() or column not in self.column_range():
+            Matrix.cell_value(self, row, column, new_value)
+            self._invalidate_indexes()
+            return
+        indexes = [index for index, position in self._indexed_columns()
+                   if position == column]
+        old_value = Matrix.cell_value(self, row, column)
+        if old_value != new_value:
+            for index in indexes:
+                index.check([new_value])
+        Matrix.cell_value(self, row, column, new_value)
+        for index in indexes:
+            index.remove(old_value, row)
+            index.add(new_value, row)
+
+    def set_row_at(self, row_index, data_array):
+        """Update a row data range
+
+        The indexes are updated for the row, after its new values are
+        checked against the unique ones.
+        """
+        indexes = self._indexed_columns()
+        if not indexes or row_index not in self.row_range():
+            Matrix.set_row_at(self, row_index, data_array)
+            return
+        old_row = self.row_at(row_index)
+        for index, position in indexes:
+            new_value = constants.DEFAULT_NA
+            if position < len(data_array) and data_array[position] is not None:
+                new_value = data_array[position]
+            if new_value != old_row[position]:
+                index.check([new_value])
+        Matrix.set_row_at(self, row_index, data_array)
+        new_row = self.row_at(row_index)
+        for index, position in indexes:
+            index.remove(old_row[position], row_index)
+            index.add(new_row[position], row_index)
+
+    def set_column_at(self, column_index, data_array, starting=0):
+        """Updates a column data range, as
+        :meth:`~pyexcel.internal.sheets.matrix.Matrix.set_column_at` does,
+        after which the indexes are rebuilt on next use
+        """
+        Matrix.set_column_at(self, column_index, data_array, starting)
+        self._invalidate_indexes()
+
+    def paste(self, topleft_corner, rows=None, columns=None):
+        """Paste a rectangle shaped data after a position, as
+        :meth:`~pyexcel.internal.sheets.matrix.Matrix.paste` does, after
+        which the indexes are rebuilt on next use
+        """
+        Matrix.paste(self, topleft_corner, rows=rows, columns=columns)
+        self._invalidate_indexes()
+
+    def map(self, custom_function, executor=None):
+        """Execute a function across all cells of the sheet, as
+        :meth:`~pyexcel.internal.sheets.matrix.Matrix.map` does, after
+        which the indexes are rebuilt on next use
+        """
+        Matrix.map(self, custom_function, executor=executor)
+        self._invalidate_indexes()
+
+    def _format_column(self, index, converter):
+        Matrix._format_column(self, index, converter)
+        self._invalidate_indexes()
+
+    def _format_row(self, index, converter):
+        Matrix._format_row(self, index, converter)
+        self._invalidate_indexes()
+
+    def _reorder_rows(self, positions):
+        Matrix._reorder_rows(self, positions)
+        if len(self.__row_names) > 0:
+            self.__row_names = IndexedNames(
+                self.__row_names[position] for position in positions)
+        self._invalidate_indexes()
+
+    def _row_positions(self, column, value):
+        index = self._get_index(column)
+        if index is None:
+            return Matrix._row_positions(self, column, value)
+        return index.get(value)
+
+    def _get_index(self, column):
+        try:
+            position = self._column_index(column)
+        except (ValueError, IndexError):
+            return None
+        index = self.__indexes.get(position)
+        if index is not None and index.stale:
+            index.build(self.column_at(position))
+        return index
+
+    def _indexed_columns(self):
+        """The up to date indexes with the positions of their columns"""
+        return [(index, position)
+                for position, index in self.__indexes.items()
+                if not index.stale]
+
+    def _shift_indexes(self, removed):
+        """Move the indexes along after the columns were removed"""
+        indexes = {}
+        for position, index in self.__indexes.items():
+            if position in removed:
+                continue
+            index.stale = True
+            indexes[position - len([gone for gone in removed
+                                    if gone < position])] = index
+        self.__indexes = indexes
+
+    def _check_unique_indexes(self, rows):
+        for index, position in self._indexed_columns():
+            if index.unique:
+                index.check([row[position] for row in rows
+                             if position < len(row)])
+
+    def _index_rows(self, first_row):
+        """Add the rows from first_row onwards to the indexes"""
+        for index, position in self._indexed_columns():
+            cells = self.region((first_row, position),
+                                (self.number_of_rows(), position + 1))
+            for row_index, cell in enumerate(cells, first_row):
+                index.add(cell[0], row_index)
+
+    def _invalidate_indexes(self):
+        for index in self.__indexes.values():
+            index.stale = True
 
     def to_array(self):
         """Returns an array after filtering"""
@@ -482,6 +758,109 @@ class _RepresentedString(object):
         return self.text
 
 
+class IndexedNames(list):
+    """A list of column or row names which finds a name in O(1)
+
+    The positions are kept in a dictionary, which is built on the first
+    look up and dropped whenever the list is changed in place.
+    """
+    # unpickling extends the list before it restores the attributes
+    _positions = None
+
+    def __init__(self, names=()):
+        list.__init__(self, names)
+        self._positions = None
+
+    def index(self, name, *args):
+        if args:
+            return list.index(self, name, *args)
+        try:
+            return self._get_positions()[name]
+        except KeyError:
+            raise ValueError("%r is not in list" % (name,))
+        except TypeError:
+            # unhashable names are not in the dictionary
+            return list.index(self, name)
+
+    def __contains__(self, name):
+        try:
+            return name in self._get_positions()
+        except TypeError:
+            return list.__contains__(self, name)
+
+    def _get_positions(self):
+        if self._positions is None:
+            positions = {}
+            for index, name in enumerate(self):
+                try:
+                    positions.setdefault(name, index)
+                except TypeError:
+                    pass
+            self._positions = positions
+        return self._positions
+
+    def append(self, name):
+        if self._positions is not None:
+            try:
+                self._positions.setdefault(name, len(self))
+            except TypeError:
+                pass
+        list.append(self, name)
+
+    def extend(self, names):
+        for name in names:
+            self.append(name)
+
+    def __iadd__(self, names):
+        self.extend(names)
+        return self
+
+    def __setitem__(self, index, name):
+        self._positions = None
+        list.__setitem__(self, index, name)
+
+    def __delitem__(self, index):
+        self._positions = None
+        list.__delitem__(self, index)
+
+    def insert(self, index, name):
+        self._positions = None
+        list.insert(self, index, name)
+
+    def pop(self, *args):
+        self._positions = None
+        return list.pop(self, *args)
+
+    def remove(self, name):
+        self._positions = None
+        list.remove(self, name)
+
+    def reverse(self):
+        self._positions = None
+        list.reverse(self)
+
+    def sort(self, *args, **kwargs):
+        self._positions = None
+        list.sort(self, *args, **kwargs)
+
+    def __imul__(self, times):
+        self._positions = None
+        return list.__imul__(self, times)
+
+    if compact.PY2:
+        def __setslice__(self, start, stop, names):
+            self._positions = None
+            list.__setslice__(self, start, stop, names)
+
+        def __delslice__(self, start, stop):
+            self._positions = None
+            list.__delslice__(self, start, stop)
+    else:
+        def clear(self):
+            self._positions = None
+            list.clear(self)
+
+
 def make_names_unique(alist):
     """Append the number of occurences to duplicated names"""
     duplicates = {}
@@ -71,6 +71,7 @@ EXTRAS_REQUIRE = {
     'xls': ['pyexcel-xls>=0.4.0'],
     'xlsx': ['pyexcel-xlsx>=0.4.0'],
     'ods': ['pyexcel-ods3>=0.4.0'],
+    'numpy': ['numpy'],
 }
 
 
@@ -0,0 +1,127 @@
+import os
+import sys
+import asyncio
+from textwrap import dedent
+
+import pyexcel as pe
+from nose.tools import eq_, raises
+from nose.plugins.skip import SkipTest
+
+if sys.version_info < (3, 5):
+    raise SkipTest("pyexcel.aio needs python 3.5")
+
+import pyexcel.aio as aio  # noqa: E402
+import pyexcel.internal.garbagecollector as gc  # noqa: E402
+
+
+def _collect(async_iterator):
+    # what "async for" does, written for the older parsers
+    loop = asyncio.get_event_loop()
+    items = []
+    iterator = async_iterator.__aiter__()
+    while True:
+        try:
+            items.append(loop.run_until_complete(iterator.__anext__()))
+        except StopAsyncIteration:
+            return items
+
+
+class TestAio:
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.test_file = 'test_aio.csv'
+        with open(self.test_file, 'w') as f:
+            f.write(dedent("""\
+            a,b
+            1,2
+            3,4
+            5,6"""))
+
+    def tearDown(self):
+        pe.free_resources()
+        os.unlink(self.test_file)
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def test_get_sheet(self):
+        sheet = self.loop.run_until_complete(
+            aio.get_sheet(file_name=self.test_file))
+        eq_(sheet.to_array(), [['a', 'b'], [1, 2], [3, 4], [5, 6]])
+
+    def test_get_records(self):
+        records = self.loop.run_until_complete(
+            aio.get_records(file_name=self.test_file))
+        eq_(records[0], {'a': 1, 'b': 2})
+
+    def test_aiget_records(self):
+        records = _collect(aio.aiget_records(file_name=self.test_file,
+                                             batch_size=2,
+                                             record_type='tuple'))
+        eq_(records, [(1, 2), (3, 4), (5, 6)])
+
+    def test_aiget_array(self):
+        rows = _collect(aio.aiget_array(file_name=self.test_file))
+        eq_(rows, [['a', 'b'], [1, 2], [3, 4], [5, 6]])
+
+    def test_interleaved_iterators(self):
+        other_file = 'test_aio_other.csv'
+        with open(other_file, 'w') as f:
+            f.write("x\n7\n8\n9")
+        try:
+            first = aio.aiget_array(file_name=self.test_file, batch_size=1)
+            second = aio.aiget_array(file_name=other_file, batch_size=1)
+            eq_(self.loop.run_until_complete(first.__anext__()), ['a', 'b'])
+            eq_(self.loop.run_until_complete(second.__anext__()), ['x'])
+            eq_(len(gc.GARBAGE), 2)
+            eq_(_collect(first), [[1, 2], [3, 4], [5, 6]])
+            eq_(len(gc.GARBAGE), 1)
+            eq_(_collect(second), [[7], [8], [9]])
+            eq_(gc.GARBAGE, [])
+        finally:
+            os.unlink(other_file)
+
+    def test_aclose(self):
+        iterator = aio.aiget_array(file_name=self.test_file, batch_size=1)
+        eq_(self.loop.run_until_complete(iterator.__anext__()), ['a', 'b'])
+        eq_(len(gc.GARBAGE), 1)
+        self.loop.run_until_complete(iterator.aclose())
+        eq_(gc.GARBAGE, [])
+        eq_(_collect(iterator), [])
+
+    def test_sheet_stream(self):
+        stream = pe.iget_sheet(file_name=self.test_file,
+                               name_columns_by_row=0)
+        rows = _collect(stream.select(['b']))
+        eq_(rows, [['b'], [2], [4], [6]])
+
+    def test_iterator_is_lazy(self):
+        seen = []
+
+        def rows():
+            for index in range(5):
+                seen.append(index)
+                yield index
+        iterator = aio.AsyncIterator(rows, batch_size=2)
+        eq_(seen, [])
+        eq_(self.loop.run_until_complete(iterator.__anext__()), 0)
+        eq_(seen, [0, 1])
+
+    @raises(ZeroDivisionError)
+    def test_iterator_raises(self):
+        def rows():
+            yield 1 / 0
+        _collect(aio.AsyncIterator(rows))
+
+    def test_asave_as(self):
+        io = self.loop.run_until_complete(
+            aio.asave_as(array=[[1, 2]], dest_file_type='csv',
+                         dest_lineterminator='\n'))
+        eq_(io.getvalue(), '1,2\n')
+
+    def test_asave_book_as(self):
+        io = self.loop.run_until_complete(
+            aio.asave_book_as(bookdict={'s': [[1, 2]]},
+                              dest_file_type='csv',
+                              dest_lineterminator='\n'))
+        eq_(io.getvalue(), '1,2\n')
@@ -237,6 +237,25 @@ class TestCookbook:
         content3 = r[self.testfile3].to_dict()
         assert content3 == self.content3
 
+    def test_merge_any_files_in_processes(self):
+        file_array = [self.testfile4, self.testfile]
+        pe.cookbook.merge_all_to_a_book(file_array, "merged.xlsx",
+                                        workers=2, executor="process")
+        r = pe.BookReader("merged.xlsx")
+        eq_(r.sheet_names(), ["Sheet1", "Sheet2", "Sheet3", self.testfile])
+        eq_(r["Sheet2"].to_array(), self.content4["Sheet2"])
+        r[self.testfile].name_columns_by_row(0)
+        eq_(r[self.testfile].to_dict(), self.content)
+
+    def test_merge_csv_files_in_processes(self):
+        file_array = [self.testfile, self.testfile3, self.testfile2]
+        pe.cookbook.merge_csv_to_a_book(file_array, "merged.xlsx",
+                                        workers=2, executor="process")
+        r = pe.BookReader("merged.xlsx")
+        eq_(r.sheet_names(), file_array)
+        r[self.testfile3].name_columns_by_row(0)
+        eq_(r[self.testfile3].to_dict(), self.content3)
+
     def tearDown(self):
         file_list = [
             self.testfile,
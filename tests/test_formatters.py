@@ -1,7 +1,9 @@
+import copy
 import datetime
 from unittest import TestCase
+from nose.plugins.skip import SkipTest
 from pyexcel.internal.sheets import formatters
-from pyexcel import save_as, SeriesReader, get_sheet
+from pyexcel import save_as, SeriesReader, get_sheet, Sheet
 from base import clean_up_files
 
 
@@ -389,6 +391,55 @@ class TestRowFormatter(TestCase):
         clean_up_files([self.testfile])
 
 
+class TestColumnFunctionMap(TestCase):
+    def setUp(self):
+        self.content = [
+            ["name", "price", "qty"],
+            ["a", "1.5", "2"],
+            ["b", "2.25", "3"]
+        ]
+
+    def test_map_by_index(self):
+        s = Sheet(self.content)
+        s.map({1: str.upper, 2: len})
+        self.assertEqual(s.row[0], ["name", "PRICE", 3])
+
+    def test_format_by_name(self):
+        s = Sheet(self.content, name_columns_by_row=0)
+        s.format({"price": float, "qty": int})
+        self.assertEqual(s.to_array(), [
+            ["name", "price", "qty"],
+            ["a", 1.5, 2],
+            ["b", 2.25, 3]
+        ])
+
+    def test_format_by_name_in_columnar_layout(self):
+        s = Sheet(self.content, name_columns_by_row=0, layout="columnar")
+        s.format({"price": float, 2: int})
+        self.assertEqual(s.row[1], ["b", 2.25, 3])
+
+    def test_unknown_column(self):
+        s = Sheet(self.content, name_columns_by_row=0)
+        self.assertRaises(ValueError, s.map, {"unknown": float})
+        self.assertRaises(IndexError, s.map, {3: float})
+
+    def test_executor(self):
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+        except ImportError:
+            raise SkipTest("concurrent.futures is not available")
+        content = [[i, i + 0.5] for i in range(10001)]
+        expected = [[i + 1.0, i + 1.5] for i in range(10001)]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for layout in ["row", "columnar"]:
+                s = Sheet(copy.deepcopy(content), layout=layout)
+                s.map(increase_float_func, executor=executor)
+                self.assertEqual(s.to_array(), expected)
+            s = Sheet(copy.deepcopy(content))
+            s.format({1: int}, executor=executor)
+            self.assertEqual(s.row[10000], [10000, 10000])
+
+
 class TestSheetFormatter(TestCase):
     def setUp(self):
         self.data = {
@@ -21,3 +21,18 @@ def test_gc_custom():
     eq_(len(gc.GARBAGE), 1)
     gc.free_resources()
     assert len(gc.GARBAGE) == 0
+
+
+def test_gc_since():
+    gc.free_resources()
+    f = open(os.path.join("tests", "fixtures", "bug_01.csv"), 'r')
+    gc.append(f)
+    position = gc.mark()
+    g = open(os.path.join("tests", "fixtures", "bug_01.csv"), 'r')
+    gc.append(g)
+    gc.free_resources_since(position)
+    assert g.closed
+    assert not f.closed
+    eq_(len(gc.GARBAGE), 1)
+    gc.free_resources()
+    assert f.closed
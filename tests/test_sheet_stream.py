@@ -1,4 +1,4 @@
-from nose.tools import eq_
+from nose.tools import eq_, raises
 from textwrap import dedent
 import pyexcel_io.manager as manager
 from pyexcel.internal.generators import SheetStream
@@ -27,3 +27,199 @@ def test_get_sheet_headers():
     sheet_stream = SheetStream('test', data)
     colnames_array = get_sheet_headers(sheet_stream)
     eq_(colnames_array, ['a', 'b', 'c'])
+
+
+def test_stream_pipeline():
+    import pyexcel as pe
+    data = [['id', 'price'], [1, '2.5'], [2, ''], [3, '4']]
+    stream = pe.iget_sheet(array=data, name_columns_by_row=0)
+    cleaned = (stream.select(['price', 'id'])
+               .filter(lambda row: row[0] != '')
+               .map({'price': float})
+               .rename({'price': 'cost'}))
+    eq_(list(cleaned), [['cost', 'id'], [2.5, 1], [4.0, 3]])
+
+
+def test_stream_pipeline_by_index():
+    import pyexcel as pe
+    data = [[1, 2, 3], [4, 5, 6]]
+    stream = pe.iget_sheet(array=data).select([2, 0]).map(str)
+    eq_(list(stream), [['3', '1'], ['6', '4']])
+
+
+def test_stream_pipeline_is_lazy():
+    seen = []
+
+    def rows():
+        for index in range(3):
+            seen.append(index)
+            yield [index]
+    stream = SheetStream('test', rows()).map(lambda value: value * 2)
+    eq_(seen, [])
+    eq_(next(iter(stream)), [0])
+    eq_(seen, [0])
+
+
+def test_stream_pipeline_save_as():
+    import pyexcel as pe
+    data = [['a', 'b'], [1, 2], [3, 4]]
+    stream = pe.iget_sheet(array=data, name_columns_by_row=0)
+    stream = stream.filter(lambda row: row[0] > 1).rename({'a': 'x'})
+    io = pe.isave_as(array=stream, dest_file_type='csv',
+                     dest_lineterminator='\n')
+    eq_(io.getvalue(), 'x,b\n3,4\n')
+    pe.free_resources()
+
+
+@raises(ValueError)
+def test_stream_rename_without_column_names():
+    import pyexcel as pe
+    pe.iget_sheet(array=[[1, 2]]).rename({1: 'a'})
+
+
+@raises(ValueError)
+def test_stream_select_name_without_column_names():
+    import pyexcel as pe
+    list(pe.iget_sheet(array=[[1, 2]]).select(['a']))
+
+
+def test_stream_batches():
+    stream = SheetStream('test', iter([[1], [2], [3]]))
+    eq_(list(stream.batches(2)), [[[1], [2]], [[3]]])
+
+
+def test_stream_sort_in_runs():
+    import random
+    import pyexcel as pe
+    random.seed(0)
+    data = [[random.randint(0, 20), random.choice(['a', 'b', '']), index]
+            for index in range(100)]
+    expected = pe.Sheet([list(row) for row in data])
+    expected.sort(by=[0, 1], reverse=[False, True])
+    stream = SheetStream('test', iter(data))
+    result = stream.sort(by=[0, 1], reverse=[False, True], run_size=7)
+    eq_(list(result), expected.to_array())
+
+
+def test_stream_sort_by_name():
+    import pyexcel as pe
+    data = [['id', 'name'], [2, 'b'], ['', 'c'], [1, 'a'], ['x', 'd']]
+    stream = pe.iget_sheet(array=data, name_columns_by_row=0)
+    result = stream.sort(by='id', reverse=True, run_size=2)
+    eq_(list(result),
+        [['id', 'name'], ['x', 'd'], [2, 'b'], [1, 'a'], ['', 'c']])
+
+
+def test_stream_sort_with_key():
+    stream = SheetStream('test', iter([['b'], ['C'], ['a']]))
+    eq_(list(stream.sort(key=lambda value: value.lower())),
+        [['a'], ['b'], ['C']])
+
+
+def test_stream_sort_nothing():
+    eq_(list(SheetStream('test', iter([])).sort()), [])
+
+
+def test_stream_aggregate_with_spills():
+    import random
+    import pyexcel as pe
+    random.seed(0)
+
+    def joined(values):
+        return ','.join(map(str, values))
+    data = [['shop', 'day', 'amount']] + [
+        [random.randint(0, 40), random.choice(['mon', 'tue']),
+         random.choice([1, 2.5, ''])]
+        for _ in range(500)]
+    aggregations = {'amount': ['sum', 'count', 'mean', 'max', 'first',
+                               'last', joined]}
+    sheet = pe.Sheet([list(row) for row in data], name_columns_by_row=0)
+    expected = sheet.group_by(['shop', 'day']).aggregate(aggregations)
+    stream = pe.iget_sheet(array=data, name_columns_by_row=0)
+    result = stream.aggregate(['shop', 'day'], aggregations, max_groups=3)
+    eq_(list(result), expected.to_array())
+
+
+def test_stream_aggregate_without_names():
+    stream = SheetStream('test', iter([[1, 2], [1, 3], [2, 4]]))
+    eq_(list(stream.aggregate(0, {1: 'sum'}, max_groups=1)),
+        [[1, 5], [2, 4]])
+
+
+def test_iaggregate():
+    import pyexcel as pe
+    data = [['shop', 'amount'], ['a', 1], ['b', 2], ['a', 3]]
+    result = pe.iaggregate(array=data, keys='shop',
+                           aggregations={'amount': 'sum'})
+    eq_(list(result), [['shop', 'amount'], ['a', 4], ['b', 2]])
+
+
+def test_stream_join():
+    import pyexcel as pe
+    data = [['id', 'customer'], [1, 'a'], [2, 'x'], [1, 'b'], ['', 'c']]
+    lookup = pe.Sheet([['customer', 'city'], ['a', 'Rome'], ['b', 'Oslo'],
+                       ['z', 'Riga']], name_columns_by_row=0)
+    for how in ['inner', 'left', 'outer']:
+        sheet = pe.Sheet([list(row) for row in data], name_columns_by_row=0)
+        expected = sheet.join(lookup, on='customer', how=how)
+        stream = pe.iget_sheet(array=data, name_columns_by_row=0)
+        eq_(list(stream.join(lookup, on='customer', how=how)),
+            expected.to_array())
+
+
+def test_stream_join_by_index():
+    import pyexcel as pe
+    lookup = pe.Sheet([[1, 'one'], [2, 'two']])
+    stream = SheetStream('test', iter([[2, 'b'], [3, 'c']]))
+    eq_(list(stream.join(lookup, on=0, how='left')),
+        [[2, 'b', 'two'], [3, 'c', '']])
+
+
+def test_ijoin():
+    import pyexcel as pe
+    lookup = pe.Sheet([['k', 'v'], [1, 'one']], name_columns_by_row=0)
+    result = pe.ijoin(array=[['k', 'n'], [1, 5], [2, 6]], lookup=lookup,
+                      on='k', name_columns_by_row=0)
+    eq_(list(result), [['k', 'n', 'v'], [1, 5, 'one']])
+
+
+def test_ijoin_colliding_column_names():
+    import pyexcel as pe
+    data = [['id', 'x'], [1, 'a'], [2, 'b']]
+    lookup = pe.Sheet([['id', 'x'], [1, 'one']], name_columns_by_row=0)
+    sheet = pe.Sheet([list(row) for row in data], name_columns_by_row=0)
+    expected = sheet.join(lookup, on='id', how='left')
+    result = list(pe.ijoin(array=data, lookup=lookup, on='id', how='left',
+                           name_columns_by_row=0))
+    eq_(result[0], ['id', 'x', 'x-1'])
+    eq_(result, expected.to_array())
+    pe.free_resources()
+
+
+def test_ijoin_ragged_rows():
+    import pyexcel as pe
+    data = [['id', 'qty', 'note'], [1, 5], [2, 6, 'spare']]
+    lookup = pe.Sheet([['id', 'item'], [1, 'pen'], [3, 'ink']],
+                      name_columns_by_row=0)
+    for how in ['inner', 'left', 'outer']:
+        sheet = pe.Sheet([list(row) for row in data], name_columns_by_row=0)
+        expected = sheet.join(lookup, on='id', how=how)
+        result = pe.ijoin(array=data, lookup=lookup, on='id', how=how,
+                          name_columns_by_row=0)
+        eq_(list(result), expected.to_array())
+    pe.free_resources()
+
+
+def test_stream_join_pads_to_the_widest_row():
+    import pyexcel as pe
+    lookup = pe.Sheet([[1, 'one'], [2, 'two']])
+    stream = SheetStream('test', iter([[2, 'b', 'x'], [1]]))
+    eq_(list(stream.join(lookup, on=0, how='left')),
+        [[2, 'b', 'x', 'two'], [1, '', '', 'one']])
+
+
+@raises(ValueError)
+def test_stream_join_unknown():
+    import pyexcel as pe
+    stream = SheetStream('test', iter([[1]]))
+    list(stream.join(pe.Sheet([[1]]), on=0, how='cross'))
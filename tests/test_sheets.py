@@ -2,6 +2,7 @@ from pyexcel import Sheet
 from pyexcel import load_from_dict, load_from_records
 from _compact import OrderedDict
 from nose.tools import raises, eq_
+from nose.plugins.skip import SkipTest
 import copy
 
 
@@ -625,3 +626,522 @@ class TestSheetTops:
             ["row 5", 41, 2, 3, 4, 5]
         ]
         eq_(top_sheet.array, expected)
+
+
+class TestColumnarLayout:
+    def setUp(self):
+        self.data = [
+            ["a", "b", "c"],
+            [1, 2, 3],
+            [4, None],
+            [7, 8, 9]
+        ]
+
+    def test_same_content_as_row_layout(self):
+        s = Sheet(copy.deepcopy(self.data), layout="columnar")
+        s2 = Sheet(copy.deepcopy(self.data))
+        eq_(s.layout, "columnar")
+        eq_(s.array, s2.array)
+        eq_(s.array[2], [4, '', ''])
+
+    def test_named_column_access(self):
+        s = Sheet(self.data, name_columns_by_row=0, layout="columnar")
+        eq_(s.column["b"], [2, '', 8])
+        eq_(s.to_dict()["c"], [3, '', 9])
+
+    def test_column_format(self):
+        s = Sheet(self.data, name_columns_by_row=0, layout="columnar")
+        s.column.format("a", str)
+        eq_(s.column["a"], ["1", "4", "7"])
+        s.format(str)
+        eq_(s.row[0], ["1", "2", "3"])
+
+    def test_cell_and_row_updates(self):
+        s = Sheet(self.data, layout="columnar")
+        s[1, 1] = 22
+        s.row[2] = [5, 5, 5, 5]
+        s.row += [[10]]
+        eq_(s.array, [
+            ["a", "b", "c", ""],
+            [1, 22, 3, ""],
+            [5, 5, 5, 5],
+            [7, 8, 9, ""],
+            [10, "", "", ""]
+        ])
+
+    def test_column_updates(self):
+        s = Sheet(self.data, layout="columnar")
+        del s.column[1]
+        s.column += [["d", 0, 0, 0, 0]]
+        eq_(s.array, [
+            ["a", "c", "d"],
+            [1, 3, 0],
+            [4, "", 0],
+            [7, 9, 0],
+            ["", "", 0]
+        ])
+
+    def test_transpose(self):
+        s = Sheet([[1, 2, 3], [4, 5, 6]], layout="columnar")
+        s.transpose()
+        eq_(s.array, [[1, 4], [2, 5], [3, 6]])
+        eq_(s.number_of_columns(), 2)
+
+    def test_delete_all_rows_then_extend(self):
+        layouts = ["row", "columnar"]
+        try:
+            import numpy  # noqa: F401
+            layouts.append("numpy")
+        except ImportError:
+            pass
+        for layout in layouts:
+            s = Sheet([[1, 2, 3], [4, 5, 6]], layout=layout)
+            s.delete_rows([0, 1])
+            eq_(s.number_of_columns(), 0)
+            s.extend_rows([[7]])
+            eq_(s.array, [[7]])
+            s2 = Sheet([[1, 2, 3]], layout=layout)
+            del s2.row[0]
+            s2.row += [[8]]
+            eq_(s2.array, [[8]])
+
+    def test_unknown_layout(self):
+        try:
+            Sheet([[1]], layout="diagonal")
+            assert False
+        except ValueError:
+            pass
+
+
+class TestNumpyLayout:
+    def setUp(self):
+        try:
+            import numpy
+            self.numpy = numpy
+        except ImportError:
+            raise SkipTest("numpy is not installed")
+        self.data = [
+            ["a", "b", "c"],
+            [1, 2.5, "x"],
+            [3, 4.0, None],
+            [5, 6.25, "z"]
+        ]
+
+    def test_numeric_columns_in_arrays(self):
+        s = Sheet(self.data[1:], layout="numpy")
+        columns = s.get_internal_array().columns
+        assert isinstance(columns[0], self.numpy.ndarray)
+        assert isinstance(columns[1], self.numpy.ndarray)
+        eq_(columns[2], ["x", "", "z"])
+
+    def test_round_trip(self):
+        s = Sheet(copy.deepcopy(self.data), layout="numpy")
+        eq_(s.to_array(), Sheet(copy.deepcopy(self.data)).to_array())
+        assert type(s[1, 0]) is int
+        assert type(s.column[1][1]) is float
+
+    def test_format(self):
+        s = Sheet(self.data, name_columns_by_row=0, layout="numpy")
+        s.column.format("b", int)
+        eq_(s.column["b"], [2, 4, 6])
+        s.format(float)
+        eq_(s.row[0], [1.0, 2.0, "x"])
+
+    def test_ufunc(self):
+        s = Sheet([[1, 4], [9, 16]], layout="numpy")
+        s.map(self.numpy.sqrt)
+        eq_(s.array, [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_transpose_and_region(self):
+        s = Sheet([[1, 2, 3], [4, 5, 6]], layout="numpy")
+        s.transpose()
+        eq_(s.array, [[1, 4], [2, 5], [3, 6]])
+        eq_(s.region((1, 0), (3, 1)), [[2], [3]])
+
+    def test_mixed_writes(self):
+        s = Sheet([[1, 2], [3, 4]], layout="numpy")
+        s[0, 0] = "one"
+        s.row += [[5, 6]]
+        del s.row[1]
+        eq_(s.array, [["one", 2], [5, 6]])
+
+    def test_write_beyond_int64(self):
+        s = Sheet([[1], [2]], layout="numpy")
+        s[0, 0] = 2 ** 70
+        s[1, 0] = -2 ** 70
+        eq_(s.array, [[2 ** 70], [-2 ** 70]])
+        s.map(self.numpy.negative)
+        eq_(s.array, [[-2 ** 70], [2 ** 70]])
+
+
+class TestViews:
+    def setUp(self):
+        self.data = [
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 9]
+        ]
+
+    def test_row_view_follows_the_sheet(self):
+        s = Sheet(self.data)
+        view = s.row_view(1)
+        eq_(view, [4, 5, 6])
+        s[1, 0] = 10
+        eq_(view[0], 10)
+        eq_(view[-1], 6)
+        eq_(len(view), 3)
+
+    def test_write_to_row_view_is_copied(self):
+        s = Sheet(self.data)
+        view = s.row_view(0)
+        view[0] = 100
+        assert view.is_copied()
+        eq_(view, [100, 2, 3])
+        eq_(s.row[0], [1, 2, 3])
+
+    @raises(IndexError)
+    def test_row_view_out_of_range(self):
+        s = Sheet(self.data)
+        s.row_view(3)
+
+    def test_region_view(self):
+        for layout in ["row", "columnar"]:
+            s = Sheet(copy.deepcopy(self.data), layout=layout)
+            view = s.region_view((1, 1), (5, 5))
+            eq_(len(view), 2)
+            eq_(view, [[5, 6], [8, 9]])
+            eq_(view[-1][0], 8)
+            eq_(view[0:1], [[5, 6]])
+            eq_(view.to_array(), s.region((1, 1), (5, 5)))
+
+    def test_row_at_is_a_copy(self):
+        s = Sheet(self.data)
+        row = s.row_at(0)
+        row[0] = 100
+        eq_(s.row[0], [1, 2, 3])
+
+
+class TestIncrementalUniform:
+    def test_extend_rows(self):
+        for layout in ["row", "columnar"]:
+            s = Sheet([[1, 2], [3, None]], layout=layout)
+            s.extend_rows([[None]])
+            eq_(s.to_array(), [[1, 2], [3, ""], ["", ""]])
+            s.extend_rows([[4, 5, None]])
+            eq_(s.number_of_columns(), 3)
+            eq_(s.to_array(),
+                [[1, 2, ""], [3, "", ""], ["", "", ""], [4, 5, ""]])
+
+    def test_set_row_and_column(self):
+        for layout in ["row", "columnar"]:
+            s = Sheet([[1, 2], [3, 4]], layout=layout)
+            s.row[0] = [None]
+            s.set_column_at(1, [None, 5, None])
+            eq_(s.to_array(), [["", ""], [3, 5], ["", ""]])
+
+    def test_emptied_sheet_takes_new_width(self):
+        s = Sheet([[1, 2, 3]])
+        del s.row[0]
+        s.extend_rows([[1]])
+        eq_(s.number_of_columns(), 1)
+
+
+class TestIndexedNames:
+    def setUp(self):
+        self.data = [
+            ["a", "b", "c"],
+            [1, 2, 3],
+            [4, 5, 6]
+        ]
+
+    def test_pickle(self):
+        import pickle
+        s = Sheet([["", "a", "b"], ["r1", 1, 2], ["r2", 3, 4]],
+                  name_columns_by_row=0, name_rows_by_column=0)
+        s.colnames.index("b")
+        s2 = pickle.loads(pickle.dumps(s))
+        eq_(s2.colnames, ["a", "b"])
+        eq_(s2.rownames, ["r1", "r2"])
+        eq_(s2.colnames.index("b"), 1)
+        eq_(s2.row["r2"], [3, 4])
+        s2.colnames.append("c")
+        eq_(s2.colnames.index("c"), 2)
+
+    def test_lookup_after_changes(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        eq_(s.colnames.index("c"), 2)
+        assert "b" in s.colnames
+        del s.column["a"]
+        eq_(s.colnames.index("c"), 1)
+        eq_(s.column["c"], [3, 6])
+        s.extend_columns(OrderedDict([("d", [7, 8])]))
+        eq_(s.colnames.index("d"), 2)
+        eq_(s[1, "d"], 8)
+        s.colnames[0] = "x"
+        eq_(s.colnames.index("x"), 0)
+        assert "b" not in s.colnames
+
+    @raises(ValueError)
+    def test_unknown_name(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.colnames.index("z")
+
+    def test_transpose_and_delete_rows(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.transpose()
+        eq_(s.rownames.index("b"), 1)
+        s.delete_rows([0, 1])
+        eq_(s.rownames, ["c"])
+        eq_(s.row["c"], [3, 6])
+
+
+class TestBulkDeletion:
+    def setUp(self):
+        self.data = [[i, i * 10, i * 100] for i in range(10)]
+
+    def test_delete_rows_in_all_layouts(self):
+        for layout in ["row", "columnar"]:
+            s = Sheet(copy.deepcopy(self.data), layout=layout)
+            s.delete_rows([8, 1, 1, 3, -1, 20])
+            eq_(s.column[0], [0, 2, 4, 5, 6, 7])
+
+    def test_delete_columns(self):
+        for layout in ["row", "columnar"]:
+            s = Sheet(copy.deepcopy(self.data), layout=layout)
+            s.delete_columns([2, 0, 0, 5])
+            eq_(s.number_of_columns(), 1)
+            eq_(s.row[3], [30])
+
+    def test_remove_rows_where(self):
+        s = Sheet(self.data, name_rows_by_column=0)
+        s.row.remove_where(lambda index, row: row[0] % 20 == 0)
+        eq_(s.rownames, ["1", "3", "5", "7", "9"])
+        eq_(s.row["3"], [30, 300])
+
+    def test_remove_columns_where(self):
+        s = Sheet(self.data)
+        s.column.remove_where(lambda index, column: index == 1)
+        eq_(s.row[1], [1, 100])
+
+
+class TestColumnIndex:
+    def setUp(self):
+        self.data = [
+            ["sku", "qty"],
+            ["A1", 1],
+            ["B2", 2],
+            ["A1", 3]
+        ]
+
+    def test_lookup_with_and_without_index(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        eq_(s.lookup("sku", "A1"), [["A1", 1], ["A1", 3]])
+        s.create_index("sku")
+        eq_(s.lookup("sku", "A1"), [["A1", 1], ["A1", 3]])
+        eq_(s.lookup("sku", "Z9"), [])
+
+    def test_index_follows_changes(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.create_index("sku")
+        s.row += [["C3", 4]]
+        s[0, "sku"] = "D4"
+        s.row[1] = ["A1", 5]
+        eq_(s.lookup("sku", "A1"), [["A1", 5], ["A1", 3]])
+        eq_(s.lookup("sku", "D4"), [["D4", 1]])
+        del s.row[0]
+        eq_(s.lookup("sku", "C3"), [["C3", 4]])
+        s.column.format("sku", lambda value: value.lower())
+        eq_(s.lookup("sku", "c3"), [["c3", 4]])
+
+    @raises(ValueError)
+    def test_unique_index_on_duplicates(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.create_index("sku", unique=True)
+
+    def test_unique_index_rejects_changes(self):
+        s = Sheet(self.data[:3], name_columns_by_row=0)
+        s.create_index("sku", unique=True)
+        try:
+            s.row += [["B2", 9]]
+            assert False, "ValueError is expected"
+        except ValueError:
+            pass
+        eq_(s.number_of_rows(), 2)
+        s[0, "sku"] = "A1"
+        eq_(s.lookup("sku", "A1"), [["A1", 1]])
+
+    def test_delete_and_select_by_value(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.create_index("sku")
+        del s.row[{"sku": "A1", "qty": 3}]
+        eq_(s.column["qty"], [1, 2])
+        s.row.select({"sku": "B2"})
+        eq_(s.to_array(), [["sku", "qty"], ["B2", 2]])
+
+    def test_index_of_deleted_column(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.create_index("sku")
+        del s.column["sku"]
+        eq_(s.lookup("qty", 2), [[2]])
+
+    def test_index_serves_name_and_position(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.create_index("sku")
+        assert s._get_index(0) is s._get_index("sku")
+        eq_(s.lookup(0, "B2"), [["B2", 2]])
+        s.drop_index(0)
+        eq_(s._get_index("sku"), None)
+
+    def test_index_moves_with_its_column(self):
+        s = Sheet([["id", "sku"], [1, "A1"], [2, "B2"]],
+                  name_columns_by_row=0)
+        s.create_index(1)
+        del s.column["id"]
+        assert s._get_index("sku") is not None
+        eq_(s.lookup(0, "B2"), [["B2"]])
+
+
+class TestSort:
+    def setUp(self):
+        self.data = [
+            ["", "region", "amount"],
+            ["r1", "south", 3],
+            ["r2", "north", ""],
+            ["r3", "south", 1.5],
+            ["r4", "north", "n/a"],
+            ["r5", "north", 2]
+        ]
+
+    def test_multiple_keys_keep_row_names(self):
+        for layout in ["row", "columnar"]:
+            s = Sheet(copy.deepcopy(self.data), name_columns_by_row=0,
+                      name_rows_by_column=0, layout=layout)
+            s.sort(by=["region", "amount"])
+            eq_(s.rownames, ["r5", "r4", "r2", "r3", "r1"])
+            eq_(s.row["r3"], ["south", 1.5])
+
+    def test_reverse_keeps_empty_cells_last(self):
+        s = Sheet(self.data, name_columns_by_row=0, name_rows_by_column=0)
+        s.sort(by="amount", reverse=True)
+        eq_(s.column["amount"], ["n/a", 3, 2, 1.5, ""])
+
+    def test_key_and_directions(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.sort(by=["region", ""], reverse=[True, False],
+               key=lambda value: value.upper() if value else value)
+        eq_(s.column[""], ["r1", "r3", "r2", "r4", "r5"])
+
+    @raises(ValueError)
+    def test_mismatched_directions(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.sort(by=["region"], reverse=[True, False])
+
+    def test_index_is_rebuilt(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.create_index("region")
+        s.sort(by="amount")
+        eq_(s.lookup("region", "south"), [["r3", "south", 1.5],
+                                          ["r1", "south", 3]])
+
+
+class TestGroupBy:
+    def setUp(self):
+        self.data = [
+            ["region", "shop", "amount"],
+            ["north", "a", 10],
+            ["south", "b", ""],
+            ["north", "c", 20],
+            ["south", "d", 4],
+            ["north", "a", 30]
+        ]
+
+    def test_reducers(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        result = s.group_by("region").aggregate(OrderedDict([
+            ("amount", ["sum", "count", "min", "max", "mean"]),
+            ("shop", ["first", "last", len])
+        ]))
+        eq_(result.colnames, [
+            "region", "amount_sum", "amount_count", "amount_min",
+            "amount_max", "amount_mean", "shop_first", "shop_last",
+            "shop_len"])
+        eq_(result.row[0], ["north", 60, 3, 10, 30, 20.0, "a", "a", 3])
+        eq_(result.row[1], ["south", 4, 1, 4, 4, 4.0, "b", "d", 2])
+
+    def test_several_keys_by_index(self):
+        s = Sheet(self.data, name_columns_by_row=0, layout="columnar")
+        result = s.group_by([0, 1]).aggregate({2: "sum"})
+        eq_(result.to_array(), [
+            ["region", "shop", "amount"],
+            ["north", "a", 40],
+            ["south", "b", 0],
+            ["north", "c", 20],
+            ["south", "d", 4]
+        ])
+
+    def test_empty_group_values(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.row.select({"region": "south"})
+        s[1, "amount"] = ""
+        result = s.group_by("region").aggregate(
+            {"amount": ["min", "mean", "first"]})
+        eq_(result.row[0], ["south", "", "", ""])
+
+    @raises(ValueError)
+    def test_unknown_reducer(self):
+        s = Sheet(self.data, name_columns_by_row=0)
+        s.group_by("region").aggregate({"amount": "median"})
+
+
+class TestJoin:
+    def setUp(self):
+        self.orders = Sheet([
+            ["id", "name", "qty"],
+            [1, "first", 5],
+            [2, "second", 6],
+            ["", "blank", 7],
+            [1, "third", 8]
+        ], name_columns_by_row=0)
+        self.items = Sheet([
+            ["id", "name"],
+            [1, "pen"],
+            [3, "ink"],
+            ["", "none"]
+        ], name_columns_by_row=0)
+
+    def test_inner(self):
+        result = self.orders.join(self.items, on="id")
+        eq_(result.colnames, ["id", "name", "qty", "name-1"])
+        eq_(result.to_array()[1:], [
+            [1, "first", 5, "pen"],
+            [1, "third", 8, "pen"]
+        ])
+
+    def test_left_from_either_side(self):
+        expected = [
+            [1, "first", 5, "pen"],
+            [2, "second", 6, ""],
+            ["", "blank", 7, ""],
+            [1, "third", 8, "pen"]
+        ]
+        result = self.orders.join(self.items, on="id", how="left")
+        eq_(result.to_array()[1:], expected)
+        self.items.extend_rows([[4, "a"], [5, "b"], [6, "c"]])
+        result = self.orders.join(self.items, on="id", how="left")
+        eq_(result.to_array()[1:], expected)
+
+    def test_outer(self):
+        result = self.items.join(self.orders, on=["id"], how="outer")
+        eq_(result.colnames, ["id", "name", "name-1", "qty"])
+        eq_(result.to_array()[1:], [
+            [1, "pen", "first", 5],
+            [1, "pen", "third", 8],
+            [3, "ink", "", ""],
+            ["", "none", "", ""],
+            [2, "", "second", 6],
+            ["", "", "blank", 7]
+        ])
+
+    @raises(ValueError)
+    def test_unknown_join(self):
+        self.orders.join(self.items, on="id", how="cross")
@@ -1,7 +1,9 @@
 import os
+import shutil
+import tempfile
 import pyexcel as pe
 from db import Session, Base, Signature, Signature2, engine
-from _compact import OrderedDict
+from _compact import OrderedDict, StringIO
 from nose.tools import raises, eq_
 
 
@@ -228,6 +230,15 @@ class TestiGetArray:
         result = pe.iget_array(records=records)
         eq_(list(result), self.test_data)
 
+    def test_get_array_in_batches(self):
+        data = [[index] for index in range(5)]
+        result = pe.iget_array(array=data, batch_size=2)
+        eq_(list(result), [[[0], [1]], [[2], [3]], [[4]]])
+
+    @raises(ValueError)
+    def test_get_array_in_batches_of_zero(self):
+        pe.iget_array(array=self.test_data, batch_size=0)
+
 
 class TestGetDict:
     def test_get_dict_from_file(self):
@@ -445,6 +456,69 @@ class TestiGetRecords:
             {"X": 4, "Y": 5, "Z": 6}
         ])
 
+    def test_get_records_as_dict(self):
+        data = [
+            ["X", "Y", "Z"],
+            [1, 2, 3],
+            [4, 5]
+        ]
+        result = list(pe.iget_records(array=data, record_type='dict'))
+        eq_(type(result[0]), dict)
+        eq_(result, [
+            {"X": 1, "Y": 2, "Z": 3},
+            {"X": 4, "Y": 5, "Z": ''}
+        ])
+
+    def test_get_records_as_tuple(self):
+        data = [
+            ["X", "Y", "Z"],
+            [1, 2, 3],
+            [4, 5]
+        ]
+        result = pe.iget_records(array=data, record_type='tuple',
+                                 custom_headers=["Z", "X"])
+        eq_(list(result), [(3, 1), ('', 4)])
+
+    def test_get_records_as_namedtuple(self):
+        data = [
+            ["X", "Y", "a column"],
+            [1, 2, 3],
+            [4, 5, 6]
+        ]
+        result = list(pe.iget_records(array=data,
+                                      record_type='namedtuple'))
+        eq_(result[1].X, 4)
+        eq_(result[1].Y, 5)
+        eq_(result, [(1, 2, 3), (4, 5, 6)])
+
+    def test_get_records_with_one_custom_header(self):
+        data = [
+            ["X", "Y", "Z"],
+            [1, 2, 3]
+        ]
+        result = pe.iget_records(array=data, record_type='tuple',
+                                 custom_headers=["Y"])
+        eq_(list(result), [(2,)])
+
+    def test_get_records_in_batches(self):
+        data = [
+            ["X", "Y"],
+            [1, 2],
+            [3, 4],
+            [5, 6]
+        ]
+        result = pe.iget_records(array=data, record_type='tuple',
+                                 batch_size=2)
+        eq_(list(result), [[(1, 2), (3, 4)], [(5, 6)]])
+
+    @raises(ValueError)
+    def test_get_records_of_unknown_type(self):
+        data = [
+            ["X", "Y", "Z"],
+            [1, 2, 3]
+        ]
+        list(pe.iget_records(array=data, record_type='set'))
+
 
 class TestSavingToDatabase:
     def setUp(self):
@@ -972,6 +1046,419 @@ class TestiSaveAs:
         os.unlink(testfile2)
 
 
+def test_isort_as():
+    data = [['id', 'name'], [3, 'c'], [1, 'a'], [2, 'b']]
+    io = pe.isort_as(array=data, by=['id'], name_columns_by_row=0,
+                     run_size=1, dest_file_type='csv',
+                     dest_lineterminator='\n')
+    eq_(io.getvalue(), 'id,name\n1,a\n2,b\n3,c\n')
+    pe.free_resources()
+
+
+class TestiSavePartitioned:
+    def setUp(self):
+        self.dest_dir = tempfile.mkdtemp()
+        self.data = [['country', 'amount'], ['FR', 1], ['DE', 2],
+                     ['FR', 3], ['', 4], ['a/b', 5]]
+
+    def tearDown(self):
+        pe.free_resources()
+        shutil.rmtree(self.dest_dir)
+
+    def _read(self, file_name):
+        return pe.get_array(file_name=os.path.join(self.dest_dir,
+                                                   file_name))
+
+    def test_partition_by_column(self):
+        files = pe.isave_partitioned(array=self.data, partition_by='country',
+                                     name_columns_by_row=0,
+                                     dest_dir=self.dest_dir)
+        eq_(len(files), 4)
+        eq_(self._read('country=FR/part-00000.csv'),
+            [['country', 'amount'], ['FR', 1], ['FR', 3]])
+        eq_(self._read('country=__HIVE_DEFAULT_PARTITION__/part-00000.csv'),
+            [['country', 'amount'], ['', 4]])
+        eq_(self._read('country=a%2Fb/part-00000.csv'),
+            [['country', 'amount'], ['a/b', 5]])
+
+    def test_partition_by_row_count(self):
+        files = pe.isave_partitioned(array=self.data[1:], max_rows=2,
+                                     dest_dir=self.dest_dir,
+                                     dest_file_type='xls')
+        eq_([os.path.basename(name) for name in files],
+            ['part-00000.xls', 'part-00001.xls', 'part-00002.xls'])
+        eq_(self._read('part-00002.xls'), [['a/b', 5]])
+
+    def test_least_recently_used_file_is_closed(self):
+        files = pe.isave_partitioned(array=self.data, partition_by=0,
+                                     name_columns_by_row=0,
+                                     max_open_files=1,
+                                     dest_dir=self.dest_dir)
+        eq_(len(files), 4)
+        eq_(self._read('country=FR/part-00000.csv'),
+            [['country', 'amount'], ['FR', 1], ['FR', 3]])
+
+    def test_interleaved_partitions_append(self):
+        data = [[index % 3, index] for index in range(30)]
+        files = pe.isave_partitioned(array=data, partition_by=0, max_rows=4,
+                                     max_open_files=2,
+                                     dest_dir=self.dest_dir,
+                                     dest_file_type='tsv')
+        eq_(len(files), 9)
+        eq_(self._read('0=1/part-00000.tsv'), [[1, 1], [1, 4], [1, 7],
+                                               [1, 10]])
+        eq_(self._read('0=1/part-00002.tsv'), [[1, 25], [1, 28]])
+
+    def test_closed_file_not_appendable(self):
+        files = pe.isave_partitioned(array=self.data[1:], partition_by=0,
+                                     max_open_files=1,
+                                     dest_dir=self.dest_dir,
+                                     dest_file_type='xls')
+        eq_(len(files), 5)
+        eq_(self._read('0=FR/part-00000.xls'), [['FR', 1]])
+        eq_(self._read('0=FR/part-00001.xls'), [['FR', 3]])
+
+    @raises(ValueError)
+    def test_no_partition(self):
+        pe.isave_partitioned(array=self.data, dest_dir=self.dest_dir)
+
+
+class TestiSaveMany:
+    def setUp(self):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        self.data = [['X', 'Y', 'Z'], [1, 2, 3], [4, 5, 6]]
+        self.test_file = 'test_isave_many.xls'
+
+    def tearDown(self):
+        pe.free_resources()
+        if os.path.exists(self.test_file):
+            os.unlink(self.test_file)
+
+    def test_one_read_many_writes(self):
+        session = Session()
+        results = pe.isave_many(
+            array=self.data,
+            destinations=[
+                {'session': session, 'table': Signature},
+                {'file_name': self.test_file},
+                {'file_type': 'csv', 'lineterminator': '\n'}])
+        eq_(results[2].getvalue(), 'X,Y,Z\n1,2,3\n4,5,6\n')
+        eq_(pe.get_array(file_name=self.test_file), self.data)
+        eq_(pe.get_array(session=session, table=Signature), self.data)
+
+    def test_destination_failing_before_it_reads(self):
+        data = [[index] for index in range(100)]
+        for destinations in [[{'file_type': 'csv'},
+                              {'file_name': 'x.nosuchtype'}],
+                             [{'file_name': 'x.nosuchtype'},
+                              {'file_type': 'csv'}]]:
+            try:
+                pe.isave_many(array=data, destinations=destinations,
+                              buffer_size=10)
+                assert False, "the error should reach the caller"
+            except pe.exceptions.FileTypeNotSupported:
+                pass
+
+    def test_healthy_destinations_finish(self):
+        from pyexcel.internal.generators import SheetStream
+        from pyexcel.internal.tee import save_to_many
+        data = [[index] for index in range(100)]
+        healthy = StringIO()
+        try:
+            save_to_many(SheetStream('test', iter(data)),
+                         [{'file_type': 'csv', 'file_stream': healthy,
+                           'lineterminator': '\n'},
+                          {'file_name': 'x.nosuchtype'}],
+                         buffer_size=10)
+        except pe.exceptions.FileTypeNotSupported:
+            pass
+        eq_(healthy.getvalue(),
+            ''.join(['%d\n' % index for index in range(100)]))
+
+    @raises(ValueError)
+    def test_no_destination(self):
+        pe.isave_many(array=self.data)
+
+    def test_many_rows(self):
+        data = [[index, index * 2] for index in range(3000)]
+        results = pe.isave_many(
+            array=data, buffer_size=7,
+            destinations=[{'file_type': 'csv'}, {'file_type': 'tsv'}])
+        eq_(pe.get_array(file_type='csv',
+                         file_content=results[0].getvalue()), data)
+        eq_(pe.get_array(file_type='tsv',
+                         file_content=results[1].getvalue()), data)
+
+    @raises(ZeroDivisionError)
+    def test_error_in_a_destination(self):
+        def broken():
+            yield [1]
+            yield [1 / 0]
+        pe.isave_many(
+            array=broken(),
+            destinations=[{'file_type': 'csv'}, {'file_type': 'csv'}])
+
+
+class TestProgress:
+    def setUp(self):
+        self.reports = []
+        self.data = [['X', 'Y'], [1, 2], [3, 4], [5, 6], [7, 8]]
+
+    def tearDown(self):
+        pe.free_resources()
+
+    def test_iget_array(self):
+        rows = pe.iget_array(array=self.data, progress=self.reports.append,
+                             progress_interval=2)
+        eq_(list(rows), self.data)
+        eq_([report.rows for report in self.reports], [2, 4, 5])
+        eq_([report.finished for report in self.reports],
+            [False, False, True])
+        assert self.reports[-1].rows_per_second >= 0
+
+    def test_exact_multiple_of_the_interval(self):
+        rows = pe.iget_array(array=self.data[:4],
+                             progress=self.reports.append,
+                             progress_interval=2)
+        eq_(list(rows), self.data[:4])
+        eq_([(report.rows, report.finished) for report in self.reports],
+            [(2, False), (4, True)])
+
+    def test_book_with_a_sheet_ending_on_the_interval(self):
+        pe.isave_book_as(bookdict={'a': self.data[:4], 'b': self.data[:4]},
+                         dest_file_type='xls', progress=self.reports.append,
+                         progress_interval=4)
+        eq_([(report.sheet_name, report.rows, report.finished)
+             for report in self.reports],
+            [('a', 4, False), ('b', 8, True)])
+
+    @raises(ValueError)
+    def test_zero_interval(self):
+        pe.iget_array(array=self.data, progress=self.reports.append,
+                      progress_interval=0)
+
+    @raises(ValueError)
+    def test_negative_interval(self):
+        pe.isave_as(array=self.data, dest_file_type='csv',
+                    progress=self.reports.append, progress_interval=-5)
+
+    def test_iget_records(self):
+        records = pe.iget_records(array=self.data, batch_size=3,
+                                  progress=self.reports.append,
+                                  progress_interval=3)
+        eq_(len(list(records)), 2)
+        eq_([report.rows for report in self.reports], [3, 5])
+
+    def test_isave_as_from_a_stream(self):
+        content = '\n'.join(['%d,%d' % (index, index) for index in range(9)])
+        io = StringIO(content)
+        pe.isave_as(file_type='csv', file_stream=io, dest_file_type='csv',
+                    progress=self.reports.append, progress_interval=4)
+        eq_([report.rows for report in self.reports], [4, 8, 9])
+        eq_(self.reports[-1].bytes_read, len(content))
+        eq_(self.reports[-1].total_bytes, None)
+
+    def test_isave_as_from_a_file(self):
+        test_file = 'test_progress.csv'
+        pe.save_as(array=self.data, dest_file_name=test_file)
+        pe.isave_as(file_name=test_file, dest_file_type='csv',
+                    progress=self.reports.append)
+        eq_(self.reports[-1].total_bytes, os.path.getsize(test_file))
+        eq_(self.reports[-1].bytes_read, None)
+        pe.free_resources()
+        os.unlink(test_file)
+
+    def test_isave_book_as(self):
+        pe.isave_book_as(bookdict={'a': self.data, 'b': self.data},
+                         dest_file_type='xls', progress=self.reports.append,
+                         progress_interval=4)
+        eq_([(report.sheet_name, report.rows, report.finished)
+             for report in self.reports],
+            [('a', 4, False), ('b', 8, False), ('b', 10, True)])
+
+
+class TestCheckpoint:
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.test_file = os.path.join(self.test_dir, 'resumed.csv')
+        self.checkpoint = os.path.join(self.test_dir, 'resumed.json')
+        self.data = [[index, 'row %d' % index] for index in range(12)]
+
+    def tearDown(self):
+        pe.free_resources()
+        shutil.rmtree(self.test_dir)
+
+    def _crash_at(self, position):
+        for index, row in enumerate(self.data):
+            if index == position:
+                raise ZeroDivisionError()
+            yield row
+
+    @raises(ZeroDivisionError)
+    def test_crash_leaves_a_checkpoint(self):
+        pe.isave_as(array=self._crash_at(8), dest_file_name=self.test_file,
+                    checkpoint=self.checkpoint, checkpoint_interval=3)
+
+    def test_resume(self):
+        try:
+            self.test_crash_leaves_a_checkpoint()
+        except ZeroDivisionError:
+            pass
+        assert os.path.exists(self.checkpoint)
+        pe.isave_as(array=self.data, dest_file_name=self.test_file,
+                    checkpoint=self.checkpoint, checkpoint_interval=3)
+        assert not os.path.exists(self.checkpoint)
+        eq_(pe.get_array(file_name=self.test_file), self.data)
+
+    def test_resume_skips_rows_of_the_source(self):
+        source = os.path.join(self.test_dir, 'source.csv')
+        pe.save_as(array=self.data, dest_file_name=source)
+        try:
+            self.test_crash_leaves_a_checkpoint()
+        except ZeroDivisionError:
+            pass
+        pe.isave_as(file_name=source, start_row=0, row_limit=10,
+                    dest_file_name=self.test_file,
+                    checkpoint=self.checkpoint, checkpoint_interval=3)
+        eq_(pe.get_array(file_name=self.test_file), self.data[:10])
+
+    def test_no_crash(self):
+        result = pe.isave_as(array=self.data, dest_file_name=self.test_file,
+                             checkpoint=self.checkpoint,
+                             checkpoint_interval=5)
+        eq_(result, pe.isave_as(array=self.data,
+                                dest_file_name=self.test_file))
+        assert not os.path.exists(self.checkpoint)
+        eq_(pe.get_array(file_name=self.test_file), self.data)
+
+    @raises(ValueError)
+    def test_not_appendable(self):
+        pe.isave_as(array=self.data, dest_file_type='xls',
+                    checkpoint=self.checkpoint)
+
+    @raises(ValueError)
+    def test_skip_empty_rows(self):
+        pe.isave_as(array=self.data, dest_file_name=self.test_file,
+                    skip_empty_rows=True, checkpoint=self.checkpoint)
+
+    @raises(ValueError)
+    def test_checkpoint_of_another_file(self):
+        try:
+            self.test_crash_leaves_a_checkpoint()
+        except ZeroDivisionError:
+            pass
+        pe.isave_as(array=self.data,
+                    dest_file_name=os.path.join(self.test_dir, 'other.csv'),
+                    checkpoint=self.checkpoint)
+
+
+class TestLazyBook:
+    def setUp(self):
+        self.test_file = "test_lazy_book.xlsx"
+        self.content = _produce_ordered_dict()
+        pe.save_book_as(bookdict=self.content,
+                        dest_file_name=self.test_file)
+
+    def tearDown(self):
+        pe.free_resources()
+        os.unlink(self.test_file)
+
+    def test_sheets_are_read_on_access(self):
+        book = pe.get_book(file_name=self.test_file, lazy=True)
+        eq_(book.sheet_names(), ['Sheet1', 'Sheet2', 'Sheet3'])
+        eq_(book.number_of_sheets(), 3)
+        assert not book.is_loaded('Sheet1')
+        eq_(book['Sheet3'].to_array(), self.content['Sheet3'])
+        eq_([book.is_loaded(name) for name in book.sheet_names()],
+            [False, False, True])
+        eq_(book[1].to_array(), self.content['Sheet2'])
+        assert book['Sheet3'] is book['Sheet3']
+
+    def test_attribute(self):
+        book = pe.get_book(file_name=self.test_file, lazy=True)
+        eq_(book.Sheet2.to_array(), self.content['Sheet2'])
+        assert book.is_loaded('Sheet2')
+
+    @raises(AttributeError)
+    def test_unknown_attribute(self):
+        book = pe.get_book(file_name=self.test_file, lazy=True)
+        book.Sheet4
+
+    def test_iteration_and_save(self):
+        book = pe.get_book(file_name=self.test_file, lazy=True)
+        eq_([sheet.name for sheet in book], book.sheet_names())
+        io = book.save_to_memory('xls')
+        eq_(pe.get_book_dict(file_content=io.getvalue(), file_type='xls'),
+            self.content)
+
+    def test_same_as_eager(self):
+        book = pe.get_book(file_name=self.test_file, lazy=True)
+        eq_(book.to_dict(), pe.get_book(file_name=self.test_file).to_dict())
+
+
+class TestGetBookFromFiles:
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.files = []
+        for index in range(5):
+            file_name = os.path.join(self.test_dir, 'month%d.csv' % index)
+            pe.save_as(array=[[index, index * 2]], dest_file_name=file_name)
+            self.files.append(file_name)
+        self.test_book = os.path.join(self.test_dir, 'book.xls')
+        pe.save_book_as(bookdict=_produce_ordered_dict(),
+                        dest_file_name=self.test_book)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_glob_in_sorted_order(self):
+        book = pe.get_book_from_files(
+            os.path.join(self.test_dir, 'month*.csv'), workers=2)
+        eq_(book.sheet_names(),
+            ['month%d.csv' % index for index in range(5)])
+        eq_([sheet.to_array() for sheet in book],
+            [[[index, index * 2]] for index in range(5)])
+
+    def test_list_with_many_sheets(self):
+        book = pe.get_book_from_files(
+            [self.files[1], self.test_book, self.files[0]], workers=3)
+        eq_(book.sheet_names(),
+            ['month1.csv', 'Sheet1', 'Sheet2', 'Sheet3', 'month0.csv'])
+        eq_(book['Sheet2'].to_array(), [[4, 4, 4, 4], [5, 5, 5, 5],
+                                        [6, 6, 6, 6]])
+
+    def test_same_file_twice(self):
+        book = pe.get_book_from_files([self.files[0], self.files[0]],
+                                      workers=1)
+        eq_(book.number_of_sheets(), 2)
+        assert book.sheet_names()[1].startswith('month0.csv_')
+
+    def test_process_executor(self):
+        book = pe.get_book_from_files(self.files, workers=2,
+                                      executor='process')
+        eq_(book['month4.csv'].to_array(), [[4, 8]])
+
+    @raises(ValueError)
+    def test_unknown_executor(self):
+        pe.get_book_from_files(self.files, executor='fiber')
+
+    def test_book_queue_takes_by_position(self):
+        from pyexcel.internal.parallel import BookQueue
+        books = BookQueue(iter([('a', OrderedDict([('x', [[1]])])),
+                                ('b', OrderedDict([('y', [[2]]),
+                                                   ('z', [[3]])]))]))
+        eq_(books.take(1, 'z'), [[3]])
+        eq_(books.take(0), [[1]])
+        eq_(books.take(1), [[2]])
+
+    @raises(ValueError)
+    def test_book_queue_empty_book(self):
+        from pyexcel.internal.parallel import BookQueue
+        books = BookQueue(iter([('a', OrderedDict())]))
+        books.take(0)
+
+
 def _produce_ordered_dict():
     data_dict = OrderedDict()
     data_dict.update({